@@ -0,0 +1,436 @@
+"""
+fakeNuke - in-process stand-in for the parts of the nuke API labelConnector uses.
+
+Only meant for benchmarking outside of a licensed Nuke session. It keeps the node graph in plain Python objects
+and mimics the behaviour labelConnector relies on (names, knobs, inputs, selection, Groups, undo),
+nothing gets rendered or evaluated.
+
+USAGE
+
+import sys
+import fakeNuke
+sys.modules["nuke"] = fakeNuke
+
+import labelConnector
+
+"""
+
+NUKE_VERSION_MAJOR = 16
+INPUTS = 1
+HIDDEN_INPUTS = 2
+EXPRESSIONS = 4
+INVISIBLE = 0x400
+
+# classes that can't take any inputs, like in Nuke they have no "hide_input" knob
+NO_INPUT_CLASSES = ["Read", "Constant", "BackdropNode", "Camera3", "Viewer"]
+
+_root = None
+_context = None
+
+
+class Undo:
+    """Only counts the undo events, nothing can be undone."""
+
+    events = 0
+    _depth = 0
+
+    def begin(self, name=""):
+        if Undo._depth == 0:
+            Undo.events += 1
+        Undo._depth += 1
+
+    def end(self):
+        Undo._depth = max(0, Undo._depth - 1)
+
+    @staticmethod
+    def disable():
+        pass
+
+    @staticmethod
+    def enable():
+        pass
+
+
+class Knob:
+    def __init__(self, name, label="", value=""):
+        self._name = name
+        self._label = label
+        self._value = value
+        self._visible = True
+        self._command = ""
+
+    def name(self):
+        return self._name
+
+    def value(self):
+        return self._value
+
+    getValue = value
+
+    def setValue(self, value):
+        self._value = value
+        _root._modified = True
+        return True
+
+    def setVisible(self, visible):
+        self._visible = visible
+
+    def setFlag(self, flag):
+        pass
+
+    def setCommand(self, command):
+        self._command = command
+
+
+class Tab_Knob(Knob):
+    pass
+
+
+class String_Knob(Knob):
+    pass
+
+
+class Multiline_Eval_String_Knob(Knob):
+    pass
+
+
+class PyScript_Knob(Knob):
+    pass
+
+
+class Node:
+    def __init__(self, nodeClass, parent=None, **knobs):
+        self._class = nodeClass
+        self._parent = parent
+        self._alive = True
+        self._selected = False
+        self._inputs = {}
+        self._dependents = {}  # dependent node -> number of inputs it takes from this node
+
+        self._knobs = {
+            "name": Knob("name"),
+            "label": Knob("label"),
+            "tile_color": Knob("tile_color", value=0),
+            "note_font": Knob("note_font", value="Verdana"),
+            "xpos": Knob("xpos", value=0),
+            "ypos": Knob("ypos", value=0),
+        }
+        if nodeClass not in NO_INPUT_CLASSES:
+            self._knobs["hide_input"] = Knob("hide_input", value=False)
+
+        self._name = None
+        if parent is not None:
+            self.setName(knobs.pop("name", nodeClass))
+
+        for knob, value in knobs.items():
+            if knob in self._knobs:
+                self._knobs[knob]._value = value
+
+    def _check(self):
+        if not self._alive:
+            raise ValueError("A PythonObject is not attached to a node")
+
+    def Class(self):
+        self._check()
+        return self._class
+
+    def name(self):
+        self._check()
+        return self._name
+
+    def fullName(self):
+        self._check()
+        if self._parent is None or self._parent is _root:
+            return self._name
+        return self._parent.fullName() + "." + self._name
+
+    def setName(self, name, uncollide=True):
+        """Like Nuke, names ending in a letter or colliding with a sibling get a number appended."""
+
+        self._check()
+        siblings = self._parent._names
+
+        if name in siblings or not name[-1:].isdigit():
+            base = name.rstrip("0123456789") if name[-1:].isdigit() else name
+            counter = self._parent._counters.get(base, 0) + 1
+            while base + str(counter) in siblings:
+                counter += 1
+            self._parent._counters[base] = counter
+            name = base + str(counter)
+
+        if self._name is not None:
+            del siblings[self._name]
+
+        self._name = name
+        self._knobs["name"]._value = name
+        siblings[name] = self
+        _root._modified = True
+
+    def knob(self, name):
+        self._check()
+        return self._knobs.get(name)
+
+    def __getitem__(self, name):
+        return self._knobs[name]
+
+    def knobs(self):
+        self._check()
+        return dict(self._knobs)
+
+    def addKnob(self, knob):
+        self._knobs[knob.name()] = knob
+
+    def input(self, index):
+        self._check()
+        return self._inputs.get(index)
+
+    def inputs(self):
+        return max(self._inputs) + 1 if self._inputs else 0
+
+    def setInput(self, index, node):
+        self._check()
+        if "hide_input" not in self._knobs:
+            return False
+        if node is not None and node._parent is not self._parent:
+            return False  # Nuke refuses connections across Groups
+
+        previous = self._inputs.pop(index, None)
+        if previous is not None:
+            previous._dependents[self] -= 1
+            if not previous._dependents[self]:
+                del previous._dependents[self]
+
+        if node is not None:
+            self._inputs[index] = node
+            node._dependents[self] = node._dependents.get(self, 0) + 1
+
+        _root._modified = True
+        return True
+
+    def dependent(self, what=INPUTS | HIDDEN_INPUTS, forceEvaluate=True):
+        self._check()
+        return [node for node in self._dependents if node._alive]
+
+    def xpos(self):
+        return self._knobs["xpos"].value()
+
+    def ypos(self):
+        return self._knobs["ypos"].value()
+
+    def setXpos(self, x):
+        self._knobs["xpos"].setValue(x)
+
+    def setYpos(self, y):
+        self._knobs["ypos"].setValue(y)
+
+    def setXYpos(self, x, y):
+        self.setXpos(x)
+        self.setYpos(y)
+
+    def screenWidth(self):
+        return 80
+
+    def screenHeight(self):
+        return 18
+
+    def setSelected(self, selected):
+        self._selected = selected
+
+    def isSelected(self):
+        return self._selected
+
+
+class Group(Node):
+    def __init__(self, nodeClass="Group", parent=None, **knobs):
+        self._children = []
+        self._names = {}  # name -> node, for fast lookups and uncolliding
+        self._counters = {}
+        self._previous = []
+        Node.__init__(self, nodeClass, parent, **knobs)
+
+    def nodes(self):
+        return [node for node in self._children if node._alive]
+
+    def begin(self):
+        global _context
+        self._previous.append(_context)
+        _context = self
+
+    def end(self):
+        global _context
+        _context = self._previous.pop()
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, *args):
+        self.end()
+
+
+class Root(Group):
+    def __init__(self):
+        Group.__init__(self, "Root")
+        self._name = "root"
+        self._modified = False
+
+    def modified(self):
+        return self._modified
+
+    def setModified(self, modified):
+        self._modified = modified
+
+    def fullName(self):
+        return "root"
+
+
+def reset():
+    """Starts over with an empty script."""
+
+    global _root, _context
+
+    _root = Root()
+    _context = _root
+    Undo.events = 0
+    Undo._depth = 0
+
+
+def _addNode(nodeClass, **knobs):
+    node = (Group if nodeClass in ["Group", "Gizmo"] else Node)(nodeClass, _context, **knobs)
+    _context._children.append(node)
+    return node
+
+
+def root():
+    return _root
+
+
+def thisGroup():
+    return _context
+
+
+def thisNode():
+    return None
+
+
+def allNodes(filter=None, group=None, recurseGroups=False):
+    nodes = []
+    for node in (group or _context).nodes():
+        if filter is None or node._class == filter:
+            nodes.append(node)
+        if recurseGroups and isinstance(node, Group):
+            nodes.extend(allNodes(filter, node, True))
+    return nodes
+
+
+def toNode(name):
+    group = _context
+    parts = name.split(".")
+    if parts[0] == "root":
+        group = _root
+        parts = parts[1:]
+
+    node = None
+    for part in parts:
+        if not isinstance(group, Group):
+            return None
+        node = group._names.get(part)
+        if node is None or not node._alive:
+            return None
+        group = node
+
+    return node
+
+
+def selectedNodes(filter=None):
+    return [node for node in allNodes(filter) if node._selected]
+
+
+def selectedNode():
+    selected = selectedNodes()
+    if not selected:
+        raise ValueError("no node selected")
+    return selected[-1]
+
+
+def createNode(nodeClass, knobs="", inpanel=True):
+    """Like Nuke, the new node gets connected to and placed below the selection, which it replaces."""
+
+    selected = selectedNodes()
+    node = _addNode(nodeClass)
+
+    if selected:
+        node.setXYpos(selected[-1].xpos(), selected[-1].ypos() + 50)
+        node.setInput(0, selected[-1])
+
+    for other in selected:
+        other.setSelected(False)
+    node.setSelected(True)
+
+    return node
+
+
+class _Nodes:
+    """nuke.nodes.Class(**knobs), creates nodes without connecting or selecting them."""
+
+    def __getattr__(self, nodeClass):
+        return lambda **knobs: _addNode(nodeClass, **knobs)
+
+
+nodes = _Nodes()
+
+
+def delete(node):
+    node._check()
+    for index in list(node._inputs):
+        node.setInput(index, None)
+    for dependent in list(node._dependents):
+        for index, input in list(dependent._inputs.items()):
+            if input is node:
+                dependent.setInput(index, None)
+    node._alive = False
+    node._parent._children.remove(node)
+    del node._parent._names[node._name]
+
+
+def defaultNodeColor(nodeClass):
+    return 0
+
+
+def activeViewer():
+    return None
+
+
+def zoomToFitSelected():
+    pass
+
+
+def center():
+    return [0.0, 0.0]
+
+
+def frame():
+    return 1
+
+
+def message(text):
+    pass
+
+
+def tprint(*args):
+    print(*args)
+
+
+def addOnScriptLoad(function, args=(), kwargs=None, nodeClass="Root"):
+    pass
+
+
+def addOnScriptSave(function, args=(), kwargs=None, nodeClass="Root"):
+    pass
+
+
+def addOnScriptClose(function, args=(), kwargs=None, nodeClass="Root"):
+    pass
+
+
+reset()
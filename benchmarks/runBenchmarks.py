@@ -0,0 +1,282 @@
+"""
+runBenchmarks - times the hot paths of labelConnector on synthetic scripts, outside of Nuke.
+
+Nuke gets replaced by fakeNuke, PySide6 is still needed as labelConnector builds real widgets.
+Results are written as JSON, so runs before and after a change can be compared.
+
+USAGE
+
+python benchmarks/runBenchmarks.py
+python benchmarks/runBenchmarks.py --sizes 1000:100 10000:1000 --repeat 5 --output results.json
+
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCHMARK_DIR)
+sys.path.insert(1, os.path.dirname(BENCHMARK_DIR))
+
+import fakeNuke  # noqa: E402
+
+sys.modules["nuke"] = fakeNuke
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import labelConnector  # noqa: E402
+import syntheticScripts  # noqa: E402
+from labelConnector import QtGuiWidgets  # noqa: E402
+
+
+QUERY = "PLATE_CAM"  # typed one character at a time when benchmarking the search
+MULTIPLE_CONNECTORS = 40  # Connectors selected at once when benchmarking the creation of multiple Connected nodes
+
+
+def summarize(timings):
+    """
+    Args:
+        timings (list): durations in seconds
+
+    Returns:
+        dict: statistics in milliseconds
+    """
+
+    return {
+        "runs": len(timings),
+        "min_ms": min(timings) * 1000.0,
+        "median_ms": statistics.median(timings) * 1000.0,
+        "mean_ms": statistics.mean(timings) * 1000.0,
+        "max_ms": max(timings) * 1000.0,
+    }
+
+
+def measure(function, repeat, setup=None):
+    """
+    Times a function, the setup isn't part of the measurement.
+
+    Args:
+        function (callable): function to time
+        repeat (int): amount of runs
+        setup (callable, optional): called before each run. Defaults to None.
+
+    Returns:
+        dict: statistics in milliseconds
+    """
+
+    timings = []
+
+    for _ in range(repeat):
+        if setup:
+            setup()
+
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return summarize(timings)
+
+
+def benchmarkGetAllConnectors(script, repeat):
+    """getAllConnectors(), with a rebuilt index (cold) and with the cached one (warm)."""
+
+    cold = measure(labelConnector.getAllConnectors, repeat, setup=labelConnector.invalidateConnectorIndex)
+    warm = measure(labelConnector.getAllConnectors, repeat)
+
+    return {"cold": cold, "warm": warm}
+
+
+def benchmarkBulkReconnect(script, repeat):
+    """labelConnector() with all disconnected Connected nodes selected, reconnecting them in one go."""
+
+    if not script.disconnected:
+        return None
+
+    def setup():
+        syntheticScripts.disconnect(script.disconnected)
+        for node in fakeNuke.selectedNodes():
+            node.setSelected(False)
+        for node in script.disconnected:
+            node.setSelected(True)
+
+    result = measure(labelConnector.labelConnector, repeat, setup=setup)
+    result["nodes"] = len(script.disconnected)
+
+    for node in script.disconnected:
+        node.setSelected(False)
+
+    return result
+
+
+def benchmarkRename(script, repeat):
+    """makeConnector() renaming the Connector with the most Connected nodes, propagating the label to all of them."""
+
+    connector = script.busiestConnector()
+    labels = [connector["label"].value(), connector["label"].value() + "_RENAMED"]
+    runs = []
+
+    def rename():
+        old, new = labels[len(runs) % 2], labels[(len(runs) + 1) % 2]
+        runs.append(new)
+        labelConnector.makeConnector(connector, new, old)
+
+    result = measure(rename, repeat)
+    result["children"] = len(script.children[connector])
+
+    if len(runs) % 2:
+        labelConnector.makeConnector(connector, labels[0], labels[1])
+
+    return result
+
+
+def benchmarkCreateMultiple(script, repeat):
+    """createConnectedNodes() for MULTIPLE_CONNECTORS Connectors at once, like shift-selecting them in the UI."""
+
+    connectors = script.connectors[:MULTIPLE_CONNECTORS]
+    positions = [(connector.xpos(), connector.ypos() + 100) for connector in connectors]
+    created = []
+
+    def cleanup():
+        for node in created:
+            fakeNuke.delete(node)
+        created[:] = []
+
+    def create():
+        created.extend(labelConnector.createConnectedNodes(connectors, positions))
+
+    result = measure(create, repeat, setup=cleanup)
+    cleanup()
+
+    result["nodes"] = len(connectors)
+
+    return result
+
+
+def benchmarkSearch(script, repeat):
+    """updateSearchMatches() per keystroke in the default UI, typing QUERY character by character."""
+
+    start = time.perf_counter()
+    labelConnector._showDefaultUI(connectors=labelConnector.getAllConnectors())
+    openTime = time.perf_counter() - start
+
+    ui = labelConnector._defaultConnectorUI
+    timings = []
+
+    for _ in range(repeat):
+        for length in range(1, len(QUERY) + 1):
+            ui.input.blockSignals(True)
+            ui.input.setText(QUERY[:length])
+            ui.input.blockSignals(False)
+
+            start = time.perf_counter()
+            ui.updateSearchMatches()
+            ui.highlightButtonsMatchingResults()
+            timings.append(time.perf_counter() - start)
+
+    ui.close()
+    ui.deleteLater()
+    labelConnector._defaultConnectorUI = None
+    labelConnector._labelConnectorUI = None
+    QtGuiWidgets.QApplication.processEvents()
+
+    result = summarize(timings)
+    result["open_ms"] = openTime * 1000.0
+    result["query"] = QUERY
+
+    return result
+
+
+BENCHMARKS = {
+    "getAllConnectors": benchmarkGetAllConnectors,
+    "bulkReconnect": benchmarkBulkReconnect,
+    "rename": benchmarkRename,
+    "createMultiple": benchmarkCreateMultiple,
+    "search": benchmarkSearch,
+}
+
+
+def parseSize(text):
+    """"10000:1000" -> (10000, 1000)"""
+
+    nodes, _, connectors = text.partition(":")
+    return int(nodes), int(connectors)
+
+
+def runBenchmarks(sizes, repeat, benchmarks):
+    """
+    Builds a synthetic script per size and runs the given benchmarks on it.
+
+    Args:
+        sizes (list): (node count, Connector count) tuples
+        repeat (int): runs per benchmark
+        benchmarks (list): names of the benchmarks to run
+
+    Returns:
+        dict: environment and results, ready to be dumped as JSON
+    """
+
+    app = QtGuiWidgets.QApplication.instance() or QtGuiWidgets.QApplication(sys.argv[:1])
+
+    results = []
+
+    for nodeCount, connectorCount in sizes:
+        sys.stderr.write("building script with {} nodes, {} Connectors\n".format(nodeCount, connectorCount))
+
+        start = time.perf_counter()
+        script = syntheticScripts.buildScript(nodeCount, connectorCount)
+        buildTime = time.perf_counter() - start
+
+        labelConnector.invalidateConnectorIndex()
+        entry = {"script": script.toDict(), "build_ms": buildTime * 1000.0, "benchmarks": {}}
+
+        for name in benchmarks:
+            sys.stderr.write("  {}\n".format(name))
+            entry["benchmarks"][name] = BENCHMARKS[name](script, repeat)
+
+        results.append(entry)
+
+    app.processEvents()
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt": QtGuiWidgets.__name__.split(".")[0],
+            "labelConnector": labelConnector.__version__,
+        },
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks labelConnector on synthetic scripts, outside of Nuke.")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=parseSize,
+        default=syntheticScripts.DEFAULT_SIZES,
+        metavar="NODES:CONNECTORS",
+        help="script sizes to benchmark, defaults to 1000:100 10000:1000 100000:5000",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark, defaults to 5")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = runBenchmarks(args.sizes, args.repeat, args.benchmarks)
+
+    if args.output:
+        with open(args.output, "w") as jsonFile:
+            json.dump(report, jsonFile, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
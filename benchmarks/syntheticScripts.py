@@ -0,0 +1,128 @@
+"""
+syntheticScripts - builds large node graphs in fakeNuke, shaped like a comp that uses Connectors a lot.
+
+Each script contains chains of regular nodes, Connectors hanging off those chains and Connected nodes spread
+over all Connectors. A share of the Connected nodes gets disconnected, so there is something to reconnect.
+
+"""
+
+import random
+
+import fakeNuke
+
+
+REGULAR_CLASSES = ["Grade", "Blur", "Merge2", "Transform", "ColorCorrect", "Shuffle2"]
+CHAIN_LENGTH = 20  # regular nodes per chain, each chain starts with a Read
+CONNECTED_SHARE = 0.4  # share of the nodes that aren't Connectors which are Connected nodes
+DISCONNECTED_SHARE = 0.05  # share of the Connected nodes that lost their connection
+
+# node / Connector counts benchmarked by default
+DEFAULT_SIZES = [(1000, 100), (10000, 1000), (100000, 5000)]
+
+
+class SyntheticScript:
+    """Handles to the interesting nodes of a generated script."""
+
+    def __init__(self, nodeCount, connectorCount):
+        self.nodeCount = nodeCount
+        self.connectorCount = connectorCount
+        self.connectors = []
+        self.connected = []
+        self.disconnected = []
+        self.children = {}  # Connector -> list of Connected nodes
+
+    def busiestConnector(self):
+        """Returns the Connector with the most Connected nodes."""
+
+        return max(self.connectors, key=lambda connector: len(self.children[connector]))
+
+    def toDict(self):
+        return {
+            "nodes": self.nodeCount,
+            "connectors": self.connectorCount,
+            "connected": len(self.connected),
+            "disconnected": len(self.disconnected),
+        }
+
+
+def connectorLabel(number):
+    """Labels like real ones, a couple of words with shared prefixes, so searching has to rank them."""
+
+    words = ["PLATE", "CAM", "ALPHA", "MATTE", "BG", "FG", "CG", "FX", "ROTO", "DENOISE"]
+    return "{}_{}_{:04d}".format(words[number % len(words)], words[(number // len(words)) % len(words)], number)
+
+
+def buildScript(nodeCount, connectorCount, seed=0):
+    """
+    Resets fakeNuke and fills it with a synthetic script.
+
+    Args:
+        nodeCount (int): total amount of nodes
+        connectorCount (int): amount of Connectors, part of nodeCount
+        seed (int, optional): seed, the same arguments always build the same script. Defaults to 0.
+
+    Returns:
+        SyntheticScript: handles to Connectors and Connected nodes
+    """
+
+    if connectorCount > nodeCount:
+        raise ValueError("connectorCount can't be larger than nodeCount")
+
+    fakeNuke.reset()
+    rng = random.Random(seed)
+    script = SyntheticScript(nodeCount, connectorCount)
+
+    remaining = nodeCount - connectorCount
+    connectedCount = int(remaining * CONNECTED_SHARE)
+    regularCount = remaining - connectedCount
+
+    # chains of regular nodes
+    regular = []
+    previous = None
+    for number in range(regularCount):
+        if number % CHAIN_LENGTH == 0:
+            node = fakeNuke.nodes.Read(xpos=(number // CHAIN_LENGTH) * 150, ypos=0)
+        else:
+            node = getattr(fakeNuke.nodes, rng.choice(REGULAR_CLASSES))(xpos=previous.xpos(), ypos=previous.ypos() + 30)
+            node.setInput(0, previous)
+        regular.append(node)
+        previous = node
+
+    # Connectors hang off random regular nodes
+    for number in range(connectorCount):
+        connector = fakeNuke.nodes.NoOp(name="Connector", label=connectorLabel(number), note_font="Verdana Bold")
+        if regular:
+            connector.setInput(0, rng.choice(regular))
+        connector.addKnob(fakeNuke.Tab_Knob("connector", "Connector"))
+        connector.addKnob(fakeNuke.PyScript_Knob("selectChildren", "Select all Children"))
+        script.connectors.append(connector)
+        script.children[connector] = []
+
+    # Connected nodes, a few Connectors are used a lot, most only a couple of times
+    weights = [1.0 / (rank + 1) for rank in range(connectorCount)]
+    parents = rng.choices(script.connectors, weights=weights, k=connectedCount) if connectorCount else []
+
+    for connector in parents:
+        node = fakeNuke.nodes.Dot(name="Connected", label=connector["label"].value(), hide_input=True)
+        node.setInput(0, connector)
+
+        knob = fakeNuke.String_Knob("connectorName", "Connector Name")
+        knob.setValue(connector.name())
+        knob.setVisible(False)
+        node.addKnob(knob)
+
+        script.connected.append(node)
+        script.children[connector].append(node)
+
+    for node in rng.sample(script.connected, int(len(script.connected) * DISCONNECTED_SHARE)):
+        node.setInput(0, None)
+        script.disconnected.append(node)
+
+    return script
+
+
+def disconnect(nodes):
+    """Disconnects the given nodes again, e.g. after a reconnect has been benchmarked."""
+
+    for node in nodes:
+        node.setInput(0, None)
@@ -27,11 +27,81 @@ else:
     import PySide6.QtGui as QtGui
     import PySide6.QtWidgets as QtGuiWidgets
 
+import atexit
+import collections
+import functools
+import hashlib
+import json
 import logging
 import math
-import fnmatch
+import os
+import queue
+import subprocess
+import tempfile
 import textwrap
-
+import threading
+import time
+
+import labelConnectorCore
+# also re-exported, so existing code calling labelConnector.x keeps working.
+# Settings are only read from labelConnectorCore, change them there, e.g. via configure
+from labelConnectorCore import (
+    BUTTON_REGULAR_COLOR,
+    COLOR_LIST,
+    CONNECTOR_CLASSES,
+    CONNECTOR_DEFAULT_COLOR,
+    CONNECTED_KEY,
+    CONNECTOR_KEY,
+    UNDO,
+    UNDO_EVENT_TEXT,
+    AuditIssue,
+    AuditReport,
+    BatchEdit,
+    ConnectorIndex,
+    FuzzyMatcher,
+    IncrementalSearch,
+    addConnectingNodeButtons,
+    addConnectorNodeButtons,
+    auditConnections,
+    buildChildIndex,
+    clearColorCache,
+    colorizeConnectors,
+    configure,
+    connectNodeToDot,
+    createConnectedNodes,
+    createConnectingNodeAndConnect,
+    defaultNodeColor,
+    getAllConnectorLabels,
+    getAllConnectors,
+    getChildren,
+    getConnectorIndex,
+    getDuplicateConnectors,
+    getTileColor,
+    hasPossibleInputs,
+    hex2rgb,
+    indexForConnectors,
+    interface2hex,
+    interface2rgb,
+    invalidateConnectorIndex,
+    isConnectingAndConnectedCorrectly,
+    isConnectingNode,
+    isConnector,
+    jumpKeepingPreviousSelection,
+    makeConnector,
+    normalizeLabel,
+    recordUsage,
+    reconnectNodes,
+    repairAllConnections,
+    repairAllConnectionsCommand,
+    rgb2hex,
+    rgb2interface,
+    sameGroupConnectors,
+    selectChildren,
+    setConnectorSettings,
+    setKnobValue,
+    startTimer,
+    usageScores,
+)
 
 _log = logging.getLogger("Label Connector")
 
@@ -39,49 +109,35 @@ BUTTON = "border-radius: 5px; font: 13px; padding: 4px 7px;"
 BUTTON_BORDER_DEFAULT = "border: 1px solid #212121;"
 BUTTON_BORDER_HIGHLIGHT = "border: 1px solid #AAAAAA;"
 BUTTON_BORDER_SELECTED = "border: 1px solid #C6710C;"
-BUTTON_REGULAR_COLOR = 673720575
+BUTTON_BORDER_DUPLICATE_COLOR = "#D23C3C"  # dashed border of Connectors sharing their label with another one
 BUTTON_REGULARDARK_COLOR = 471802623
 BUTTON_HIGHLIGHT_COLOR = 3329297663
 
-CONNECTOR_DEFAULT_COLOR = 1347440895
-
 
 SEARCHFIELD = "border-radius: 5px; font: 13px; border: 1px solid #212121;"
 RENAMEFIELD = "border-radius: 5px; font: 13px; border: 1px solid #212121;"
 
-CONNECTOR_KEY = "Connector"
-CONNECTED_KEY = "Connected"
-
-UNDO = nuke.Undo()
-UNDO_EVENT_TEXT = "Label Connector"
-
-BOLD_LABELS = True  # set typo of Connectors to Bold
-COLORIZE_CONNECTED = True
-
 MAX_CHARS_CONNECTOR_BUTTONS = 16  # linebreak after this amount of characters
+MAX_SEARCH_RESULTS = 50  # entries shown in the search result list
+VIRTUAL_GRID_THRESHOLD = 400  # above this amount of Connectors, a virtualized grid is used instead of buttons
 CONNECTORMINIMUMWIDTH = 500  # UI minimun height in px
 
+THUMBNAILS = False  # paint a small render of each Connector on its button, rendered in the background
+THUMBNAIL_SIZE = (96, 54)  # width and height of the rendered thumbnails in px
+THUMBNAIL_OPACITY = 0.6  # the label stays readable on top
+THUMBNAIL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".nuke", "labelConnectorThumbnails")
+THUMBNAIL_MEMORY_ENTRIES = 256  # thumbnails kept in memory
+THUMBNAIL_DISK_ENTRIES = 2000  # thumbnails kept in THUMBNAIL_CACHE_DIR, the least recently used ones get deleted
+THUMBNAIL_DELAY = 300  # ms the UI has to rest before thumbnails of the visible Connectors get requested
+THUMBNAIL_TIMEOUT = 120  # s until a batch of thumbnail renders gets killed
+THUMBNAIL_RENDERER = None  # callable(list of ThumbnailJob) writing the pngs, defaults to nukeRenderer
 
-_usePostageStamps = False
-_labelConnectorUI = None
-
+HOVER_PREVIEW = False  # view the hovered Connector in the Viewer, like right-clicking it
+HOVER_PREVIEW_DELAY = 250  # ms the mouse has to rest on a Connector before it gets viewed
 
-COLOR_LIST = {
-    "Red": 1277436927,
-    "Orange": 2017657087,
-    "Yellow": 2154504703,
-    "Green": 793519103,
-    "Dark Green": 304619007,
-    "Cyan": 592071935,
-    "Blue": 556482559,
-    "Dark Blue": 320482047,
-    "Purple": 975388415,
-    "Default": BUTTON_REGULAR_COLOR,
-}
 
-# you can add more Classes that you don't want to create Connections on.
-# Classes with no Inputs like Reads, Backdrops,... will already be ignored
-IGNORECLASSES = ["Viewer"]
+_labelConnectorUI = None
+_defaultConnectorUI = None  # kept alive and reused, only hidden on close
 
 
 class UIType:
@@ -96,32 +152,53 @@ class ConnectorButton(QtGuiWidgets.QPushButton):
     """Custom QPushButton to change colors when hovering above."""
 
     rightClicked = QtCore.Signal()
+    hovered = QtCore.Signal(bool)  # True when the mouse enters, False when it leaves
 
-    def __init__(self, parent, connector, node):
+    def __init__(self, parent, connector, node, label=None):
         super(ConnectorButton, self).__init__(parent)
         self.setMouseTracking(True)
-        self.label = connector.knob("label").getValue()
-        self.wrapped_label = "\n".join(textwrap.wrap(self.label, width=MAX_CHARS_CONNECTOR_BUTTONS))
-        self.connector = connector
-        self.node = node
+        self.setObjectName("connectorButton")
+        self.label = None
+        self.color = None
+        self.state = None
         self.entered = False
         self.selected = False
         self.is_highlighted = False  # stores highlight state in case of being selected, to revert correctly
+        self.duplicate = False
+        self.thumbnail = None
 
-        self.color = rgb2hex(interface2rgb(getTileColor(connector)))
-        self.highlight = rgb2hex(interface2rgb(BUTTON_HIGHLIGHT_COLOR))
-        self.highlighted_style = f"QPushButton{{background-color:{self.color};{BUTTON}{BUTTON_BORDER_HIGHLIGHT}}} QPushButton:hover{{background-color:{self.highlight};{BUTTON}{BUTTON_BORDER_HIGHLIGHT}}}"
-        self.default_style = f"QPushButton{{background-color:{self.color};{BUTTON}{BUTTON_BORDER_DEFAULT}}} QPushButton:hover{{background-color:{self.highlight};{BUTTON}{BUTTON_BORDER_DEFAULT}}}"
-        self.selected_style = f"QPushButton{{background-color:{self.color};{BUTTON}{BUTTON_BORDER_SELECTED}}} QPushButton:hover{{background-color:{self.highlight};{BUTTON}{BUTTON_BORDER_SELECTED}}}"
-
-        self.setTextDefault()
-        self.setStyleDefault()
+        self.updateConnector(connector, node, label)
+        self.updateState()
 
         self.setMinimumWidth(100)
         self.setMaximumWidth(250)
         self.setFixedHeight(65)
         self.setSizePolicy(QtGuiWidgets.QSizePolicy.Fixed, QtGuiWidgets.QSizePolicy.Expanding)
 
+    def updateConnector(self, connector, node, label=None):
+        """
+        Points the button to the given Connector, the text only gets updated if the label changed.
+        The color is applied by the LabelConnector via setColorSlot.
+
+        Args:
+            connector (node): Connector
+            node (node): node the UI was opened for
+            label (str, optional): label of the Connector, read from the knob if not given. Defaults to None.
+        """
+
+        self.connector = connector
+        self.node = node
+
+        if label is None:
+            label = connector.knob("label").getValue()
+
+        self.color = interface2hex(getTileColor(connector))
+
+        if label != self.label:
+            self.label = label
+            self.wrapped_label = "\n".join(textwrap.wrap(self.label, width=MAX_CHARS_CONNECTOR_BUTTONS))
+            self.setTextDefault()
+
     def enterEvent(self, event):
         """Change name with modifiers when mouse enters button."""
 
@@ -137,12 +214,47 @@ class ConnectorButton(QtGuiWidgets.QPushButton):
             self.setTextJumpConnector()
 
         self.entered = True
+        self.hovered.emit(True)
 
     def leaveEvent(self, event):
         """Change reset name when mouse leaves button."""
 
         self.setTextDefault()
         self.entered = False
+        self.hovered.emit(False)
+
+    def setThumbnail(self, pixmap):
+        """
+        Args:
+            pixmap (QtGui.QPixmap): thumbnail to paint below the label, None for none
+        """
+
+        if pixmap is not self.thumbnail:
+            self.thumbnail = pixmap
+            self.update()
+
+    def paintEvent(self, event):
+        """Paints the thumbnail, if there is one, between the background and the label."""
+
+        if self.thumbnail is None:
+            super(ConnectorButton, self).paintEvent(event)
+            return
+
+        option = QtGuiWidgets.QStyleOptionButton()
+        self.initStyleOption(option)
+        text, option.text = option.text, ""
+
+        painter = QtGuiWidgets.QStylePainter(self)
+        painter.drawControl(QtGuiWidgets.QStyle.CE_PushButton, option)
+
+        rect = QtCore.QRectF(self.rect()).adjusted(2, 2, -2, -2)
+        painter.setOpacity(THUMBNAIL_OPACITY)
+        painter.drawPixmap(thumbnailRect(self.thumbnail, rect), self.thumbnail, QtCore.QRectF(self.thumbnail.rect()))
+        painter.setOpacity(1.0)
+
+        option.text = text
+        option.rect = self.style().subElementRect(QtGuiWidgets.QStyle.SE_PushButtonContents, option, self)
+        painter.drawControl(QtGuiWidgets.QStyle.CE_PushButtonLabel, option)
 
     def mousePressEvent(self, event):
         """Emits a signal when right clicked."""
@@ -165,140 +277,1136 @@ class ConnectorButton(QtGuiWidgets.QPushButton):
     def setTextDefault(self):
         self.setText(self.wrapped_label)
 
-    # Styles for different states
+    # Styles for different states, the actual styles live in the stylesheet of the LabelConnector
 
     def setStyleHighlighted(self):
         """In case of a search pattern match."""
 
-        self.setStyleSheet(self.highlighted_style)
         self.is_highlighted = True
+        self.updateState()
 
     def setStyleDefault(self):
         """Default style."""
 
-        self.setStyleSheet(self.default_style)
-        self.is_highlighted = False
+        self.is_highlighted = False
+        self.updateState()
+
+    def setStyleSelected(self):
+        """In case of being selected to create multiple stamps."""
+
+        self.selected = True
+        self.updateState()
+
+    def updateState(self):
+        """Sets the state property based on selection and highlighting, re-polishes only on changes."""
+
+        if self.selected:
+            state = "selected"
+        elif self.is_highlighted:
+            state = "highlighted"
+        else:
+            state = "default"
+
+        if state != self.state:
+            self.state = state
+            self.setProperty("state", state)
+            self.repolish()
+
+    def setColorSlot(self, slot):
+        """
+        Sets the color of the button, by pointing it to a color rule of the shared stylesheet.
+
+        Args:
+            slot (int): index of the color in the stylesheet
+        """
+
+        slot = str(slot)
+        if slot != self.property("colorSlot"):
+            self.setProperty("colorSlot", slot)
+            self.repolish()
+
+    def setDuplicate(self, others):
+        """
+        Marks the button if other Connectors use the same label.
+
+        Args:
+            others (list): names of the other Connectors with the same label, empty if the label is unique
+        """
+
+        duplicate = bool(others)
+        if duplicate == self.duplicate:
+            return
+
+        self.duplicate = duplicate
+        self.setProperty("duplicate", "true" if duplicate else "false")
+        self.setToolTip("Label also used by " + ", ".join(others) if duplicate else "")
+        self.repolish()
+
+    def repolish(self):
+        """Applies changed properties, widgets that weren't polished yet pick them up once they get shown."""
+
+        if self.testAttribute(QtCore.Qt.WA_WState_Polished):
+            self.style().unpolish(self)
+            self.style().polish(self)
+
+
+def connectorButtonStyleSheet(colors):
+    """
+    Builds the stylesheet shared by all Connector buttons. Buttons pick their rules via the dynamic
+    properties "colorSlot" and "state", so changing a state doesn't need a new stylesheet.
+
+    Args:
+        colors (list): hex colors, the index of each color is its slot
+
+    Returns:
+        str: stylesheet
+    """
+
+    highlight = interface2hex(BUTTON_HIGHLIGHT_COLOR)
+
+    rules = [f"QPushButton#connectorButton{{{BUTTON}{BUTTON_BORDER_DEFAULT}}}"]
+    rules.extend(f'QPushButton#connectorButton[colorSlot="{slot}"]{{background-color:{color};}}' for slot, color in enumerate(colors))
+    rules.append(f"QPushButton#connectorButton:hover{{background-color:{highlight};}}")
+    rules.append(f'QPushButton#connectorButton[state="highlighted"]{{{BUTTON_BORDER_HIGHLIGHT}}}')
+    rules.append(f'QPushButton#connectorButton[state="selected"]{{{BUTTON_BORDER_SELECTED}}}')
+    # duplicates stay dashed in every state and are red unless highlighted or selected
+    rules.append('QPushButton#connectorButton[duplicate="true"]{border-style:dashed;}')
+    rules.append(f'QPushButton#connectorButton[duplicate="true"][state="default"]{{border-color:{BUTTON_BORDER_DUPLICATE_COLOR};}}')
+
+    return "\n".join(rules)
+
+
+class StandardButton(QtGuiWidgets.QPushButton):
+    """Custom QPushButton to change colors when hovering above."""
+
+    def __init__(self, parent, text, color=None):
+        super(StandardButton, self).__init__(parent)
+
+        if color is None:
+            color = labelConnectorCore.BUTTON_REGULAR_COLOR
+
+        self.setMouseTracking(True)
+        self.setText(text)
+
+        self.setMinimumWidth(100)
+        self.setMaximumWidth(150)
+        self.setFixedHeight(65)
+        self.setSizePolicy(QtGuiWidgets.QSizePolicy.Expanding, QtGuiWidgets.QSizePolicy.Fixed)
+
+        self.interfaceColor = color
+
+        self.color = interface2hex(color)
+        self.highlight = interface2hex(BUTTON_HIGHLIGHT_COLOR)
+        self.setStyleSheet(standardButtonStyleSheet(color, BUTTON_HIGHLIGHT_COLOR))
+
+
+@functools.lru_cache(maxsize=None)
+def standardButtonStyleSheet(color, highlight):
+    """
+    Stylesheet of a StandardButton, built once per color combination.
+
+    Args:
+        color (int): interface color of the button
+        highlight (int): interface color when hovering above
+
+    Returns:
+        str: stylesheet
+    """
+
+    return (
+        f"QPushButton{{background-color:{interface2hex(color)};{BUTTON}}} "
+        f"QPushButton:hover{{background-color:{interface2hex(highlight)};{BUTTON}}}"
+    )
+
+
+class ConnectorListModel(QtCore.QAbstractListModel):
+    """List model reading labels and full names straight from a ConnectorIndex, nothing gets copied."""
+
+    ConnectorRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, connectorIndex=None, parent=None):
+        """
+        Args:
+            connectorIndex (ConnectorIndex, optional): Connectors to list. Defaults to none.
+            parent (QObject, optional): parent widget. Defaults to None.
+        """
+
+        super(ConnectorListModel, self).__init__(parent)
+        self.connectorIndex = connectorIndex or ConnectorIndex()
+
+    def setConnectorIndex(self, connectorIndex):
+        """
+        Args:
+            connectorIndex (ConnectorIndex): Connectors to list
+        """
+
+        if connectorIndex is self.connectorIndex:
+            return
+
+        self.beginResetModel()
+        self.connectorIndex = connectorIndex
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.connectorIndex)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Args:
+            index (QtCore.QModelIndex): Index of requested data.
+            role (int, optional): Requested data role. Defaults to QtCore.Qt.DisplayRole.
+
+        Returns:
+            Any
+        """
+
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self.connectorIndex.labels[index.row()]
+
+        if role == self.ConnectorRole:
+            return self.connectorIndex.names[index.row()]
+
+        return None
+
+    def roleNames(self):
+        roles = super(ConnectorListModel, self).roleNames()
+        roles[self.ConnectorRole] = b"connector"
+        return roles
+
+
+class ConnectorRowsProxyModel(QtCore.QAbstractProxyModel):
+    """
+    Shows the given rows of a ConnectorListModel in the given order, e.g. the ranked search results.
+    Changing them only swaps the list of rows, the source model stays untouched.
+    """
+
+    def __init__(self, parent=None):
+        super(ConnectorRowsProxyModel, self).__init__(parent)
+        self.rows = []  # proxy row -> source row
+        self.positions = {}  # source row -> proxy row
+
+    def setSourceModel(self, sourceModel):
+        self.beginResetModel()
+        super(ConnectorRowsProxyModel, self).setSourceModel(sourceModel)
+        self.rows = []
+        self.positions = {}
+        self.endResetModel()
+
+    def setRows(self, rows):
+        """
+        Args:
+            rows (list): rows of the source model in the order they get shown
+        """
+
+        self.beginResetModel()
+        self.rows = rows
+        self.positions = {row: position for position, row in enumerate(rows)}
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def index(self, row, column=0, parent=QtCore.QModelIndex()):
+        if parent.isValid() or column != 0 or not 0 <= row < len(self.rows):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QtCore.QModelIndex()):
+        return QtCore.QModelIndex()
+
+    def mapToSource(self, proxyIndex):
+        if not proxyIndex.isValid() or self.sourceModel() is None:
+            return QtCore.QModelIndex()
+        return self.sourceModel().index(self.rows[proxyIndex.row()], 0)
+
+    def mapFromSource(self, sourceIndex):
+        position = self.positions.get(sourceIndex.row()) if sourceIndex.isValid() else None
+        if position is None:
+            return QtCore.QModelIndex()
+        return self.index(position, 0)
+
+
+class ConnectorAbstractView(QtGuiWidgets.QListView):
+    """Extend the QListView to emit a signal when the current index changes."""
+
+    currentIndexChanged = QtCore.Signal()
+
+    def currentChanged(self, current, previous):
+        ret = super(ConnectorAbstractView, self).currentChanged(current, previous)
+        self.currentIndexChanged.emit()
+        return ret
+
+
+class ConnectorGridModel(QtCore.QAbstractListModel):
+    """List model over a ConnectorIndex for the virtualized grid. Labels and colors are only prepared for painted rows."""
+
+    ConnectorRole = QtCore.Qt.UserRole + 1
+    ColorRole = QtCore.Qt.UserRole + 2
+    StateRole = QtCore.Qt.UserRole + 3
+    DuplicateRole = QtCore.Qt.UserRole + 4
+    RowRole = QtCore.Qt.UserRole + 5
+    ThumbnailRole = QtCore.Qt.UserRole + 6
+
+    thumbnailsWanted = QtCore.Signal()  # painted rows miss their thumbnail, see requestThumbnails
+
+    def __init__(self, parent=None):
+        super(ConnectorGridModel, self).__init__(parent)
+        self.connectorIndex = ConnectorIndex()
+        self.order = None  # position -> row of the ConnectorIndex, None if both are the same
+        self.positions = None
+        self.highlighted = set()
+        self.selected = set()
+        self._wrappedLabels = {}
+        self._colors = {}
+        self._thumbnails = {}  # row -> QtGui.QPixmap, None while it's being loaded
+        self._wantedThumbnails = set()  # painted rows whose thumbnail hasn't been requested yet
+        self._rowsByName = None
+
+    def setConnectorIndex(self, connectorIndex, order=None):
+        """
+        Shows the Connectors of the given index, resets highlighting and selection.
+
+        Args:
+            connectorIndex (ConnectorIndex): Connectors to show
+            order (list, optional): rows of the index in the order they get shown. Defaults to the order of the index.
+        """
+
+        self.beginResetModel()
+        self.connectorIndex = connectorIndex
+        self.order = order
+        self.positions = None if order is None else {row: position for position, row in enumerate(order)}
+        self.highlighted = set()
+        self.selected = set()
+        self._wrappedLabels = {}
+        self._colors = {}
+        self._thumbnails = {}
+        self._wantedThumbnails = set()
+        self._rowsByName = None
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.connectorIndex)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Args:
+            index (QtCore.QModelIndex): Index of requested data.
+            role (int, optional): Requested data role. Defaults to QtCore.Qt.DisplayRole.
+
+        Returns:
+            Any
+        """
+
+        row = index.row() if self.order is None else self.order[index.row()]
+
+        if role == QtCore.Qt.DisplayRole:
+            if row not in self._wrappedLabels:
+                self._wrappedLabels[row] = "\n".join(textwrap.wrap(self.connectorIndex.labels[row], width=MAX_CHARS_CONNECTOR_BUTTONS))
+            return self._wrappedLabels[row]
+
+        if role == self.ConnectorRole:
+            return self.connectorIndex.names[row]
+
+        if role == self.ColorRole:
+            if row not in self._colors:
+                self._colors[row] = interface2hex(getTileColor(self.connectorIndex.connectors[row]))
+            return self._colors[row]
+
+        if role == self.StateRole:
+            if row in self.selected:
+                return "selected"
+            if row in self.highlighted:
+                return "highlighted"
+            return "default"
+
+        if role == self.DuplicateRole:
+            return row in self.connectorIndex.duplicateRows
+
+        if role == self.RowRole:
+            return row
+
+        if role == self.ThumbnailRole:
+            if row not in self._thumbnails:  # only remembered here, painting must not wait for the loader
+                self._thumbnails[row] = None
+                self._wantedThumbnails.add(row)
+                self.thumbnailsWanted.emit()
+            return self._thumbnails[row]
+
+        if role == QtCore.Qt.ToolTipRole:
+            label = self.connectorIndex.labels[row]
+            if row in self.connectorIndex.duplicateRows:
+                name = self.connectorIndex.names[row]
+                others = [other.fullName() for other in self.connectorIndex.duplicates[label] if other.fullName() != name]
+                return "{}\nLabel also used by {}".format(label, ", ".join(others))
+            return label
+
+        return None
+
+    def setHighlightedRows(self, rows):
+        """
+        Args:
+            rows (set): rows of the ConnectorIndex to highlight, all others get their default style back
+        """
+
+        changed = self.highlighted ^ rows
+        self.highlighted = set(rows)
+        self._emitStateChanged(changed)
+
+    def setRowSelected(self, row, selected):
+        """
+        Args:
+            row (int): row of the ConnectorIndex to change
+            selected (bool): selected to create multiple Connected nodes
+        """
+
+        if selected:
+            self.selected.add(row)
+        else:
+            self.selected.discard(row)
+        self._emitStateChanged({row})
+
+    def requestThumbnails(self, loader):
+        """
+        Requests the thumbnails of the rows painted since the last call, the missing ones follow via setThumbnail.
+
+        Args:
+            loader (ThumbnailLoader): loader to request them from
+        """
+
+        rows, self._wantedThumbnails = self._wantedThumbnails, set()
+        for row in rows:
+            pixmap = loader.request(self.connectorIndex.connectors[row])
+            if pixmap is not None:
+                self._setRowThumbnail(row, pixmap)
+
+    def setThumbnail(self, name, pixmap):
+        """
+        Args:
+            name (str): full name of the Connector whose thumbnail is ready
+            pixmap (QtGui.QPixmap): thumbnail
+        """
+
+        if self._rowsByName is None:
+            self._rowsByName = {name: row for row, name in enumerate(self.connectorIndex.names)}
+
+        row = self._rowsByName.get(name)
+        if row is not None:
+            self._setRowThumbnail(row, pixmap)
+
+    def _setRowThumbnail(self, row, pixmap):
+        self._thumbnails[row] = pixmap
+        position = row if self.positions is None else self.positions[row]
+        self.dataChanged.emit(self.index(position), self.index(position), [self.ThumbnailRole])
+
+    def _emitStateChanged(self, rows):
+        if self.positions is not None:
+            rows = {self.positions[row] for row in rows}
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [self.StateRole])
+
+
+class ConnectorGridDelegate(QtGuiWidgets.QStyledItemDelegate):
+    """Paints a cell of the virtualized grid the same way a ConnectorButton looks."""
+
+    CELL_SIZE = QtCore.QSize(120, 65)
+    BORDER_COLORS = {"default": "#212121", "highlighted": "#AAAAAA", "selected": "#C6710C"}
+    MODIFIER_TEXTS = {
+        QtCore.Qt.ShiftModifier: "Create multiple\n-\n",
+        QtCore.Qt.AltModifier: "Options...\n-\n",
+        QtCore.Qt.ControlModifier: "Jump to Connector\n-\n",
+    }
+
+    def __init__(self, parent=None):
+        super(ConnectorGridDelegate, self).__init__(parent)
+        self.highlight = QtGui.QColor(interface2hex(BUTTON_HIGHLIGHT_COLOR))
+        self.font = QtGui.QFont()
+        self.font.setPixelSize(13)
+
+    def sizeHint(self, option, index):
+        return self.CELL_SIZE
+
+    def paint(self, painter, option, index):
+        hovered = bool(option.state & QtGuiWidgets.QStyle.State_MouseOver)
+        text = index.data(QtCore.Qt.DisplayRole)
+
+        if hovered:
+            text = self.MODIFIER_TEXTS.get(QtGuiWidgets.QApplication.keyboardModifiers(), "") + text
+            background = self.highlight
+        else:
+            background = QtGui.QColor(index.data(ConnectorGridModel.ColorRole))
+
+        rect = QtCore.QRectF(option.rect).adjusted(1.5, 1.5, -1.5, -1.5)
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        state = index.data(ConnectorGridModel.StateRole)
+        pen = QtGui.QPen(QtGui.QColor(self.BORDER_COLORS[state]), 1)
+        if index.data(ConnectorGridModel.DuplicateRole):
+            pen.setStyle(QtCore.Qt.DashLine)
+            if state == "default":
+                pen.setColor(QtGui.QColor(BUTTON_BORDER_DUPLICATE_COLOR))
+
+        painter.setPen(pen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 5, 5)
+
+        thumbnail = index.data(ConnectorGridModel.ThumbnailRole)
+        if thumbnail is not None:
+            inner = rect.adjusted(1, 1, -1, -1)
+            painter.setOpacity(THUMBNAIL_OPACITY)
+            painter.drawPixmap(thumbnailRect(thumbnail, inner), thumbnail, QtCore.QRectF(thumbnail.rect()))
+            painter.setOpacity(1.0)
+
+        painter.setFont(self.font)
+        painter.setPen(option.palette.color(QtGui.QPalette.ButtonText))
+        painter.drawText(rect, QtCore.Qt.AlignCenter, text)
+        painter.restore()
+
+
+class ConnectorGridView(QtGuiWidgets.QListView):
+    """
+    Virtualized grid of Connectors for large scripts, only visible cells get painted.
+    Emits the row of the clicked Connector, the LabelConnector handles it like a ConnectorButton click.
+    """
+
+    leftClicked = QtCore.Signal(int)
+    rightClicked = QtCore.Signal(int)
+    hovered = QtCore.Signal(int)  # row under the mouse, -1 for none
+
+    def __init__(self, parent=None):
+        super(ConnectorGridView, self).__init__(parent)
+
+        self.hoveredRow = -1
+
+        self.setViewMode(QtGuiWidgets.QListView.IconMode)
+        self.setFlow(QtGuiWidgets.QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QtGuiWidgets.QListView.Adjust)
+        self.setMovement(QtGuiWidgets.QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(2)
+        self.setSelectionMode(QtGuiWidgets.QAbstractItemView.NoSelection)
+        self.setEditTriggers(QtGuiWidgets.QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(QtCore.Qt.NoFocus)  # keep typing in the search field
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(QtCore.Qt.WA_Hover)
+        self.setStyleSheet("QListView{background: transparent; border: none;}")
+
+        self.setItemDelegate(ConnectorGridDelegate(self))
+
+    def gridSize(self, count):
+        """
+        Size of the view for the given amount of Connectors, roughly square but never bigger than the screen allows.
+
+        Args:
+            count (int): amount of Connectors
+
+        Returns:
+            QtCore.QSize: size of the view
+        """
+
+        screen = QtGui.QGuiApplication.screenAt(QtGui.QCursor.pos()) or QtGui.QGuiApplication.primaryScreen()
+        available = screen.availableGeometry()
+
+        cell = ConnectorGridDelegate.CELL_SIZE + QtCore.QSize(2 * self.spacing(), 2 * self.spacing())
+        scrollbar = self.style().pixelMetric(QtGuiWidgets.QStyle.PM_ScrollBarExtent)
+
+        columns = max(1, min(math.ceil(math.sqrt(count)), int(available.width() * 0.6) // cell.width()))
+        rows = max(1, min(math.ceil(count / columns), int(available.height() * 0.6) // cell.height()))
+
+        return QtCore.QSize(columns * cell.width() + scrollbar + 4, rows * cell.height() + 4)
+
+    def mousePressEvent(self, event):
+        """Right clicks emit on press, like the ConnectorButton."""
+
+        index = self.indexAt(event.pos())
+        if index.isValid() and event.button() == QtCore.Qt.RightButton:
+            self.rightClicked.emit(index.data(ConnectorGridModel.RowRole))
+        event.accept()
+
+    def mouseReleaseEvent(self, event):
+        """Left clicks emit on release, like the ConnectorButton."""
+
+        index = self.indexAt(event.pos())
+        if index.isValid() and event.button() == QtCore.Qt.LeftButton:
+            self.leftClicked.emit(index.data(ConnectorGridModel.RowRole))
+        event.accept()
+
+    def mouseMoveEvent(self, event):
+        """Emits hovered whenever the mouse moves onto another Connector."""
+
+        super(ConnectorGridView, self).mouseMoveEvent(event)
+
+        index = self.indexAt(event.pos())
+        self.setHoveredRow(index.data(ConnectorGridModel.RowRole) if index.isValid() else -1)
+
+    def leaveEvent(self, event):
+        super(ConnectorGridView, self).leaveEvent(event)
+        self.setHoveredRow(-1)
+
+    def setHoveredRow(self, row):
+        if row != self.hoveredRow:
+            self.hoveredRow = row
+            self.hovered.emit(row)
+
+
+class ThumbnailJob:
+    """Everything a thumbnail renderer needs, plain values only as it runs outside of the main thread."""
+
+    __slots__ = ("name", "label", "color", "key", "path", "width", "height", "script", "scriptTime", "frame")
+
+    def __init__(self, name, label, color, key, path, width, height, script, scriptTime, frame):
+        self.name = name  # full name of the Connector
+        self.label = label
+        self.color = color  # hex color of the Connector
+        self.key = key
+        self.path = path  # png file the renderer has to write
+        self.width = width
+        self.height = height
+        self.script = script  # saved script the Connector lives in
+        self.scriptTime = scriptTime  # modification time of the saved script the key was made for
+        self.frame = frame
+
+
+def scriptTime(script):
+    """Modification time of the saved script, None if it hasn't been saved."""
+
+    try:
+        return os.path.getmtime(script)
+    except OSError:
+        return None
+
+
+def thumbnailKey(connector, frame, script, savedTime):
+    """
+    Cache key of a Connector thumbnail, made of the state the thumbnail gets rendered from: the last saved version
+    of the script. As long as the open script is unmodified it matches that version, so the hash of the image
+    arriving at the Connector stands for it and the thumbnail survives saving again. Otherwise the key is
+    tied to the saved file itself, unsaved edits upstream can't be in the thumbnail anyway.
+
+    Args:
+        connector (node): Connector
+        frame (int): frame the thumbnail shows
+        script (str): path of the saved script
+        savedTime (float): modification time of the saved script, None if it hasn't been saved
+
+    Returns:
+        str: key
+    """
+
+    name = "{}@{}".format(connector.fullName(), frame)
+
+    if not nuke.root().modified():
+        try:
+            hashes = connector.opHashes()
+        except (AttributeError, RuntimeError):  # not every Nuke version can tell
+            hashes = None
+
+        if hashes:
+            return "{}:{:x}".format(name, hashes[0] & 0xFFFFFFFFFFFFFFFF)
+
+    return "{}:{}@{!r}".format(name, script, savedTime)
+
+
+_RENDER_SCRIPT = """import json
+import sys
+import nuke
+
+script, job_file = sys.argv[1:3]
+with open(job_file) as handle:
+    jobs = json.load(handle)
+
+nuke.scriptOpen(script)
+
+for job in jobs:
+    try:
+        group_name = job["name"].rpartition(".")[0]
+        group = nuke.toNode("root." + group_name) if group_name else nuke.root()
+
+        with group:
+            reformat = nuke.nodes.Reformat(type="to box", box_width=job["width"], box_height=job["height"], box_fixed=True)
+            reformat.setInput(0, nuke.toNode("root." + job["name"]))
+            write = nuke.nodes.Write(file=job["path"], file_type="png", channels="rgb")
+            write.setInput(0, reformat)
+            nuke.execute(write, job["frame"], job["frame"])
+            nuke.delete(write)
+            nuke.delete(reformat)
+    except Exception as error:  # the other thumbnails of the batch still get rendered
+        sys.stderr.write("{}: {}\\n".format(job["name"], error))
+"""
+
+_renderScript = None  # path of _RENDER_SCRIPT on disk, written once per session
+_renderProcesses = set()  # running Nuke processes of nukeRenderer
+_renderLock = threading.Lock()
+
+
+def nukeRenderer(jobs):
+    """
+    Renders the Connectors into their thumbnail files with one separate Nuke process in terminal mode, working on
+    the last saved version of the script. The script gets opened once for the whole batch, the open session
+    neither waits for it nor gets any nodes added. Thumbnails that couldn't be rendered are simply not written.
+
+    Args:
+        jobs (list): ThumbnailJobs to render, all of the same script
+    """
+
+    batch = [
+        {"name": job.name, "path": job.path.replace("\\", "/"), "width": job.width, "height": job.height, "frame": job.frame}
+        for job in jobs
+    ]
+
+    # handed over as a file, a long batch wouldn't fit on the command line
+    directory = os.path.dirname(_renderScriptPath())
+    handle, job_file = tempfile.mkstemp(suffix=".json", dir=directory)
+    with os.fdopen(handle, "w") as batchFile:
+        json.dump(batch, batchFile)
+
+    command = [nuke.EXE_PATH, "-t", _renderScriptPath(), jobs[0].script, job_file]
+
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),  # no console window popping up on Windows
+        )
+
+        with _renderLock:
+            _renderProcesses.add(process)
+
+        try:
+            process.wait(timeout=THUMBNAIL_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            _log.warning("Rendering %d thumbnails took longer than %ss", len(jobs), THUMBNAIL_TIMEOUT)
+            process.kill()
+            process.wait()
+        finally:
+            with _renderLock:
+                _renderProcesses.discard(process)
+
+    finally:
+        os.remove(job_file)
+
+
+def _renderScriptPath():
+    global _renderScript
+
+    if _renderScript is None:
+        directory = os.path.join(THUMBNAIL_CACHE_DIR, "scripts")
+        os.makedirs(directory, exist_ok=True)
+
+        # written next to the final file and moved in place, as other Nuke sessions may write it at the same time
+        handle, temp = tempfile.mkstemp(suffix=".py", dir=directory)
+        with os.fdopen(handle, "w") as script:
+            script.write(_RENDER_SCRIPT)
+
+        path = os.path.join(directory, "renderThumbnail.py")
+        os.replace(temp, path)
+        _renderScript = path
+
+    return _renderScript
+
+
+def killThumbnailRenders():
+    """Kills the Nuke processes of nukeRenderer that are still running."""
+
+    with _renderLock:
+        processes = list(_renderProcesses)
+
+    for process in processes:
+        try:
+            process.kill()
+        except OSError:  # finished in the meantime
+            pass
+
+
+def placeholderRenderer(jobs):
+    """
+    Stand-in renderer that needs no Nuke session, writes a small gradient in the Connector color.
+    Meant for testing the thumbnail pipeline, set THUMBNAIL_RENDERER = placeholderRenderer.
+
+    Args:
+        jobs (list): ThumbnailJobs to render
+    """
+
+    for job in jobs:
+        # QImage, unlike QPixmap, may be painted outside of the main thread
+        color = QtGui.QColor(job.color)
+        gradient = QtGui.QLinearGradient(0, 0, job.width, job.height)
+        gradient.setColorAt(0.0, color.lighter(250))
+        gradient.setColorAt(1.0, color.darker(150))
+
+        image = QtGui.QImage(job.width, job.height, QtGui.QImage.Format_RGB32)
+        painter = QtGui.QPainter(image)
+        painter.fillRect(image.rect(), gradient)
+        painter.end()
+
+        image.save(job.path, "PNG")
+
+
+class ThumbnailCache:
+    """
+    Two level LRU cache of thumbnails: decoded pixmaps in memory, png files on disk.
+    Keys come from thumbnailKey and describe what the thumbnail was rendered from,
+    so changed images never hit old entries.
+    """
+
+    def __init__(self, directory, memoryEntries, diskEntries):
+        """
+        Args:
+            directory (str): folder for the png files
+            memoryEntries (int): thumbnails kept in memory
+            diskEntries (int): thumbnails kept on disk
+        """
+
+        self.directory = directory
+        self.memoryEntries = memoryEntries
+        self.diskEntries = diskEntries
+        self._pixmaps = collections.OrderedDict()  # key -> QtGui.QPixmap, most recently used last
+
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png")
+
+    def pixmap(self, key):
+        """Returns the thumbnail from memory, None if it isn't there. Main thread only."""
+
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def addPixmap(self, key, pixmap):
+        """Keeps the thumbnail in memory, dropping the least recently used ones. Main thread only."""
+
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.memoryEntries:
+            self._pixmaps.popitem(last=False)
+
+    def loadImage(self, key):
+        """Reads the thumbnail from disk, None if it isn't there. Safe outside of the main thread."""
+
+        path = self.path(key)
+        if not os.path.isfile(path):
+            return None
+
+        image = QtGui.QImage(path)
+        if image.isNull():
+            return None
+
+        try:
+            os.utime(path)  # marks it as recently used for evictDisk
+        except OSError:
+            pass
+
+        return image
+
+    def discard(self, key):
+        """Deletes the thumbnail from disk. Safe outside of the main thread."""
+
+        try:
+            os.remove(self.path(key))
+        except OSError:
+            pass
+
+    def evictDisk(self):
+        """Deletes the least recently used png files above diskEntries. Safe outside of the main thread."""
+
+        try:
+            paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".png")]
+        except OSError:
+            return
+
+        if len(paths) <= self.diskEntries:
+            return
+
+        def lastUse(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0.0
+
+        for path in sorted(paths, key=lastUse)[: len(paths) - self.diskEntries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class ThumbnailSignals(QtCore.QObject):
+    """Carries finished thumbnails from the worker threads back to the main thread."""
+
+    finished = QtCore.Signal(str, str, QtGui.QImage)  # Connector name, key, thumbnail, a null image if it failed
+    outdated = QtCore.Signal(str)  # key of a thumbnail dropped because the script got saved again in the meantime
+
+
+def renderThumbnails(cache, jobs, renderer):
+    """
+    Renders thumbnails that aren't cached yet, all in one go. Runs outside of the main thread.
+
+    Args:
+        cache (ThumbnailCache): cache to render into
+        jobs (list): ThumbnailJobs to render
+        renderer (callable): writes the pngs of a list of ThumbnailJobs
+
+    Returns:
+        list: (ThumbnailJob, QtGui.QImage) tuples, a null image for each thumbnail that couldn't be rendered
+    """
+
+    try:
+        os.makedirs(cache.directory, exist_ok=True)
+        renderer(jobs)
+    except Exception:
+        _log.warning("Rendering %d thumbnails failed", len(jobs), exc_info=True)
+
+    results = []
+    for job in jobs:
+        image = cache.loadImage(job.key)
+        results.append((job, QtGui.QImage() if image is None else image))
+
+    cache.evictDisk()
+    return results
+
+
+class ThumbnailLoader(QtCore.QObject):
+    """
+    Hands out Connector thumbnails without ever waiting for them. Missing ones get loaded or rendered
+    in a worker thread, thumbnailReady is emitted in the main thread once they are there.
+
+    All thumbnails requested within one pass of the event loop form a batch, the ones not cached on disk
+    get rendered together by a single call of the renderer.
+    """
+
+    thumbnailReady = QtCore.Signal(str, object)  # Connector name, QtGui.QPixmap
+
+    def __init__(self, parent=None):
+        super(ThumbnailLoader, self).__init__(parent)
+
+        self.cache = ThumbnailCache(THUMBNAIL_CACHE_DIR, THUMBNAIL_MEMORY_ENTRIES, THUMBNAIL_DISK_ENTRIES)
+        self.pending = set()  # keys being loaded or rendered
+        self.failed = set()  # keys that couldn't be rendered, not tried again this session
+
+        # a daemon thread with a plain queue: it never holds up quitting Nuke and queued batches can be dropped
+        self.jobs = queue.Queue()
+        self.worker = None
+
+        self.batch = []  # jobs requested since the last pass of the event loop
+        self.batchTimer = QtCore.QTimer(self)
+        self.batchTimer.setSingleShot(True)
+        self.batchTimer.setInterval(0)
+        self.batchTimer.timeout.connect(self.submitBatch)
+
+        self.signals = ThumbnailSignals(self)
+        self.signals.finished.connect(self.taskFinished)
+        self.signals.outdated.connect(self.taskOutdated)
+
+    def request(self, connector):
+        """
+        Returns the thumbnail of the Connector if it's in memory, otherwise starts loading it.
+
+        Args:
+            connector (node): Connector
+
+        Returns:
+            QtGui.QPixmap: thumbnail, None if it isn't ready yet
+        """
+
+        name = connector.fullName()
+        frame = nuke.frame()
+        script = nuke.root().name()
+        savedTime = scriptTime(script)
+        key = thumbnailKey(connector, frame, script, savedTime)
+
+        pixmap = self.cache.pixmap(key)
+        if pixmap is not None or key in self.pending or key in self.failed:
+            return pixmap
+
+        renderer = THUMBNAIL_RENDERER or nukeRenderer
+        if renderer is nukeRenderer and savedTime is None:  # nothing to render from before the first save
+            return None
+
+        job = ThumbnailJob(
+            name,
+            connector["label"].value(),
+            interface2hex(getTileColor(connector)),
+            key,
+            self.cache.path(key),
+            THUMBNAIL_SIZE[0],
+            THUMBNAIL_SIZE[1],
+            script,
+            savedTime,
+            frame,
+        )
+
+        self.pending.add(key)
+        self.batch.append((job, renderer))
+        self.batchTimer.start()
+
+        return None
+
+    def submitBatch(self):
+        """Hands the jobs requested since the last pass of the event loop over to the worker thread."""
+
+        batches = {}
+        for job, renderer in self.batch:
+            batches.setdefault((renderer, job.script), []).append(job)
+        self.batch = []
+
+        for (renderer, _), jobs in batches.items():
+            self.jobs.put((jobs, renderer))
+
+        if batches and self.worker is None:
+            self.worker = threading.Thread(target=self.work, name="LabelConnectorThumbnails", daemon=True)
+            self.worker.start()
+
+    def work(self):
+        """
+        Worker thread, takes on the queued batches one by one. Thumbnails cached on disk are handed over right away,
+        the missing ones get rendered together. The signal hands the images over to the main thread.
+        """
+
+        while True:
+            jobs, renderer = self.jobs.get()
+
+            missing = []
+            for job in jobs:
+                image = self.cache.loadImage(job.key)
+                if image is None:
+                    missing.append(job)
+                else:
+                    self.signals.finished.emit(job.name, job.key, image)
 
-    def setStyleSelected(self):
-        """In case of being selected to create multiple stamps."""
+            if not missing:
+                continue
 
-        self.setStyleSheet(self.selected_style)
+            # all jobs of a batch share the script. Saved again since their keys were made, a render would end up
+            # under keys that don't describe it, so they get dropped and requested again with new keys instead
+            script, savedTime = missing[0].script, missing[0].scriptTime
+            results = renderThumbnails(self.cache, missing, renderer) if scriptTime(script) == savedTime else []
 
+            if scriptTime(script) != savedTime:
+                for job in missing:
+                    self.cache.discard(job.key)
+                    self.signals.outdated.emit(job.key)
+                continue
 
-class StandardButton(QtGuiWidgets.QPushButton):
-    """Custom QPushButton to change colors when hovering above."""
+            for job, image in results:
+                self.signals.finished.emit(job.name, job.key, image)
 
-    def __init__(self, parent, text, color=BUTTON_REGULAR_COLOR):
-        super(StandardButton, self).__init__(parent)
-        self.setMouseTracking(True)
-        self.setText(text)
+    def cancel(self, running=False):
+        """
+        Drops the batches that haven't started yet.
 
-        self.setMinimumWidth(100)
-        self.setMaximumWidth(150)
-        self.setFixedHeight(65)
-        self.setSizePolicy(QtGuiWidgets.QSizePolicy.Expanding, QtGuiWidgets.QSizePolicy.Fixed)
+        Args:
+            running (bool, optional): also kill the renders in progress and forget about them. Defaults to False.
+        """
 
-        self.interfaceColor = color
+        self.batchTimer.stop()
+        jobs = [job for job, _ in self.batch]
+        self.batch = []
 
-        self.color = rgb2hex(interface2rgb(color))
-        self.highlight = rgb2hex(interface2rgb(BUTTON_HIGHLIGHT_COLOR))
-        self.setStyleSheet(f"QPushButton{{background-color:{self.color};{BUTTON}}} QPushButton:hover{{background-color:{self.highlight};{BUTTON}}}")
+        while True:
+            try:
+                jobs.extend(self.jobs.get_nowait()[0])
+            except queue.Empty:
+                break
 
+        for job in jobs:
+            self.pending.discard(job.key)
 
-class ConnectorListModel(QtCore.QStringListModel):
-    """Class to extend the QAbstractListModel to store the Connector full name in the model."""
+        if running:
+            self.pending.clear()
+            killThumbnailRenders()
 
-    ConnectorRole = QtCore.Qt.UserRole + 1
+    def taskFinished(self, name, key, image):
+        if key not in self.pending:  # cancelled while running
+            return
 
-    def __init__(self, data, parent=None):
-        """Class to extend the QAbstractListModel to store the Connector node in the model.
+        self.pending.discard(key)
 
-        Args:
-            data (dict): Dict containing {"name": "connector_title", "connector": "connector_name"}
-            parent (QObject, optional): parent widget. Defaults to None.
-        """
-        super(ConnectorListModel, self).__init__(parent)
-        self.setStringList(data)
+        if image.isNull():
+            self.failed.add(key)
+            return
 
-    def setStringList(self, data):
-        """Update the model with the data.
+        pixmap = QtGui.QPixmap.fromImage(image)
+        self.cache.addPixmap(key, pixmap)
+        self.thumbnailReady.emit(name, pixmap)
 
-        Args:
-            data (dict): Dict containing {"name": "connector_title", "connector": "connector_name"}
-        """
+    def taskOutdated(self, key):
+        self.pending.discard(key)  # not failed, the next request comes with the new key
 
-        self._data = data
 
-        connector_names = [d["name"] for d in data]
-        super(ConnectorListModel, self).setStringList(connector_names)
+_thumbnailLoader = None
 
-    def data(self, index, role=QtCore.Qt.DisplayRole):
-        """Extend the data method to return the Connector node.
 
-        Args:
-            index (PySide2.QtCore.QModelIndex): Index of requested data.
-            role (int, optional): Requested data role. Defaults to QtCore.Qt.DisplayRole.
+def getThumbnailLoader():
+    """Returns the ThumbnailLoader shared by all UIs, None if THUMBNAILS is off."""
 
-        Returns:
-            Any
-        """
+    global _thumbnailLoader
 
-        if not self._data:
-            return super(ConnectorListModel, self).data(index, role)
+    if not THUMBNAILS:
+        return None
 
-        if role == self.ConnectorRole:
-            return self._data[index.row()]["connector"]
+    if _thumbnailLoader is None:
+        _thumbnailLoader = ThumbnailLoader()
 
-        return super(ConnectorListModel, self).data(index, role)
+        # renders of a closed script are of no use anymore, and no Nuke process should outlive the session
+        nuke.addOnScriptClose(functools.partial(_thumbnailLoader.cancel, running=True))
+        atexit.register(_thumbnailLoader.cancel, running=True)
 
-    def roleNames(self):
-        roles = super(ConnectorListModel, self).roleNames()
-        roles[self.ConnectorRole] = b"connector"
-        return roles
+    return _thumbnailLoader
 
 
-class ConnectorAbstractView(QtGuiWidgets.QListView):
-    """Extend the QListView to emit a signal when the current index changes."""
+def thumbnailRect(pixmap, rect):
+    """
+    Args:
+        pixmap (QtGui.QPixmap): thumbnail
+        rect (QtCore.QRectF): area to paint in
 
-    currentIndexChanged = QtCore.Signal()
+    Returns:
+        QtCore.QRectF: largest rect with the aspect ratio of the thumbnail, centered in the area
+    """
 
-    def currentChanged(self, current, previous):
-        ret = super(ConnectorAbstractView, self).currentChanged(current, previous)
-        self.currentIndexChanged.emit()
-        return ret
+    rect = QtCore.QRectF(rect)
+    size = QtCore.QSizeF(pixmap.size()).scaled(rect.size(), QtCore.Qt.KeepAspectRatio)
+    return QtCore.QRectF(rect.center().x() - size.width() / 2.0, rect.center().y() - size.height() / 2.0, size.width(), size.height())
 
 
 class LineEditConnectSelection(QtGuiWidgets.QLineEdit):
     """Custom QLineEdit with combined auto completion."""
 
-    def __init__(self, parent, dots, node):
+    def __init__(self, parent, dots, node, connectorIndex=None):
         super(LineEditConnectSelection, self).__init__(parent)
 
         self.node = node
         self.dots = dots
         self.setStyleSheet(SEARCHFIELD)
 
-        self.dotNameList = []
-        for dot in dots:
-            self.dotNameList.append(dot.knob("label").getValue())
-
-        self.filteredDotNameList = []
-
         self.setFixedSize(150, 65)
         self.setSizePolicy(QtGuiWidgets.QSizePolicy.Fixed, QtGuiWidgets.QSizePolicy.Fixed)
 
         self.itemDelegate = QtGuiWidgets.QStyledItemDelegate(self)
 
-        # self.listWidget = ConnectorAbstractView(parent)
-        # self.listWidget.hide()
-        # self.model = ConnectorListModel(self.filteredDotNameList)
-        # self.listWidget.setModel(self.model)
+        # all Connectors, the proxy picks the rows of the search results out of them
+        self.connectorModel = ConnectorListModel(connectorIndex, self)
+        self.resultsModel = ConnectorRowsProxyModel(self)
+        self.resultsModel.setSourceModel(self.connectorModel)
 
-        self.completer = QtGuiWidgets.QCompleter(self.filteredDotNameList, self)
+        self.completer = QtGuiWidgets.QCompleter(self)
         self.completer.setCompletionMode(QtGuiWidgets.QCompleter.UnfilteredPopupCompletion)
 
         self.completer.setPopup(ConnectorAbstractView())
-        self.completer.setModel(ConnectorListModel(self.filteredDotNameList))
+        self.completer.setModel(self.resultsModel)
 
         self.completer.popup().setMouseTracking(True)
         self.completer.popup().setStyleSheet("QAbstractItemView:item:hover{background-color:#484848;}")
@@ -311,8 +1419,27 @@ class LineEditConnectSelection(QtGuiWidgets.QLineEdit):
 
         self.setCompleter(self.completer)
 
-    def updateCompleterList(self):
-        self.completer.model().setStringList(self.filteredDotNameList)
+    def setConnectorIndex(self, connectorIndex):
+        """Lists the Connectors of the given index, clearing the search results."""
+
+        self.resultsModel.setRows([])
+        self.connectorModel.setConnectorIndex(connectorIndex)
+
+    def setResultRows(self, rows):
+        """
+        Args:
+            rows (list): rows of the ConnectorIndex to list in the completer, best match first
+        """
+
+        self.resultsModel.setRows(rows)
+
+    def firstResult(self):
+        """Returns the full name of the best matching Connector, None without any results."""
+
+        if not self.resultsModel.rows:
+            return None
+
+        return self.connectorModel.connectorIndex.names[self.resultsModel.rows[0]]
 
 
 class LineEditNaming(QtGuiWidgets.QLineEdit):
@@ -342,9 +1469,12 @@ class LabelConnector(QtGuiWidgets.QWidget):
     ):
         super(LabelConnector, self).__init__()
 
+        timer = startTimer("LabelConnector.__init__", uiType=uitype)
+
         self.node = node
         self.selectedConnectors = selectedConnectors
         self.connectors = connectors
+        self.connectorIndex = indexForConnectors(connectors or [])
         self.uiType = uitype
         self.shiftPressed = False
         self.ctrlPressed = False
@@ -352,24 +1482,40 @@ class LabelConnector(QtGuiWidgets.QWidget):
         self.centered_ui = False
         self.textOld = namingText
 
-        try:  # we have to try this in case no viewer exists or no active input is used
-            self.current_viewed_node = nuke.activeViewer().node().input(nuke.activeViewer().activeInput())
-        except Exception:
-            self.current_viewed_node = None
-
-        try:
-            self.active_viewer_input = nuke.activeViewer().activeInput()  # returns None if nothing is connected
-        except Exception:
-            # if there was no input, we set it to 1 (which equals to Num2 in Nuke, to avoid the first input)
-            self.active_viewer_input = None
+        self.storeViewerState()
 
-        if self.active_viewer_input is None:
-            self.active_viewer_input = 1
+        if timer:
+            timer.lap("index", connectors=len(self.connectorIndex), selection=len(selectedConnectors or []))
 
         if uitype == UIType.UI_DEFAULT:
             self.buttons = list()
+            self.buttonsByName = dict()
+            self.matchedRows = list()
+            self.highlightedRows = set()
+            self.usageRows = dict()  # row -> usage score, only rows that have been used
+            self.search = IncrementalSearch()  # matches of the previous queries, reused while typing
+            self.displayOrder = list()  # rows in the order they are shown
+            self.thumbnailLoader = None  # ThumbnailLoader, once connected
+            self.colorSlots = dict()  # hex color -> index of its rule in the stylesheet
+            self.virtualGrid = False
+            self.grid_view = None
+            self.grid_model = None
             self.clicked_connectors_list = list()
 
+            # hover previews wait until the mouse rests, moving over many Connectors only views the last one
+            self.hoveredRow = -1
+            self.hoverStart = 0.0
+            self.hoverTimer = QtCore.QTimer(self)
+            self.hoverTimer.setSingleShot(True)
+            self.hoverTimer.setInterval(HOVER_PREVIEW_DELAY)
+            self.hoverTimer.timeout.connect(self.previewHoveredConnector)
+
+            # thumbnails get requested once the UI rests, and only for the Connectors visible by then
+            self.thumbnailTimer = QtCore.QTimer(self)
+            self.thumbnailTimer.setSingleShot(True)
+            self.thumbnailTimer.setInterval(THUMBNAIL_DELAY)
+            self.thumbnailTimer.timeout.connect(self.loadVisibleThumbnails)
+
         # add a main widget in between to have transparent background
 
         self.main_widget = QtGuiWidgets.QWidget()
@@ -385,6 +1531,7 @@ class LabelConnector(QtGuiWidgets.QWidget):
 
         button_grid = QtGuiWidgets.QGridLayout()
         self.content_layout.addLayout(button_grid)
+        self.button_grid = button_grid
 
         # populate the UI based on the UIType
 
@@ -432,10 +1579,12 @@ class LabelConnector(QtGuiWidgets.QWidget):
             button_grid.addWidget(new_btn, row_counter, column_counter)
 
         elif uitype == UIType.UI_COLOR:
-            length = int(len(COLOR_LIST) / 2) - 1
+            # settings are read from labelConnectorCore, the names imported above are only copies
+            colors = labelConnectorCore.COLOR_LIST
+            length = int(len(colors) / 2) - 1
 
-            for color in COLOR_LIST:
-                new_btn = StandardButton(self, color, COLOR_LIST[color])
+            for color in colors:
+                new_btn = StandardButton(self, color, colors[color])
                 new_btn.clicked.connect(self.setColor)
                 button_grid.addWidget(new_btn, row_counter, column_counter)
 
@@ -468,52 +1617,17 @@ class LabelConnector(QtGuiWidgets.QWidget):
             self.hasInputField = True
 
         else:  # uitype == UIType.UI_DEFAULT
-            lenGrid = len(connectors)
-
-            length = math.ceil(math.sqrt(lenGrid))
-
-            for dot in connectors:
-                new_btn = ConnectorButton(self, dot, node)
-                new_btn.clicked.connect(self.connector_button_left_clicked)
-                new_btn.rightClicked.connect(self.connector_button_right_clicked)
-
-                button_grid.addWidget(new_btn, row_counter, column_counter)
-                self.buttons.append(new_btn)
-
-                column_counter += 1
-                if column_counter > length:
-                    row_counter += 1
-                    column_counter = 0
-
-            if connectors:
-                self.input = LineEditConnectSelection(self, connectors, node)
-                button_grid.addWidget(self.input, 1, length + 2)
+            self.input = LineEditConnectSelection(self, connectors or [], node, self.connectorIndex)
 
-                self.input.textEdited.connect(self.updateSearchMatches)
-                self.input.textChanged.connect(self.highlightButtonsMatchingResults)
-                self.input.returnPressed.connect(self.lineEnter)
-                self.input.completer.popup().pressed.connect(self.lineEnter)
-                self.input.completer.popup().currentIndexChanged.connect(self.highlightButtonsMatchingResults)
-
-                self.hasInputField = True
-                button_grid.addWidget(
-                    self.input.completer.popup(),
-                    2,
-                    length + 2,
-                    max(1, button_grid.rowCount() - 2),
-                    1,
-                )
-
-                if button_grid.rowCount() < 4:  # makes the popup smaller on smaller grids
-                    self.input.completer.popup().setMaximumHeight(65)
-                    button_grid.setRowStretch(2, 1)
-
-                button_grid.setColumnMinimumWidth(length + 1, 10)  # adds a little spacer
+            self.input.textEdited.connect(self.updateSearchMatches)
+            self.input.textChanged.connect(self.highlightButtonsMatchingResults)
+            self.input.returnPressed.connect(self.lineEnter)
+            self.input.completer.popup().pressed.connect(self.lineEnter)
+            self.input.completer.popup().currentIndexChanged.connect(self.highlightButtonsMatchingResults)
 
             # create Parent Button
-            new_btn = StandardButton(self, "Create New\nParent...", BUTTON_REGULARDARK_COLOR)
-            new_btn.clicked.connect(self.setupConnector)
-            button_grid.addWidget(new_btn, 0, length + 2)
+            self.parent_button = StandardButton(self, "Create New\nParent...", BUTTON_REGULARDARK_COLOR)
+            self.parent_button.clicked.connect(self.setupConnector)
 
             # explanation label at the bottom
             explanation_label = QtGuiWidgets.QLabel(self)
@@ -524,6 +1638,17 @@ class LabelConnector(QtGuiWidgets.QWidget):
 
             self.content_layout.addWidget(explanation_label)
 
+            if timer:
+                timer.lap("widgets")
+
+            self.updateConnectorButtons(relayout=True)
+
+            if timer:
+                timer.lap("buttons", virtualGrid=self.virtualGrid)
+
+        if timer and uitype != UIType.UI_DEFAULT:
+            timer.lap("widgets")
+
         self.setSizePolicy(QtGuiWidgets.QSizePolicy.Expanding, QtGuiWidgets.QSizePolicy.Expanding)
 
         self.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint)
@@ -535,9 +1660,288 @@ class LabelConnector(QtGuiWidgets.QWidget):
         if self.hasInputField:
             self.input.setFocus()
 
+        if timer:
+            timer.finish("window")
+
+    def storeViewerState(self):
+        """Remembers the currently viewed node, to be able to reset the Viewer after previewing."""
+
+        self.changed_viewed_node = False
+
+        try:  # we have to try this in case no viewer exists or no active input is used
+            self.current_viewed_node = nuke.activeViewer().node().input(nuke.activeViewer().activeInput())
+        except Exception:
+            self.current_viewed_node = None
+
+        try:
+            self.active_viewer_input = nuke.activeViewer().activeInput()  # returns None if nothing is connected
+        except Exception:
+            # if there was no input, we set it to 1 (which equals to Num2 in Nuke, to avoid the first input)
+            self.active_viewer_input = None
+
+        if self.active_viewer_input is None:
+            self.active_viewer_input = 1
+
+    def updateConnectorButtons(self, relayout=False):
+        """
+        Syncs the Connector buttons with the ConnectorIndex. Existing buttons are kept and only updated,
+        buttons are just created or deleted for Connectors that were added or removed.
+
+        Args:
+            relayout (bool, optional): layout the grid even if no button was added or removed. Defaults to False.
+        """
+
+        previous = self.buttons
+        previous_order = self.displayOrder
+        unused = self.buttonsByName
+        self.buttons = []
+        self.buttonsByName = {}
+
+        self.virtualGrid = len(self.connectorIndex) > VIRTUAL_GRID_THRESHOLD
+        self.updateUsage()
+
+        if self.virtualGrid:
+            if self.grid_view is None:
+                self.grid_model = ConnectorGridModel(self)
+                self.grid_view = ConnectorGridView(self)
+                self.grid_view.setModel(self.grid_model)
+                self.grid_view.leftClicked.connect(self.connectorLeftClicked)
+                self.grid_view.rightClicked.connect(self.connectorRightClicked)
+                self.grid_view.hovered.connect(self.connectorHovered)
+                self.grid_model.thumbnailsWanted.connect(self.thumbnailTimer.start)
+
+            self.grid_model.setConnectorIndex(self.connectorIndex, self.displayOrder if self.usageRows else None)
+
+            for button in unused.values():
+                button.deleteLater()
+
+            self.requestThumbnails()
+            self.layoutConnectorButtons()
+            return
+
+        for row, (connector, name, label) in enumerate(
+            zip(self.connectorIndex.connectors, self.connectorIndex.names, self.connectorIndex.labels)
+        ):
+            button = unused.pop(name, None)
+
+            if button is None:
+                button = ConnectorButton(self, connector, self.node, label)
+                button.clicked.connect(self.connector_button_left_clicked)
+                button.rightClicked.connect(self.connector_button_right_clicked)
+                button.hovered.connect(self.connector_button_hovered)
+            else:
+                button.updateConnector(connector, self.node, label)
+
+            button.row = row
+            if row not in self.connectorIndex.duplicateRows:
+                button.setDuplicate([])
+            self.buttons.append(button)
+            self.buttonsByName[name] = button
+
+        for button in unused.values():
+            button.deleteLater()
+
+        self.requestThumbnails()
+
+        for connectors in self.connectorIndex.duplicates.values():
+            names = [connector.fullName() for connector in connectors]
+            for name in names:
+                self.buttonsByName[name].setDuplicate([other for other in names if other != name])
+
+        self.updateColorSlots()
+
+        if relayout or unused or self.buttons != previous or self.displayOrder != previous_order:
+            self.layoutConnectorButtons()
+
+    def requestThumbnails(self):
+        """Schedules loadVisibleThumbnails, the missing thumbnails follow via thumbnailReady."""
+
+        loader = getThumbnailLoader()
+        if loader is None:
+            return
+
+        if self.thumbnailLoader is not loader:
+            self.thumbnailLoader = loader
+            loader.thumbnailReady.connect(self.thumbnailReady)
+
+        if not self.virtualGrid:  # the grid model asks for the rows it paints itself
+            self.thumbnailTimer.start()
+
+    def loadVisibleThumbnails(self):
+        """Gives the visible buttons or grid cells the thumbnail of their Connector, once the UI rests."""
+
+        if self.thumbnailLoader is None or not self.isVisible():
+            return
+
+        if self.virtualGrid:
+            self.grid_model.requestThumbnails(self.thumbnailLoader)
+            return
+
+        for button in self.buttons:
+            if button.isVisible() and not button.visibleRegion().isEmpty():
+                button.setThumbnail(self.thumbnailLoader.request(button.connector))
+
+    def thumbnailReady(self, name, pixmap):
+        if self.virtualGrid:
+            self.grid_model.setThumbnail(name, pixmap)
+        else:
+            button = self.buttonsByName.get(name)
+            if button is not None:
+                button.setThumbnail(pixmap)
+
+    def updateUsage(self):
+        """
+        Reads the usage scores of the shown Connectors, once per opening of the UI.
+        Often used Connectors come first in the grid and win ties in the search.
+        """
+
+        scores = usageScores()
+        rows = range(len(self.connectorIndex))
+
+        if scores:
+            self.usageRows = {row: scores[label] for row, label in zip(rows, self.connectorIndex.labels) if label in scores}
+        else:
+            self.usageRows = {}
+
+        used = sorted(self.usageRows, key=lambda row: (-self.usageRows[row], row))
+        self.displayOrder = used + [row for row in rows if row not in self.usageRows]
+
+    def updateColorSlots(self):
+        """
+        Points every Connector button to the color rule of the shared stylesheet.
+        The stylesheet itself only gets rebuilt if a new color shows up.
+        """
+
+        new_colors = [color for color in dict.fromkeys(button.color for button in self.buttons) if color not in self.colorSlots]
+
+        if new_colors:
+            for color in new_colors:
+                self.colorSlots[color] = len(self.colorSlots)
+            self.setStyleSheet(connectorButtonStyleSheet(list(self.colorSlots)))
+
+        for button in self.buttons:
+            button.setColorSlot(self.colorSlots[button.color])
+
+    def layoutConnectorButtons(self):
+        """Places all Connector buttons in a grid, with the search field and list next to it."""
+
+        # a fresh grid, as QGridLayout never shrinks its amount of rows and columns
+        old_grid = self.button_grid
+        while old_grid.count():
+            old_grid.takeAt(0)
+        self.content_layout.removeItem(old_grid)
+        old_grid.deleteLater()
+
+        button_grid = QtGuiWidgets.QGridLayout()
+        self.content_layout.insertLayout(0, button_grid)
+        self.button_grid = button_grid
+
+        column_counter, row_counter = 0, 0
+
+        if self.grid_view is not None:
+            self.grid_view.setVisible(self.virtualGrid)
+
+        if self.virtualGrid:
+            length = 0
+            self.grid_view.setFixedSize(self.grid_view.gridSize(len(self.connectorIndex)))
+            button_grid.addWidget(self.grid_view, 0, 0, 4, 1)
+
+        else:
+            length = math.ceil(math.sqrt(len(self.buttons)))
+
+            for row in self.displayOrder:
+                button_grid.addWidget(self.buttons[row], row_counter, column_counter)
+
+                column_counter += 1
+                if column_counter > length:
+                    row_counter += 1
+                    column_counter = 0
+
+        self.hasInputField = bool(len(self.connectorIndex))
+        self.input.setVisible(self.hasInputField)
+        self.input.completer.popup().setVisible(self.hasInputField)
+
+        if self.hasInputField:
+            button_grid.addWidget(self.input, 1, length + 2)
+            button_grid.addWidget(
+                self.input.completer.popup(),
+                2,
+                length + 2,
+                max(1, button_grid.rowCount() - 2),
+                1,
+            )
+
+            if button_grid.rowCount() < 4:  # makes the popup smaller on smaller grids
+                self.input.completer.popup().setMaximumHeight(65)
+                button_grid.setRowStretch(2, 1)
+            else:
+                self.input.completer.popup().setMaximumHeight(16777215)  # QWIDGETSIZE_MAX
+
+            button_grid.setColumnMinimumWidth(length + 1, 10)  # adds a little spacer
+
+        button_grid.addWidget(self.parent_button, 0, length + 2)
+
+    def reuse(self, node=None, connectors=None):
+        """
+        Prepares an existing default UI to be shown again, instead of building a new one.
+
+        Args:
+            node (node, optional): selected node. Defaults to None.
+            connectors (list, optional): Connectors to show. Defaults to None.
+        """
+
+        timer = startTimer("LabelConnector.reuse")
+
+        self.node = node
+        self.connectors = connectors
+        self.connectorIndex = indexForConnectors(connectors or [])
+        self.shiftPressed = False
+        self.ctrlPressed = False
+        self.altPressed = False
+
+        self.storeViewerState()
+
+        self.clicked_connectors_list = []
+        self.matchedRows = []
+        self.highlightedRows = set()
+
+        for button in self.buttons:
+            button.entered = False
+            if button.is_highlighted or button.selected:
+                button.selected = False
+                button.setStyleDefault()
+
+        if timer:
+            timer.lap("index", connectors=len(self.connectorIndex))
+
+        self.updateConnectorButtons()
+
+        if timer:
+            timer.lap("buttons", virtualGrid=self.virtualGrid)
+
+        self.input.node = node
+        self.input.dots = connectors or []
+        self.input.clear()
+        self.input.setConnectorIndex(self.connectorIndex)
+
+        self.adjustSize()
+        if self.width() < CONNECTORMINIMUMWIDTH:
+            self.resize(CONNECTORMINIMUMWIDTH, self.height())
+
+        # a hidden window shown again at the same size gets no resizeEvent, so it has to be placed here
+        self.moveBeneathCursor()
+
+        if self.hasInputField:
+            self.input.setFocus()
+
+        if timer:
+            timer.finish("layout")
+
     def resizeEvent(self, event):
         """Gui size is now known, so lets position it beneath the Mouse Cursor."""
 
+        timer = startTimer("LabelConnector.resizeEvent", uiType=self.uiType)
+
         # the setMinimumHeight method seems to do weird stuff, so lest just do it manually
 
         if self.uiType == UIType.UI_DEFAULT:
@@ -546,24 +1950,36 @@ class LabelConnector(QtGuiWidgets.QWidget):
 
         super(LabelConnector, self).resizeEvent(event)
 
+        if timer:
+            timer.lap("resize", width=event.size().width(), height=event.size().height())
+
         if not self.centered_ui:  # set position only once in the beginning
-            geo = self.frameGeometry()
+            self.moveBeneathCursor()
 
-            if self.uiType == UIType.UI_DEFAULT:
-                centerTo = QtGui.QGuiApplication.screenAt(QtGui.QCursor.pos()).geometry().center()
-            else:
-                centerTo = QtGui.QCursor.pos()
+        if timer:
+            timer.finish("position")
+
+    def moveBeneathCursor(self):
+        """Positions the UI beneath the Mouse Cursor, the default UI gets centered on the screen the cursor is on."""
+
+        geo = self.frameGeometry()
+
+        if self.uiType == UIType.UI_DEFAULT:
+            screen = QtGui.QGuiApplication.screenAt(QtGui.QCursor.pos()) or QtGui.QGuiApplication.primaryScreen()
+            centerTo = screen.geometry().center()
+        else:
+            centerTo = QtGui.QCursor.pos()
 
-            if self.uiType == UIType.UI_DEFAULT and self.connectors:  # slight offset here feels better
-                centerTo -= QtCore.QPoint(-int(geo.width() * 0.05), int(geo.height() * 0.2))
+        if self.uiType == UIType.UI_DEFAULT and self.connectors:  # slight offset here feels better
+            centerTo -= QtCore.QPoint(-int(geo.width() * 0.05), int(geo.height() * 0.2))
 
-            if self.uiType == UIType.UI_CONNECTORONLY:
-                centerTo += QtCore.QPoint(0, int(geo.height() * 0.2))
+        if self.uiType == UIType.UI_CONNECTORONLY:
+            centerTo += QtCore.QPoint(0, int(geo.height() * 0.2))
 
-            geo.moveCenter(centerTo)
-            self.move(geo.topLeft())
+        geo.moveCenter(centerTo)
+        self.move(geo.topLeft())
 
-            self.centered_ui = True
+        self.centered_ui = True
 
     def updateSearchMatches(self):
         """
@@ -571,59 +1987,75 @@ class LabelConnector(QtGuiWidgets.QWidget):
         This won't update when stepping through the completer list via up/down arrow keys.
         """
 
-        inputText = self.input.text().upper()
+        inputText = self.input.text()
 
-        self.input.filteredDotNameList = []
-        self.highlightButtons = []
+        self.matchedRows = []
+        ranked = []
 
         if inputText:
-            query = "*" + "*".join([inputText[j : j + 1] for j in range(len(inputText))]) + "*"
-
-            tempListUnsorted = []
-
-            for button in self.buttons:
-                if fnmatch.fnmatch(button.text(), query):
-                    self.highlightButtons.append(button)
-                    if button.text() not in tempListUnsorted:
-                        tempListUnsorted.append({"name": button.label, "connector": button.connector.name()})
+            self.matchedRows, ranked = self.search.search(inputText, self.connectorIndex.normalizedLabels, MAX_SEARCH_RESULTS, usage=self.usageRows)
 
-            for n in list(tempListUnsorted):
-                if n["name"].startswith(inputText):
-                    self.input.filteredDotNameList.append(n)
-                    tempListUnsorted.remove(n)
-
-            for n in list(tempListUnsorted):
-                if inputText in n["name"]:
-                    self.input.filteredDotNameList.append(n)
-                    tempListUnsorted.remove(n)
-
-            self.input.filteredDotNameList.extend(tempListUnsorted)
-
-        self.input.updateCompleterList()
+        self.input.setResultRows(ranked)
 
     def highlightButtonsMatchingResults(self):
         """Highlights all Buttons matching the search result. Except there is a perfect match, then just this one."""
 
         inputText = self.input.text().upper()
-
-        for button in self.buttons:
-            button.setStyleDefault()
+        highlighted = set()
 
         if inputText:
             selected_entry = self.input.completer.popup().currentIndex()
 
             if selected_entry.row() != -1:
-                connector_name = self.input.completer.model().data(selected_entry, QtCore.Qt.UserRole + 1)
+                connector_name = self.input.completer.model().data(selected_entry, ConnectorListModel.ConnectorRole)
             else:
                 connector_name = ""
 
-            for button in self.highlightButtons:
-                if connector_name == button.connector.name() and button.label == inputText:
-                    button.setStyleHighlighted()
-                    return
+            for row in self.matchedRows:
+                if connector_name == self.connectorIndex.names[row] and self.connectorIndex.labels[row] == inputText:
+                    highlighted = {row}
+                    break
+            else:
+                highlighted = set(self.matchedRows)
+
+        self.setHighlightedRows(highlighted)
+
+    def setHighlightedRows(self, rows):
+        """
+        Highlights the Connectors of the given rows, only touching the ones that actually change their state.
+
+        Args:
+            rows (set): rows of the ConnectorIndex to highlight
+        """
+
+        if self.virtualGrid:
+            self.grid_model.setHighlightedRows(rows)
+
+        else:
+            for row in self.highlightedRows - rows:
+                self.buttons[row].setStyleDefault()
+
+            for row in rows - self.highlightedRows:
+                self.buttons[row].setStyleHighlighted()
+
+        self.highlightedRows = rows
+
+    def setRowSelected(self, row, selected):
+        """
+        Marks the Connector of the given row as selected to create multiple Connected nodes.
+
+        Args:
+            row (int): row of the ConnectorIndex
+            selected (bool): selection state
+        """
+
+        if self.virtualGrid:
+            self.grid_model.setRowSelected(row, selected)
 
-            for button in self.highlightButtons:
-                button.setStyleHighlighted()
+        else:
+            button = self.buttons[row]
+            button.selected = selected
+            button.updateState()
 
     def keyPressEvent(self, event):
         """Catch key strokes, also to update highlighting of buttons."""
@@ -677,6 +2109,11 @@ class LabelConnector(QtGuiWidgets.QWidget):
     def update_connector_button_text(self):
         """Set connector button text based on pressed Modifier Keys."""
 
+        if self.virtualGrid:
+            # the grid paints the hovered cell based on the modifiers itself
+            self.grid_view.viewport().update()
+            return
+
         if self.shiftPressed and not (self.altPressed or self.ctrlPressed):
             for button in self.buttons:
                 if button.entered:
@@ -704,49 +2141,25 @@ class LabelConnector(QtGuiWidgets.QWidget):
 
         if not self.clicked_connectors_list:
             return
-        UNDO.begin(UNDO_EVENT_TEXT)
-
-        created_nodes = []
-        for connector in self.clicked_connectors_list:
-            n = createConnectingNodeAndConnect(connector)
-            created_nodes.append(n)
 
-        xPosFirst = created_nodes[0].xpos()
-        yPosFirst = created_nodes[0].ypos()
+        # a row in the middle of the Node Graph, where createNode would have put the first one
+        xPosFirst, yPosFirst = nuke.center()
+        positions = [(xPosFirst + 120 * i, yPosFirst) for i in range(len(self.clicked_connectors_list))]
 
-        for i, node in enumerate(created_nodes):
-            node.setXpos(xPosFirst + 120 * i)
-            node.setYpos(yPosFirst)
-            node.setSelected(True)
+        createConnectedNodes(self.clicked_connectors_list, positions)
+        recordUsage(self.clicked_connectors_list)
 
         self.clicked_connectors_list = []
 
-        UNDO.end()
-
     QtCore.Slot()
 
-    def make_connectors_btn_clicked(self):
-        UNDO.begin(UNDO_EVENT_TEXT)
-
-        for n in nuke.selectedNodes():
-            n.setSelected(False)
-
-        created_nodes = []
-
-        for connector in self.clicked_connectors_list:
-            n = createConnectingNodeAndConnect(connector)
-
-            n.setXYpos(connector.xpos(), connector.ypos() + 100)
-
-            created_nodes.append(n)
-
-        for node in created_nodes:
-            node.setSelected(True)
+    def make_connectors_btn_clicked(self):
+        positions = [(connector.xpos(), connector.ypos() + 100) for connector in self.clicked_connectors_list]
+        createConnectedNodes(self.clicked_connectors_list, positions)
+        recordUsage(self.clicked_connectors_list)
 
         self.clicked_connectors_list = []
 
-        UNDO.end()
-
         self.close()
 
     QtCore.Slot()
@@ -754,31 +2167,56 @@ class LabelConnector(QtGuiWidgets.QWidget):
     def connector_button_left_clicked(self):
         """Clicking actions based on pressed Modifier Keys"""
 
+        self.connectorLeftClicked(self.sender().row)
+
+    def rowConnector(self, row):
+        """
+        Args:
+            row (int): row in the ConnectorIndex
+
+        Returns:
+            node: Connector of the row, None if it has been deleted or relabeled since the UI got filled
+        """
+
+        connectors = self.connectorIndex.verified([self.connectorIndex.connectors[row]])
+        return connectors[0] if connectors else None
+
+    def connectorLeftClicked(self, row):
+        """
+        Clicking actions based on pressed Modifier Keys, for buttons as well as the virtualized grid.
+
+        Args:
+            row (int): row of the clicked Connector in the ConnectorIndex
+        """
+
+        connector = self.rowConnector(row)
+        if connector is None:
+            _log.warning("Connector %s has changed in the meantime", self.connectorIndex.names[row])
+            self.close()
+            return
+
         keyModifier = QtGuiWidgets.QApplication.keyboardModifiers()
 
         if keyModifier == QtCore.Qt.ControlModifier:
-            jumpKeepingPreviousSelection(self.sender().connector)
+            jumpKeepingPreviousSelection(connector)
+            recordUsage([connector])
 
         elif keyModifier == QtCore.Qt.AltModifier:
-            _showConnectorUI(self.sender().connector)
+            _showConnectorUI(connector)
             self.close()
 
         elif keyModifier == QtCore.Qt.ShiftModifier:
-            clicked_button = self.sender()
-            if clicked_button not in self.clicked_connectors_list:
-                self.clicked_connectors_list.append(clicked_button.connector)
-                clicked_button.setStyleSelected()
+            if connector not in self.clicked_connectors_list:
+                self.clicked_connectors_list.append(connector)
+                self.setRowSelected(row, True)
             else:
-                self.clicked_connectors_list.remove(clicked_button.connector)
-                if clicked_button.is_highlighted:
-                    clicked_button.setStyleHighlighted()
-                else:
-                    clicked_button.setStyleDefault()
+                self.clicked_connectors_list.remove(connector)
+                self.setRowSelected(row, False)
 
         else:
-            UNDO.begin(UNDO_EVENT_TEXT)
-            createConnectingNodeAndConnect(self.sender().connector, self.node)
-            UNDO.end()
+            with BatchEdit():
+                createConnectingNodeAndConnect(connector, self.node)
+            recordUsage([connector])
             self.close()
 
     QtCore.Slot()
@@ -786,11 +2224,25 @@ class LabelConnector(QtGuiWidgets.QWidget):
     def connector_button_right_clicked(self):
         """Set Viewer Input to the clicked Connector."""
 
+        self.connectorRightClicked(self.sender().row)
+
+    def connectorRightClicked(self, row):
+        """
+        Set Viewer Input to the clicked Connector, for buttons as well as the virtualized grid.
+
+        Args:
+            row (int): row of the clicked Connector in the ConnectorIndex
+        """
+
+        connector = self.rowConnector(row)
+        if connector is None:
+            return
+
         try:
-            if nuke.activeViewer().node().input(self.active_viewer_input) == self.sender().connector:
+            if nuke.activeViewer().node().input(self.active_viewer_input) == connector:
                 nuke.activeViewer().node().setInput(self.active_viewer_input, self.current_viewed_node)
             else:
-                nuke.activeViewer().node().setInput(self.active_viewer_input, self.sender().connector)
+                nuke.activeViewer().node().setInput(self.active_viewer_input, connector)
                 nuke.activeViewer().activateInput(self.active_viewer_input)
 
             self.changed_viewed_node = True
@@ -799,6 +2251,67 @@ class LabelConnector(QtGuiWidgets.QWidget):
             # nuke.tprint("Error setting Viewer Input: ", e)
             pass
 
+    def connector_button_hovered(self, entered):
+        """Starts or stops the hover preview of the Connector button."""
+
+        self.connectorHovered(self.sender().row if entered else -1)
+
+    def connectorHovered(self, row):
+        """
+        Schedules viewing the hovered Connector once the mouse rested on it for HOVER_PREVIEW_DELAY.
+        Every hover restarts the wait, so only the Connector the mouse stops on gets viewed.
+
+        Args:
+            row (int): row of the hovered Connector in the ConnectorIndex, -1 if the mouse left it
+        """
+
+        if not HOVER_PREVIEW:
+            return
+
+        if row < 0:
+            self.hoveredRow = -1
+            self.hoverTimer.stop()
+            return
+
+        if row != self.hoveredRow:
+            self.hoveredRow = row
+            self.hoverStart = time.perf_counter()
+
+        self.hoverTimer.start(HOVER_PREVIEW_DELAY)
+
+    def previewHoveredConnector(self):
+        """Views the hovered Connector, the original input gets restored on close like after right-clicking."""
+
+        row = self.hoveredRow
+        if row < 0 or row >= len(self.connectorIndex):
+            return
+
+        connector = self.rowConnector(row)
+        if connector is None:
+            return
+
+        start = time.perf_counter()
+
+        try:
+            viewer = nuke.activeViewer().node()
+            if viewer.input(self.active_viewer_input) == connector:
+                return
+
+            viewer.setInput(self.active_viewer_input, connector)
+            nuke.activeViewer().activateInput(self.active_viewer_input)
+            self.changed_viewed_node = True
+
+        except Exception:
+            return
+
+        now = time.perf_counter()
+        _log.debug(
+            "Hover preview of %s took %.1fms after hovering (viewer %.1fms)",
+            self.connectorIndex.names[row],
+            (now - self.hoverStart) * 1000.0,
+            (now - start) * 1000.0,
+        )
+
     def clickedJump(self):
         """Click on Jump To Parent"""
 
@@ -816,35 +2329,10 @@ class LabelConnector(QtGuiWidgets.QWidget):
 
         color = self.sender().interfaceColor
 
-        if color == BUTTON_REGULAR_COLOR:
-            color = nuke.defaultNodeColor("Dot")
+        if color == labelConnectorCore.BUTTON_REGULAR_COLOR:
+            color = defaultNodeColor("Dot")
 
-        UNDO.begin("Colorize Connector")
-
-        if self.selectedConnectors:
-            for node in self.selectedConnectors:
-                node.knob("tile_color").setValue(color)
-
-                if COLORIZE_CONNECTED:
-                    color = node.knob("tile_color").value()
-                    for x in node.dependent(nuke.INPUTS | nuke.HIDDEN_INPUTS, forceEvaluate=False):
-                        if color not in [BUTTON_REGULAR_COLOR, 0]:
-                            x.knob("tile_color").setValue(color)
-                        else:
-                            x.knob("tile_color").setValue(CONNECTOR_DEFAULT_COLOR)
-
-        else:
-            self.node.knob("tile_color").setValue(color)
-
-            if COLORIZE_CONNECTED:
-                color = self.node.knob("tile_color").value()
-                for x in self.node.dependent(nuke.INPUTS | nuke.HIDDEN_INPUTS, forceEvaluate=False):
-                    if color not in [BUTTON_REGULAR_COLOR, 0]:
-                        x.knob("tile_color").setValue(color)
-                    else:
-                        x.knob("tile_color").setValue(CONNECTOR_DEFAULT_COLOR)
-
-        UNDO.end()
+        colorizeConnectors(self.selectedConnectors or [self.node], color)
 
         self.close()
 
@@ -880,13 +2368,7 @@ class LabelConnector(QtGuiWidgets.QWidget):
     def selectChildren(self):
         """Click on Show all Connections"""
 
-        for i in nuke.selectedNodes():
-            i.setSelected(False)
-
-        for node in self.selectedConnectors:
-            for x in node.dependent(nuke.INPUTS | nuke.HIDDEN_INPUTS, forceEvaluate=False):
-                x.setSelected(True)
-
+        selectChildren(self.selectedConnectors)
         self.close()
 
     def lineEnter(self):
@@ -908,26 +2390,24 @@ class LabelConnector(QtGuiWidgets.QWidget):
                 input_text = self.input.text().upper()
 
             selected_entry = self.input.completer.popup().currentIndex()
-            connect_to = ""
+            connect_to = None
 
             if selected_entry.row() != -1:
-                connector_name = self.input.completer.model().data(selected_entry, QtCore.Qt.UserRole + 1)
-                for connector in self.connectors:
-                    if connector_name == connector.name():
-                        connect_to = connector
-                        break
+                connector_name = self.input.completer.model().data(selected_entry, ConnectorListModel.ConnectorRole)
+                connect_to = self.connectorIndex.byName.get(connector_name)
             else:
-                for connector in self.connectors:
-                    if input_text == connector.knob("label").getValue().upper():
-                        connect_to = connector
-                        break
-
-            if not connect_to and self.input.filteredDotNameList:
-                name_list = [d["name"] for d in self.input.filteredDotNameList]
-                for connector in self.connectors:
-                    if name_list[0].upper() == connector.knob("label").getValue().upper():
-                        connect_to = connector
-                        break
+                matches = self.connectorIndex.verified(self.connectorIndex.byNormalizedLabel.get(normalizeLabel(input_text), []))
+                # prefer the Connector the node can actually be connected to, if the label exists in several Groups
+                matches = sameGroupConnectors(matches, self.node if self.node and isConnectingNode(self.node) else None) or matches
+                if matches:
+                    connect_to = matches[0]
+
+            if not connect_to:
+                connect_to = self.connectorIndex.byName.get(self.input.firstResult())
+
+            if connect_to and not self.connectorIndex.verified([connect_to]):
+                _log.warning("The chosen Connector has changed in the meantime")
+                connect_to = None
 
             if connect_to:
                 keyModifier = QtGuiWidgets.QApplication.keyboardModifiers()
@@ -936,9 +2416,10 @@ class LabelConnector(QtGuiWidgets.QWidget):
                     jumpKeepingPreviousSelection(connect_to)
 
                 else:
-                    UNDO.begin(UNDO_EVENT_TEXT)
-                    createConnectingNodeAndConnect(connect_to, self.node)
-                    UNDO.end()
+                    with BatchEdit():
+                        createConnectingNodeAndConnect(connect_to, self.node)
+
+                recordUsage([connect_to])
 
         self.close()
 
@@ -971,6 +2452,15 @@ class LabelConnector(QtGuiWidgets.QWidget):
     def close(self):
         """Close the UI, reset the viewer to original state if it was altered."""
 
+        if self.uiType == UIType.UI_DEFAULT:
+            self.hoverTimer.stop()
+            self.hoveredRow = -1
+
+            # thumbnails nobody is going to see anymore
+            self.thumbnailTimer.stop()
+            if self.thumbnailLoader is not None:
+                self.thumbnailLoader.cancel()
+
         try:
             # if viewer input was changed, we set it back to the original input
             if self.changed_viewed_node:
@@ -999,515 +2489,381 @@ class LabelConnector(QtGuiWidgets.QWidget):
 #         node.knob("connectorName").setValue(connector.name())
 
 
-def addConnectingNodeButtons(connecting, connector):
+def _forceShowUI(node, dots):
     """
-    Adds "jump to source" and "open source settings" buttons to a node.
+    force to show UI despite there is already a label in the node.
+    Used to override existing connections.
     """
 
-    if not connecting.knob("connected"):
-        tab = nuke.Tab_Knob("connected", "Connected")
-        connecting.addKnob(tab)
-
-    if not connecting.knob("jumpToSource"):
-        jump_button = nuke.PyScript_Knob("jumpToSource", "Jump to Source")
-        jump_button.setCommand(
-            "n = nuke.thisNode()\n"
-            "input = n.input(0)\n"
-            "\n"
-            "if input:\n"
-            "    prevNodes = nuke.selectedNodes()\n"
-            "    for i in prevNodes:\n"
-            "        i.setSelected(False)\n"
-            "    input.setSelected(True)\n"
-            "    nuke.zoomToFitSelected()\n"
-            "    input.setSelected(False)\n"
-            "    for i in prevNodes:\n"
-            "        i.setSelected(True)\n"
-        )
-        connecting.addKnob(jump_button)
-
-    if not connecting.knob("connectorName"):
-        knob = nuke.String_Knob("connectorName", "Connector Name")
-        knob.setValue(connector.name())
-        knob.setVisible(False)
-        connecting.addKnob(knob)
-    else:
-        connecting.knob("connectorName").setValue(connector.name())
+    _showDefaultUI(node, dots)
 
 
-def createConnectingNodeAndConnect(connector, node=None):
+def _showDefaultUI(node=None, connectors=None, timer=None):
     """
-    Creates a to-be-connected Node based on 2D or 3D/Deep type node tree
-
-    Args:
-        dot (node): Nuke Dot Node
-        node (node): Optional Nuke Node, to prepend the created node
-
-    Returns:
-        node: New Node to be connected
+    show the default UI, reusing the previous one if there is one.
     """
 
-    nodeClass = "PostageStamp"
+    global _labelConnectorUI, _defaultConnectorUI
 
-    global _usePostageStamps
-    if not _usePostageStamps:
-        nodeClass = "NoOp"
-
-    connectingNode = None
-    connectorGiven = False
+    if _defaultConnectorUI is None:
+        _defaultConnectorUI = LabelConnector(node, connectors)
+    else:
+        _defaultConnectorUI.reuse(node, connectors)
 
-    if node:
-        if isConnectingNode(node):
-            connectingNode = node
-            connectorGiven = True
+    if timer:
+        timer.lap("ui")
 
-    if not connectingNode:
-        for n in nuke.selectedNodes():
-            n.setSelected(False)
-        connectingNode = nuke.createNode(nodeClass, inpanel=False)
+    _labelConnectorUI = _defaultConnectorUI
+    _labelConnectorUI.show()
+    _labelConnectorUI.activateWindow()
 
-    connectSuccess = connectNodeToDot(connectingNode, connector)
+    if timer:
+        timer.lap("show")
 
-    if not connectSuccess and _usePostageStamps and not connectorGiven:
-        xpos, ypos = connectingNode.xpos(), connectingNode.ypos()
-        nuke.delete(connectingNode)
-        for n in nuke.selectedNodes():
-            n.setSelected(False)
-        connectingNode = nuke.createNode("NoOp", inpanel=False)
-        connectingNode.setXYpos(xpos, ypos)
-        connectNodeToDot(connectingNode, connector)
 
-    elif not connectSuccess and _usePostageStamps and connectorGiven:
-        return
+def _showColorSelectionUI(selectedConnectors):
+    """
+    force to show UI with color options
+    """
 
-    if node and not connectorGiven:
-        connectingNode.setXpos((node.xpos() + int(node.screenWidth() / 2)) - int(connectingNode.screenWidth() / 2))
-        if connectingNode.Class() == "NoOp":
-            offset = 50
-        else:
-            offset = 100
-        connectingNode.setYpos(node.ypos() - offset)
+    global _labelConnectorUI
 
-        if not node.setInput(0, connectingNode):
-            nuke.delete(connectingNode)
-            return
+    _labelConnectorUI = LabelConnector(
+        selectedConnectors[0],
+        selectedConnectors=selectedConnectors,
+        uitype=UIType.UI_COLOR,
+    )
+    _labelConnectorUI.show()
 
-    connectingNode.setName(CONNECTED_KEY)
-    connectingNode.knob("label").setValue(connector["label"].getValue())
-    connectingNode.knob("tile_color").setValue(CONNECTOR_DEFAULT_COLOR)
-    connectingNode.knob("hide_input").setValue(True)
 
-    if COLORIZE_CONNECTED:
-        color = connector.knob("tile_color").value()
-        if color not in [BUTTON_REGULAR_COLOR, 0]:
-            connectingNode.knob("tile_color").setValue(color)
+def _showNamingUI(node, oldText=""):
+    """
+    force to show UI with color options
+    """
 
-    addConnectingNodeButtons(connectingNode, connector)
+    global _labelConnectorUI
 
-    return connectingNode
+    _labelConnectorUI = LabelConnector(node, uitype=UIType.UI_NAMING, namingText=oldText)
+    _labelConnectorUI.show()
 
 
-def connectNodeToDot(node, connector):
+def _showConnectorUI(node):
     """
-    Connects a connecting-Node to a Connector
-
-    Args:
-        node (node): any nuke node
-        dot (node): Connector
-
-    Returns:
-        bool: True if new node connection was successful
+    force to show UI with color options
     """
 
-    UNDO.begin(UNDO_EVENT_TEXT)
-    if node.setInput(0, connector):
-        if COLORIZE_CONNECTED:
-            color = connector.knob("tile_color").value()
-            if color not in [BUTTON_REGULAR_COLOR, 0]:
-                node.knob("tile_color").setValue(color)
-            else:
-                node.knob("tile_color").setValue(CONNECTOR_DEFAULT_COLOR)
-
-        UNDO.end()
-        return True
+    global _labelConnectorUI
 
-    UNDO.end()
-    return False
+    _labelConnectorUI = LabelConnector(node, selectedConnectors=[node], uitype=UIType.UI_CONNECTORONLY)
+    _labelConnectorUI.show()
 
 
-def jumpKeepingPreviousSelection(node):
+def labelConnector():
     """
-    Jump to node without destroyng previous selection of nodes
-
-    Args:
-        node (node): any nuke node
+    Entry function. Determines, which UI to open based on context.
     """
 
-    prev_nodes = nuke.selectedNodes()
-
-    for i in prev_nodes:
-        i.setSelected(False)
+    timer = startTimer("labelConnector")
 
-    node.setSelected(True)
-    nuke.zoomToFitSelected()
-    node.setSelected(False)
+    if _prewarmer is not None:
+        _prewarmer.stop()
 
-    for i in prev_nodes:
-        i.setSelected(True)
+    try:
+        _labelConnector(timer)
+    finally:
+        if timer:
+            timer.finish()
 
 
-def getAllConnectors():
+def _labelConnector(timer):
     """
-    get all Connectors with a valid label, warn if there are double entries found.
+    Body of labelConnector, reporting its phases to the given PhaseTimer.
 
-    Returns:
-        list: list containing all connectors
+    Args:
+        timer (PhaseTimer): timer of this call, None if PROFILING is off
     """
 
-    # filtered_connectors = list()
-    # compare_list = list()
-    # double_entries_bool = False
-    # double_entries_list = list()
-
-    # keep compatibility with older versions, so we also search for dots
-    all_dots = [node for node in nuke.allNodes("Dot") if node["label"].value() and isConnector(node)]
-    # all_postage_stamps = [
-    #     node for node in nuke.allNodes("PostageStamp") if node.knob("disable").value() is False and node.knob("label").value() and isConnector(node)
-    # ]
-
-    all_noops = [node for node in nuke.allNodes("NoOp") if node["label"].value() and isConnector(node)]
+    nodes = nuke.selectedNodes()
 
-    all_connectors = all_dots + all_noops
+    if timer:
+        timer.lap("selection", selection=len(nodes))
 
-    # for connector in all_connectors:
-    # check if ConnectorDot Label has already been used
-    # if connector["label"].value() not in compare_list:
-    # filtered_connectors.append(connector)
-    # compare_list.append(connector["label"].value())
-    # else:
-    #     _log.error("Double Label Entry found on Connector Dots, skipping dot: {} '{}' ".format(connector.name(), connector["label"].value()))
-    #     double_entries_bool = True
-    #     double_entries_list.append(connector)
+    connector_index = getConnectorIndex(resolved=True)
+    all_connectors = connector_index.connectors
 
-    # if double_entries_bool:
-    #     message = "Skipped following Connector Dots (Label already used): \n \n"
-    #     for doubleDot in double_entries_list:
-    #         message += "{} '{}' \n".format(doubleDot.name(), doubleDot["label"].value())
-    #     nuke.message(message)
+    if timer:
+        timer.lap("scan", connectors=len(all_connectors))
 
-    all_connectors.sort(key=lambda connector: connector.knob("label").value())
-    return all_connectors
+    onlyConnectorsSelected = all(isConnector(node) for node in nodes)
+    connectedSth = bool(reconnectNodes(nodes, connector_index))
 
+    if timer:
+        timer.lap("reconnect")
 
-def getAllConnectorLabels():
-    """returns a list with all currently used labels"""
+    if (len(nodes) > 1 or connectedSth) and not onlyConnectorsSelected:
+        # with more than one node or when connections were made, no new Dots will be set up thus no UI shown.
+        # except we have one or mulitple parents
+        return
 
-    # keep compatibility with older versions, so we also search for dots
+    global _labelConnectorUI
 
-    all_dots = [node for node in nuke.allNodes("Dot") if node["label"].value() and isConnector(node)]
-    # all_postage_stamps = [
-    #     node for node in nuke.allNodes("PostageStamp") if node.knob("disable").value() is False and node.knob("label").value() and isConnector(node)
-    # ]
+    if nodes:
+        node = nodes[0]
 
-    all_noops = [node for node in nuke.allNodes("NoOp") if node["label"].value() and isConnector(node)]
+        if onlyConnectorsSelected:
+            _labelConnectorUI = LabelConnector(node, selectedConnectors=nodes, uitype=UIType.UI_CONNECTORONLY)
+            _showUI(_labelConnectorUI, timer)
+            return
 
-    all_connectors = all_dots + all_noops
+        if isConnectingAndConnectedCorrectly(node):
+            _labelConnectorUI = LabelConnector(node, all_connectors, uitype=UIType.UI_CHILDRENONLY)
+            _showUI(_labelConnectorUI, timer)
+            return
 
-    connector_dot_labels = [connector["label"].value() for connector in all_connectors]
+        if not hasPossibleInputs(node):
+            _labelConnectorUI = LabelConnector(node, uitype=UIType.UI_NAMING)
+            _showUI(_labelConnectorUI, timer)
+            return
 
-    return connector_dot_labels
+        # will create  a prepending connector
+        _showDefaultUI(node, all_connectors, timer)
+        return
 
+    # will create a standalone connector
+    _showDefaultUI(connectors=all_connectors, timer=timer)
+    return
 
-def isConnectingAndConnectedCorrectly(node):
-    """returns if the node is connected to the correct parent."""
 
-    if not node.input(0):
-        return False
-    return node.knob("label").getValue() == node.input(0).knob("label").getValue() and isConnectingNode(node)
+def _showUI(ui, timer=None):
+    """
+    Shows a freshly built UI.
 
+    Args:
+        ui (LabelConnector): UI to show
+        timer (PhaseTimer, optional): timer to report the "ui" and "show" phases to. Defaults to None.
+    """
 
-def isConnector(node):
-    return node.name().startswith(CONNECTOR_KEY)
+    if timer:
+        timer.lap("ui")
 
+    ui.show()
 
-def isConnectingNode(node):
-    return node.name().startswith(CONNECTED_KEY)
+    if timer:
+        timer.lap("show")
 
 
-def _forceShowUI(node, dots):
+class Prewarmer(QtCore.QObject):
     """
-    force to show UI despite there is already a label in the node.
-    Used to override existing connections.
+    Builds the ConnectorIndex and a hidden default UI while Nuke is idle, so the first shortcut press is as fast as later ones.
+    Each step runs from a zero-delay timer, any key press or mouse click stops the remaining work.
     """
 
-    global _labelConnectorUI
+    STOP_EVENTS = [QtCore.QEvent.KeyPress, QtCore.QEvent.MouseButtonPress, QtCore.QEvent.Wheel]
 
-    _labelConnectorUI = LabelConnector(node, dots)
-    _labelConnectorUI.show()
+    def __init__(self, parent=None):
+        super(Prewarmer, self).__init__(parent)
 
+        self.steps = None
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.step)
 
-def _showColorSelectionUI(selectedConnectors):
-    """
-    force to show UI with color options
-    """
+    def start(self):
+        """Starts pre-warming once Nuke is idle, restarts if it is already running."""
 
-    global _labelConnectorUI
+        app = QtGuiWidgets.QApplication.instance()
+        if app is None:
+            return
 
-    _labelConnectorUI = LabelConnector(
-        selectedConnectors[0],
-        selectedConnectors=selectedConnectors,
-        uitype=UIType.UI_COLOR,
-    )
-    _labelConnectorUI.show()
+        self.stop()
+        self.steps = self.run()
+        app.installEventFilter(self)
+        self.timer.start()
 
+    def stop(self):
+        """Stops the remaining work, whatever has been built so far is kept."""
 
-def _showNamingUI(node, oldText=""):
-    """
-    force to show UI with color options
-    """
+        self.timer.stop()
+        self.steps = None
 
-    global _labelConnectorUI
+        app = QtGuiWidgets.QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(self)
 
-    _labelConnectorUI = LabelConnector(node, uitype=UIType.UI_NAMING, namingText=oldText)
-    _labelConnectorUI.show()
+    def step(self):
+        if self.steps is None:
+            return
 
+        try:
+            next(self.steps)
+        except StopIteration:
+            self.stop()
+            return
+        except Exception:
+            _log.exception("pre-warming failed")
+            self.stop()
+            return
 
-def _showConnectorUI(node):
-    """
-    force to show UI with color options
-    """
+        self.timer.start()
 
-    global _labelConnectorUI
+    def run(self):
+        """The pre-warm steps, Nuke gets back control after each yield."""
 
-    _labelConnectorUI = LabelConnector(node, selectedConnectors=[node], uitype=UIType.UI_CONNECTORONLY)
-    _labelConnectorUI.show()
+        timer = startTimer("prewarm")
 
+        connectors = getConnectorIndex(resolved=True).connectors
 
-def hasPossibleInputs(node):
-    """
-    workaround to find out if a node can have connections. Because the "inputs" are still there
-    and could be forcefully connected to sth.
-    Also ignore IGNORECLASSES.
-    """
-    return "hide_input" in node.knobs() and not node.Class() in IGNORECLASSES
+        if timer:
+            timer.lap("scan", connectors=len(connectors))
+        yield
 
+        global _defaultConnectorUI
 
-def setConnectorSettings(connector, txt):
-    """
-    sets defaults for connectorDots like font size and sets label.
+        if _defaultConnectorUI is None:
+            _defaultConnectorUI = LabelConnector(None, connectors)
+        elif not _defaultConnectorUI.isVisible():
+            _defaultConnectorUI.reuse(None, connectors)
+        else:
+            return
 
-    Args:
-        dot (node): ConnectorDot
-        txt (str): desired label text
-    """
-    connector.setName(CONNECTOR_KEY)
-    # connector.knob("note_font_size").setValue(22)
-    connector.knob("label").setValue(txt.upper())
-    # connector.knob("postage_stamp").setValue(False)
-
-    if BOLD_LABELS:
-        current_font = connector.knob("note_font").value()
-        connector.knob("note_font").setValue(f"{current_font} Bold")
-
-
-def addConnectorNodeButtons(node):
-    """Adds "Select all Children" button to a node."""
-
-    tab = nuke.Tab_Knob("connector", "Connector")
-    node.addKnob(tab)
-
-    select_button = nuke.PyScript_Knob("selectChildren", "Select all Children")
-    select_button.setCommand(
-        "n = nuke.thisNode()\n"
-        "for i in nuke.selectedNodes():\n"
-        "    i.setSelected(False)\n"
-        "\n"
-        "for x in n.dependent(nuke.INPUTS | nuke.HIDDEN_INPUTS, forceEvaluate=False):\n"
-        "    x.setSelected(True)\n"
-    )
-    node.addKnob(select_button)
+        if timer:
+            timer.lap("ui")
+        yield
 
+        # parses the stylesheets now instead of with the first show()
+        _defaultConnectorUI.ensurePolished()
 
-def makeConnector(node, text, textOld=""):
-    """
-    Creates a new Connector, or renames an existing selected one alongside all dependent nodes.
-    """
-    text = text.strip(" ").upper()
+        if timer:
+            timer.finish("polish")
 
-    if not text:
-        return
+    def eventFilter(self, object, event):
+        if event.type() in self.STOP_EVENTS:
+            self.stop()
 
-    # if text in getAllConnectorLabels():
-    #     nuke.message("Label already in use")
-    #     return
+        return False
 
-    UNDO.begin(UNDO_EVENT_TEXT)
 
-    if node:
-        if node.Class() in ["Dot", "NoOp"] and isConnector(node):
-            # rename existing ConnectorDot alongside dependent Nodes
-            node["label"].setValue(text)
-            for x in node.dependent(nuke.INPUTS | nuke.HIDDEN_INPUTS, forceEvaluate=False):
-                if x["label"].getValue() == textOld:
-                    x["label"].setValue(text)
+_prewarmer = None
 
-        else:  # attach new ConnectorDot Node to any Node
-            node = nuke.createNode("NoOp", inpanel=False)
-            setConnectorSettings(node, text)
-            node.setYpos(node.ypos() + 50)
-            addConnectorNodeButtons(node)
 
-    else:  # create new independent ConnectorDot
-        node = nuke.createNode("NoOp", inpanel=False)
-        setConnectorSettings(node, text)
-        addConnectorNodeButtons(node)
+def schedulePrewarm():
+    """
+    Pre-warms the Connector index and the default UI as soon as Nuke is idle, see Prewarmer.
+    """
 
-    UNDO.end()
+    global _prewarmer
 
+    if _prewarmer is None:
+        _prewarmer = Prewarmer()
 
-def interface2rgb(hexValue):
-    """
-    Convert a color stored as a 32 bit value as used by nuke for interface colors to normalized rgb values.
+    _prewarmer.start()
 
-    Args:
-        hexValue ([type]): [description]
-        normalize (bool, optional): [description]. Defaults to True.
 
-    Returns:
-        [type]: [description]
+def enablePrewarm():
+    """
+    Pre-warms now and after every script load. Meant to be called from menu.py.
     """
-    return [(0xFF & hexValue >> i) / 255.0 for i in [24, 16, 8]]
 
+    nuke.addOnScriptLoad(schedulePrewarm)
+    schedulePrewarm()
 
-def rgb2interface(rgb):
-    """
-    Convert a color stored as rgb values to a 32 bit value as used by nuke for interface colors.
 
-    Args:
-        rgb ([type]): [description]
+class AuditPanel(QtGuiWidgets.QWidget):
+    """Shows an AuditReport as a sortable table, double click jumps to the node."""
 
-    Returns:
-        [type]: [description]
-    """
-    if len(rgb) == 3:
-        rgb = rgb + (255,)
+    COLUMNS = ["Problem", "Node", "Label", "Details"]
 
-    return int("%02x%02x%02x%02x" % rgb, 16)
+    def __init__(self, report=None, scoped=None):
+        super(AuditPanel, self).__init__()
 
+        self.scoped = scoped
 
-def getTileColor(node=None):
-    """
-    If a node has it's color set automatically, the 'tile_color' knob will return 0.
-    If so, this function will scan through the preferences to find the correct color value.
+        self.setWindowTitle("Label Connector - Audit")
+        self.setWindowFlags(QtCore.Qt.Tool | QtCore.Qt.WindowStaysOnTopHint)
+        self.resize(800, 400)
 
-    Args:
-        node ([type], optional): [description]. Defaults to None.
+        self.summary = QtGuiWidgets.QLabel(self)
 
-    Returns:
-        [type]: [description]
-    """
-    node = node or nuke.selectedNode()
-    interfaceColor = node.knob("tile_color").value()
+        refresh_button = QtGuiWidgets.QPushButton("Refresh", self)
+        refresh_button.clicked.connect(self.refresh)
 
-    if interfaceColor == 0 or interfaceColor == nuke.defaultNodeColor(node.Class()) or interfaceColor == 3435973632:
-        interfaceColor = BUTTON_REGULAR_COLOR
+        header_layout = QtGuiWidgets.QHBoxLayout()
+        header_layout.addWidget(self.summary, 1)
+        header_layout.addWidget(refresh_button)
 
-    return interfaceColor
+        self.table = QtGuiWidgets.QTableWidget(0, len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtGuiWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QtGuiWidgets.QAbstractItemView.SelectRows)
+        self.table.cellDoubleClicked.connect(self.jumpToRow)
 
+        layout = QtGuiWidgets.QVBoxLayout(self)
+        layout.addLayout(header_layout)
+        layout.addWidget(self.table)
 
-def rgb2hex(rgbaValues):
-    """
-    Convert a color stored as normalized rgb values to a hex.
+        if report is None:
+            self.refresh()
+        else:
+            self.setReport(report)
 
-    Args:
-        rgbaValues ([type]): [description]
+    def refresh(self):
+        """Audits the script again."""
 
-    Returns:O
-        [type]: [description]
-    """
-    if len(rgbaValues) < 3:
-        return
-    return "#%02x%02x%02x" % (
-        int(rgbaValues[0] * 255),
-        int(rgbaValues[1] * 255),
-        int(rgbaValues[2] * 255),
-    )
+        self.setReport(auditConnections(self.scoped))
 
+    def setReport(self, report):
+        """
+        Args:
+            report (AuditReport): report to show
+        """
 
-def hex2rgb(hexColor):
-    """
-    Convert a color stored as hex to rgb values.
+        self.report = report
 
-    Args:
-        hexColor ([type]): [description]
+        if report.ok:
+            self.summary.setText(f"No problems found in {report.connectors} Connectors and {report.connected} Connected nodes.")
+        else:
+            counts = ", ".join(f"{len(issues)} {kind}" for kind, issues in report.byKind().items())
+            self.summary.setText(f"{len(report)} problems: {counts}")
 
-    Returns:
-        [type]: [description]
-    """
-    hexColor = hexColor.lstrip("#")
-    return tuple(int(hexColor[i : i + 2], 16) for i in (0, 2, 4))
+        # sorting while filling would move rows around underneath us
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(report))
 
+        for row, issue in enumerate(report):
+            for column, text in enumerate([issue.kind, issue.node, issue.label, issue.detail]):
+                self.table.setItem(row, column, QtGuiWidgets.QTableWidgetItem(text))
 
-def labelConnector():
-    """
-    Entry function. Determines, which UI to open based on context.
-    """
+        self.table.setSortingEnabled(True)
+        self.table.resizeColumnsToContents()
 
-    connectedSth = False
-    onlyConnectorsSelected = True
-    nodes = nuke.selectedNodes()
-    all_connectors = getAllConnectors()
-
-    for node in nodes:
-        if not isConnector(node):
-            onlyConnectorsSelected = False
-            if node["label"].value() and not isConnectingAndConnectedCorrectly(node):
-                if node.knob("connectorName"):
-                    connectorName = node.knob("connectorName").value()
-                    connector = nuke.toNode(connectorName)
-                    if connector:
-                        if connectNodeToDot(node, connector):
-                            connectedSth = True
-                        continue
-
-                for connector in all_connectors:
-                    if node["label"].value() == connector["label"].value():
-                        # Label Match has been found, try to connect the two Nodes
-                        if connectNodeToDot(node, connector):
-                            connectedSth = True
-                        break
+    def jumpToRow(self, row, column):
+        node = nuke.toNode("root." + self.table.item(row, 1).text())
+        if node:
+            jumpKeepingPreviousSelection(node)
 
-    if (len(nodes) > 1 or connectedSth) and not onlyConnectorsSelected:
-        # with more than one node or when connections were made, no new Dots will be set up thus no UI shown.
-        # except we have one or mulitple parents
-        return
 
-    global _labelConnectorUI
+_auditPanel = None
 
-    if nodes:
-        node = nodes[0]
 
-        if onlyConnectorsSelected:
-            _labelConnectorUI = LabelConnector(node, selectedConnectors=nodes, uitype=UIType.UI_CONNECTORONLY)
-            _labelConnectorUI.show()
-            return
+def showAuditPanel(scoped=None):
+    """
+    Audits the script and shows the result in a panel. Meant for the menu.
 
-        if isConnectingAndConnectedCorrectly(node):
-            _labelConnectorUI = LabelConnector(node, all_connectors, uitype=UIType.UI_CHILDRENONLY)
-            _labelConnectorUI.show()
-            return
+    Args:
+        scoped (bool, optional): audit inside all Groups as well. Defaults to SCOPED_DISCOVERY.
+    """
 
-        if not hasPossibleInputs(node):
-            _labelConnectorUI = LabelConnector(node, uitype=UIType.UI_NAMING)
-            _labelConnectorUI.show()
-            return
+    global _auditPanel
 
-        # will create  a prepending connector
-        _labelConnectorUI = LabelConnector(node, all_connectors)
-        _labelConnectorUI.show()
-        return
+    if _auditPanel is None:
+        _auditPanel = AuditPanel(scoped=scoped)
+    else:
+        _auditPanel.scoped = scoped
+        _auditPanel.refresh()
 
-    # will create a standalone connector
-    _labelConnectorUI = LabelConnector(connectors=all_connectors)
-    _labelConnectorUI.show()
-    return
+    _auditPanel.show()
+    _auditPanel.raise_()
+    _auditPanel.activateWindow()
@@ -0,0 +1,2170 @@
+"""
+labelConnectorCore - the Connector logic of labelConnector, without any Qt.
+
+Finding, creating, connecting, renaming and colorizing Connectors lives here, so it's cheap to import at startup
+and also works headless, e.g. in "nuke -t" sessions on the farm. The UI in labelConnector builds on top of it.
+
+USAGE
+
+import labelConnectorCore
+labelConnectorCore.getAllConnectors()
+labelConnectorCore.repairAllConnections()
+
+"""
+
+import nuke
+
+import collections.abc
+import functools
+import heapq
+import json
+import logging
+import os
+import time
+
+
+_log = logging.getLogger("Label Connector")
+
+BUTTON_REGULAR_COLOR = 673720575
+CONNECTOR_DEFAULT_COLOR = 1347440895
+
+CONNECTOR_KEY = "Connector"
+CONNECTED_KEY = "Connected"
+CONNECTOR_CLASSES = ["Dot", "NoOp"]  # keep compatibility with older versions, so we also search for dots
+
+UNDO = nuke.Undo()
+UNDO_EVENT_TEXT = "Label Connector"
+
+BOLD_LABELS = True  # set typo of Connectors to Bold
+COLORIZE_CONNECTED = True
+SCOPED_DISCOVERY = False  # also find Connectors inside Groups and Gizmos, starting from the root
+USE_MANIFEST = False  # keep a manifest of the Connectors on the root node, so lookups after opening a script skip the scan
+MANIFEST_KNOB = "labelConnectorManifest"
+USAGE_RANKING = False  # show often and recently used Connectors first, instead of sorting them alphabetically
+USAGE_FILE = os.path.join(os.path.expanduser("~"), ".nuke", "labelConnectorUsage.json")
+USAGE_HALF_LIFE_DAYS = 7.0  # a use only counts half after this many days
+USAGE_MAX_ENTRIES = 5000  # labels kept over all scripts, the least used ones get dropped
+ALLOW_DUPLICATE_LABELS = False  # allow creating or renaming Connectors to a label another Connector already uses
+
+COLOR_CACHE_SIZE = 1024  # interface color -> hex conversions kept in memory
+
+# time the phases of the entry point and the UI, reported via the "Label Connector" logger (level INFO)
+PROFILING = os.environ.get("LABELCONNECTOR_PROFILING", "") not in ["", "0"]
+PROFILING_CALLBACK = None  # optional, called with (operation, total seconds, [(phase, seconds)], info dict)
+
+
+_usePostageStamps = False
+_connectorIndex = None  # index handed out last, reused by the UI
+_groupIndexes = {}  # group full name -> ConnectorIndex of the nodes directly inside that group
+_scopedIndex = None
+_defaultNodeColors = {}  # node class -> default tile color from the preferences, cached per session
+_batchEdit = None  # outermost BatchEdit that is currently open
+_manifest = None  # ConnectorManifest of the current script, see getManifest
+_usageStore = None  # UsageStore, read once per session
+
+
+COLOR_LIST = {
+    "Red": 1277436927,
+    "Orange": 2017657087,
+    "Yellow": 2154504703,
+    "Green": 793519103,
+    "Dark Green": 304619007,
+    "Cyan": 592071935,
+    "Blue": 556482559,
+    "Dark Blue": 320482047,
+    "Purple": 975388415,
+    "Default": BUTTON_REGULAR_COLOR,
+}
+
+# you can add more Classes that you don't want to create Connections on.
+# Classes with no Inputs like Reads, Backdrops,... will already be ignored
+IGNORECLASSES = ["Viewer"]
+
+
+def configure(**settings):
+    """
+    Changes settings of this module, the one place they are read from. Meant for a menu.py,
+    also available as labelConnector.configure for setups that used to set them on the UI module.
+
+    labelConnectorCore.configure(COLORIZE_CONNECTED=False, _usePostageStamps=True)
+
+    Args:
+        **settings: setting name -> new value
+
+    Raises:
+        AttributeError: for names that aren't a setting, so typos don't go unnoticed
+    """
+
+    module = globals()
+
+    for name in settings:
+        if name not in module or not (name.isupper() or name == "_usePostageStamps"):
+            raise AttributeError("labelConnectorCore has no setting {!r}".format(name))
+
+    module.update(settings)
+
+    # CONNECTOR_KEY and CONNECTOR_CLASSES decide what counts as a Connector
+    invalidateConnectorIndex()
+
+
+class PhaseTimer:
+    """Measures the consecutive phases of one operation. Only created when PROFILING is on, see startTimer."""
+
+    def __init__(self, operation, **info):
+        self.operation = operation
+        self.info = info
+        self.phases = []
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, phase, **info):
+        """
+        Ends the current phase.
+
+        Args:
+            phase (str): name of the phase that just ended
+            **info: additional numbers to report, like the amount of Connectors
+        """
+
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+        self.info.update(info)
+
+    def finish(self, phase=None, **info):
+        """
+        Ends the operation and reports it to the logger and PROFILING_CALLBACK.
+
+        Args:
+            phase (str, optional): name of the last phase, if it hasn't been ended via lap. Defaults to None.
+            **info: additional numbers to report
+        """
+
+        if phase:
+            self.lap(phase)
+        self.info.update(info)
+
+        total = time.perf_counter() - self._start
+
+        _log.info(
+            "%s took %.1fms (%s) %s",
+            self.operation,
+            total * 1000.0,
+            ", ".join("{} {:.1f}ms".format(name, seconds * 1000.0) for name, seconds in self.phases),
+            self.info,
+        )
+
+        if PROFILING_CALLBACK:
+            try:
+                PROFILING_CALLBACK(self.operation, total, list(self.phases), dict(self.info))
+            except Exception:
+                _log.exception("profiling callback failed")
+
+
+def startTimer(operation, **info):
+    """Returns a PhaseTimer if PROFILING is on, otherwise None so the call sites can skip all timing."""
+
+    if PROFILING:
+        return PhaseTimer(operation, **info)
+    return None
+
+
+class BatchEdit:
+    """
+    Collects the knob edits of one user action and applies them in one pass, all within a single undo event.
+    Nested BatchEdits join the outermost one, so helpers can open one without caring whether their caller did.
+    Knob values set via setKnobValue only change when the outermost BatchEdit closes, connections are made right away.
+
+    with BatchEdit("Colorize Connector"):
+        setKnobValue(node, "tile_color", color)
+    """
+
+    def __init__(self, name=UNDO_EVENT_TEXT):
+        self.name = name
+        self.edits = {}  # (node, knob) -> value, the last value set wins
+
+    def __enter__(self):
+        global _batchEdit
+
+        if _batchEdit is None:
+            UNDO.begin(self.name)
+            _batchEdit = self
+
+        return _batchEdit
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _batchEdit
+
+        if _batchEdit is not self:
+            return False
+
+        try:
+            if exc_type is not None:
+                # nodes created and connected so far stay, so they get their labels and colors as well
+                # instead of being left half set up. The exception itself is raised on.
+                _log.warning("%s failed, applying the %d knob edits collected so far", self.name, len(self.edits))
+
+            self.apply()
+        finally:
+            _batchEdit = None
+            UNDO.end()
+
+        return False
+
+    def setValue(self, node, knob, value):
+        self.edits[(node, knob)] = value
+
+    def apply(self):
+        """Applies all collected edits, values that wouldn't change are skipped."""
+
+        edits, self.edits = self.edits, {}
+
+        for (node, knob), value in edits.items():
+            try:
+                target = node[knob]
+                if target.value() != value:
+                    target.setValue(value)
+            except ValueError:  # node has been deleted in the meantime
+                continue
+
+
+def setKnobValue(node, knob, value):
+    """
+    Sets a knob value, deferred to the end of the current BatchEdit if there is one.
+
+    Args:
+        node (node): any nuke node
+        knob (str): knob name
+        value (Any): new value
+    """
+
+    if _batchEdit is not None:
+        _batchEdit.setValue(node, knob, value)
+    else:
+        node[knob].setValue(value)
+
+
+def addConnectingNodeButtons(connecting, connector):
+    """
+    Adds "jump to source" and "open source settings" buttons to a node.
+    """
+
+    if not connecting.knob("connected"):
+        tab = nuke.Tab_Knob("connected", "Connected")
+        connecting.addKnob(tab)
+
+    if not connecting.knob("jumpToSource"):
+        jump_button = nuke.PyScript_Knob("jumpToSource", "Jump to Source")
+        jump_button.setCommand(
+            "n = nuke.thisNode()\n"
+            "input = n.input(0)\n"
+            "\n"
+            "if input:\n"
+            "    prevNodes = nuke.selectedNodes()\n"
+            "    for i in prevNodes:\n"
+            "        i.setSelected(False)\n"
+            "    input.setSelected(True)\n"
+            "    nuke.zoomToFitSelected()\n"
+            "    input.setSelected(False)\n"
+            "    for i in prevNodes:\n"
+            "        i.setSelected(True)\n"
+        )
+        connecting.addKnob(jump_button)
+
+    if not connecting.knob("connectorName"):
+        knob = nuke.String_Knob("connectorName", "Connector Name")
+        knob.setValue(connector.name())
+        knob.setVisible(False)
+        connecting.addKnob(knob)
+    else:
+        setKnobValue(connecting, "connectorName", connector.name())
+
+    manifest = getManifest()
+    if manifest:
+        manifest.addChild(connector, connecting)
+
+
+def createConnectingNodeAndConnect(connector, node=None):
+    """
+    Creates a to-be-connected Node based on 2D or 3D/Deep type node tree
+
+    Args:
+        dot (node): Nuke Dot Node
+        node (node): Optional Nuke Node, to prepend the created node
+
+    Returns:
+        node: New Node to be connected
+    """
+
+    nodeClass = "PostageStamp"
+
+    global _usePostageStamps
+    if not _usePostageStamps:
+        nodeClass = "NoOp"
+
+    connectingNode = None
+    connectorGiven = False
+
+    if node:
+        if isConnectingNode(node):
+            connectingNode = node
+            connectorGiven = True
+
+    if not connectingNode:
+        for n in nuke.selectedNodes():
+            n.setSelected(False)
+        connectingNode = nuke.createNode(nodeClass, inpanel=False)
+
+    connectSuccess = connectNodeToDot(connectingNode, connector)
+
+    if not connectSuccess and _usePostageStamps and not connectorGiven:
+        xpos, ypos = connectingNode.xpos(), connectingNode.ypos()
+        nuke.delete(connectingNode)
+        for n in nuke.selectedNodes():
+            n.setSelected(False)
+        connectingNode = nuke.createNode("NoOp", inpanel=False)
+        connectingNode.setXYpos(xpos, ypos)
+        connectSuccess = connectNodeToDot(connectingNode, connector)
+
+    if not connectSuccess:
+        # e.g. the Connector lives in another Group, Nuke doesn't connect across Groups
+        _log.warning("Could not connect %s to %s", connectingNode.fullName(), connector.fullName())
+        if not connectorGiven:
+            nuke.delete(connectingNode)
+        return
+
+    if node and not connectorGiven:
+        connectingNode.setXpos((node.xpos() + int(node.screenWidth() / 2)) - int(connectingNode.screenWidth() / 2))
+        if connectingNode.Class() == "NoOp":
+            offset = 50
+        else:
+            offset = 100
+        connectingNode.setYpos(node.ypos() - offset)
+
+        if not node.setInput(0, connectingNode):
+            nuke.delete(connectingNode)
+            return
+
+    connectingNode.setName(CONNECTED_KEY)
+    setKnobValue(connectingNode, "label", connector["label"].getValue())
+    setKnobValue(connectingNode, "tile_color", CONNECTOR_DEFAULT_COLOR)
+    setKnobValue(connectingNode, "hide_input", True)
+
+    if COLORIZE_CONNECTED:
+        color = connector.knob("tile_color").value()
+        if color not in [BUTTON_REGULAR_COLOR, 0]:
+            setKnobValue(connectingNode, "tile_color", color)
+
+    addConnectingNodeButtons(connectingNode, connector)
+
+    manifest = getManifest()
+    if manifest and not connectorGiven:
+        manifest.nodesCreated([connectingNode])
+
+    return connectingNode
+
+
+def createConnectedNodes(connectors, positions):
+    """
+    Creates one Connected node per Connector in one go, at explicit positions.
+    Other than createConnectingNodeAndConnect, this doesn't autoplace, open panels or touch the selection per node,
+    the selection gets replaced by the new nodes once at the end.
+
+    Args:
+        connectors (list): Connectors to create Connected nodes for
+        positions (list): (xpos, ypos) of each new node
+
+    Returns:
+        list: new Connected nodes
+    """
+
+    nodeClass = "PostageStamp" if _usePostageStamps else "NoOp"
+    created = []
+
+    with BatchEdit():
+        for connector, (xpos, ypos) in zip(connectors, positions):
+            color = CONNECTOR_DEFAULT_COLOR
+            if COLORIZE_CONNECTED:
+                connector_color = connector.knob("tile_color").value()
+                if connector_color not in [BUTTON_REGULAR_COLOR, 0]:
+                    color = connector_color
+
+            knobs = {
+                "xpos": int(xpos),
+                "ypos": int(ypos),
+                "label": connector["label"].getValue(),
+                "tile_color": color,
+                "hide_input": True,
+            }
+
+            node = getattr(nuke.nodes, nodeClass)(**knobs)
+
+            connectSuccess = node.setInput(0, connector)
+            if not connectSuccess and nodeClass != "NoOp":
+                # not every Connector can feed a PostageStamp, fall back to a NoOp like createConnectingNodeAndConnect
+                nuke.delete(node)
+                node = nuke.nodes.NoOp(**knobs)
+                connectSuccess = node.setInput(0, connector)
+
+            if not connectSuccess:  # e.g. the Connector lives in another Group
+                _log.warning("Could not connect a new node to %s", connector.fullName())
+                nuke.delete(node)
+                continue
+
+            node.setName(CONNECTED_KEY)
+            addConnectingNodeButtons(node, connector)
+            created.append(node)
+
+        for node in nuke.selectedNodes():
+            node.setSelected(False)
+
+        for node in created:
+            node.setSelected(True)
+
+        manifest = getManifest()
+        if manifest:
+            manifest.nodesCreated(created)
+
+    return created
+
+
+def connectNodeToDot(node, connector):
+    """
+    Connects a connecting-Node to a Connector
+
+    Args:
+        node (node): any nuke node
+        dot (node): Connector
+
+    Returns:
+        bool: True if new node connection was successful
+    """
+
+    with BatchEdit():
+        return _connectNodeToConnector(node, connector)
+
+
+def _connectNodeToConnector(node, connector):
+    """
+    Connects a connecting-Node to a Connector, without opening a BatchEdit.
+
+    Args:
+        node (node): any nuke node
+        connector (node): Connector
+
+    Returns:
+        bool: True if new node connection was successful
+    """
+
+    if not node.setInput(0, connector):
+        return False
+
+    if COLORIZE_CONNECTED:
+        color = connector.knob("tile_color").value()
+        if color not in [BUTTON_REGULAR_COLOR, 0]:
+            setKnobValue(node, "tile_color", color)
+        else:
+            setKnobValue(node, "tile_color", CONNECTOR_DEFAULT_COLOR)
+
+    return True
+
+
+def jumpKeepingPreviousSelection(node):
+    """
+    Jump to node without destroyng previous selection of nodes
+
+    Args:
+        node (node): any nuke node
+    """
+
+    prev_nodes = nuke.selectedNodes()
+
+    for i in prev_nodes:
+        i.setSelected(False)
+
+    node.setSelected(True)
+    nuke.zoomToFitSelected()
+    node.setSelected(False)
+
+    for i in prev_nodes:
+        i.setSelected(True)
+
+
+class ConnectorIndex:
+    """
+    All Connectors of one node graph context, collected in a single pass and keyed by label.
+
+    The index is kept between invocations of the shortcut and only gets rebuilt once the script changed.
+    As long as the fingerprint matches, the index is trusted as a whole, only the Connectors about to be used
+    get checked via verified. Entries taken over from the ConnectorManifest are only known by name,
+    they get looked up with nuke.toNode once they are used.
+    """
+
+    def __init__(self, entries=(), fingerprint=None, groups=()):
+        """
+        Args:
+            entries (list): (connector, label) tuples, the ones without a label are left out.
+                Instead of the node, the full name of the Connector may be given.
+            fingerprint (tuple, optional): script state the index was built for. Defaults to None.
+            groups (list, optional): Groups and Gizmos found next to the Connectors, or their full names. Defaults to ().
+        """
+
+        self.fingerprint = fingerprint
+        self.stale = False  # set once an entry turned out outdated, the index then gets rebuilt
+        self._groups = list(groups)
+        self._entries = [entry for entry in entries if entry[1]]
+
+        labelled = sorted(self._entries, key=lambda entry: entry[1])
+
+        self.labels = [label for _, label in labelled]
+        self.normalizedLabels = [normalizeLabel(label) for label in self.labels]
+        self.names = [connector if isinstance(connector, str) else connector.fullName() for connector, _ in labelled]
+        self.connectors = _ConnectorList(self, [None if isinstance(connector, str) else connector for connector, _ in labelled])
+
+        rowsByLabel = {}
+        rowsByNormalizedLabel = {}
+        for row, (label, normalizedLabel) in enumerate(zip(self.labels, self.normalizedLabels)):
+            rowsByLabel.setdefault(label, []).append(row)
+            rowsByNormalizedLabel.setdefault(normalizedLabel, []).append(row)
+
+        self.byLabel = _ConnectorLookup(rowsByLabel, self.connectors)
+        self.byNormalizedLabel = _ConnectorLookup(rowsByNormalizedLabel, self.connectors)
+        self.byName = _ConnectorLookup({name: row for row, name in enumerate(self.names)}, self.connectors, single=True)
+        self._labelsByName = dict(zip(self.names, self.labels))
+
+        # labels used by more than one Connector of the same Group, a label lookup can't tell those apart.
+        # Only labels already known to be shared get looked at, so this adds nothing noticeable to the scan.
+        rowsByDuplicate = {}
+        self.duplicateRows = set()
+        for label, labelRows in rowsByLabel.items():
+            if len(labelRows) < 2:
+                continue
+
+            groups = {}
+            for row in labelRows:
+                groups.setdefault(self.names[row].rpartition(".")[0], []).append(row)
+
+            for rows in groups.values():
+                if len(rows) > 1:
+                    rowsByDuplicate.setdefault(label, []).extend(rows)
+                    self.duplicateRows.update(rows)
+
+        self.duplicates = _ConnectorLookup(rowsByDuplicate, self.connectors)
+
+    def __len__(self):
+        return len(self.connectors)
+
+    @property
+    def groups(self):
+        """Groups and Gizmos found next to the Connectors, the ones only known by name get looked up on first use."""
+
+        if any(isinstance(group, str) for group in self._groups):
+            groups = [nuke.toNode("root." + group) if isinstance(group, str) else group for group in self._groups]
+            self._groups = [group for group in groups if isinstance(group, nuke.Group)]
+            if len(self._groups) != len(groups):
+                self.stale = True
+
+        return self._groups
+
+    def verified(self, connectors):
+        """
+        Checks Connectors of this index right before they get used. Label edits and the like don't change
+        the fingerprint, this is where they get noticed: the index is marked stale and gets rebuilt with the next lookup.
+
+        Args:
+            connectors (list): Connectors looked up in this index
+
+        Returns:
+            list: the ones that still exist and still carry the label they are indexed with
+        """
+
+        result = []
+
+        for connector in connectors:
+            try:
+                label = self._labelsByName.get(connector.fullName()) if connector is not None else None
+                current = label is not None and isConnector(connector) and connector["label"].value() == label
+            except ValueError:  # node has been deleted in the meantime
+                current = False
+
+            if current:
+                result.append(connector)
+            else:
+                self.stale = True
+
+        return result
+
+
+class _ConnectorList(collections.abc.Sequence):
+    """
+    Connectors of a ConnectorIndex in label order. Entries only known by name get looked up the first time
+    they are used, one that doesn't exist anymore comes back as None and marks the index stale.
+    """
+
+    def __init__(self, index, nodes):
+        self._index = index
+        self._nodes = nodes
+        self._missing = nodes.count(None)  # entries not looked up yet
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[position] for position in range(*row.indices(len(self)))]
+
+        node = self._nodes[row]
+
+        if node is None:
+            node = nuke.toNode("root." + self._index.names[row])
+            if node is None:
+                self._index.stale = True
+            else:
+                self._nodes[row] = node
+                self._missing -= 1
+
+        return node
+
+    def __iter__(self):
+        if not self._missing:
+            return iter(self._nodes)
+        return (self[row] for row in range(len(self)))
+
+    def resolve(self):
+        """
+        Looks up all entries not looked up yet.
+
+        Returns:
+            bool: True if all of them exist
+        """
+
+        return all(self[row] is not None for row in range(len(self))) if self._missing else True
+
+
+class _ConnectorLookup(collections.abc.Mapping):
+    """Key -> Connectors of a ConnectorIndex, only the ones that get looked up are resolved."""
+
+    def __init__(self, rows, connectors, single=False):
+        """
+        Args:
+            rows (dict): key -> rows, or a single row if single is set
+            connectors (_ConnectorList): Connectors of the index
+            single (bool, optional): each key belongs to one Connector, which gets returned as it is. Defaults to False.
+        """
+
+        self._rows = rows
+        self._connectors = connectors
+        self._single = single
+
+    def __getitem__(self, key):
+        rows = self._rows[key]
+        if self._single:
+            return self._connectors[rows]
+        return [self._connectors[row] for row in rows]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+
+def normalizeLabel(label):
+    """Returns the label in the form used for case insensitive lookups."""
+
+    return label.upper()
+
+
+class FuzzyMatcher:
+    """
+    Subsequence matcher for one search query, works like Nukes Node Menu: "ce" finds "CRYPTO ENV".
+    Built once per query and then run over the normalized labels of all Connectors.
+    """
+
+    PREFIX_SCORE = 3000
+    SUBSTRING_SCORE = 2000
+    BOUNDARY_BONUS = 100
+    CONTIGUOUS_BONUS = 10
+    BOUNDARY_CHARS = " _-.\n"
+
+    def __init__(self, query):
+        self.query = normalizeLabel(query)
+
+    def score(self, label):
+        """
+        Scores a label against the query: prefix matches first, then substrings, then loose subsequences,
+        which get bonuses for characters at word boundaries and for characters following each other.
+
+        Args:
+            label (str): normalized label
+
+        Returns:
+            int: score, None if the label doesn't match
+        """
+
+        query = self.query
+        position = label.find(query)
+
+        if position == 0:
+            return self.PREFIX_SCORE
+
+        if position > 0:
+            if label[position - 1] in self.BOUNDARY_CHARS:
+                return self.SUBSTRING_SCORE + self.BOUNDARY_BONUS
+            return self.SUBSTRING_SCORE
+
+        score = 0
+        last = -1
+        find = label.find
+
+        for char in query:
+            position = find(char, last + 1)
+            if position < 0:
+                return None
+
+            if position == 0 or label[position - 1] in self.BOUNDARY_CHARS:
+                score += self.BOUNDARY_BONUS
+            elif position == last + 1:
+                score += self.CONTIGUOUS_BONUS
+
+            last = position
+
+        return min(score, self.SUBSTRING_SCORE - 1)
+
+    def rank(self, labels, limit=None, rows=None, usage=None):
+        """
+        Matches all labels, returning every match as well as the best ones in ranked order.
+
+        Args:
+            labels (list): normalized labels
+            limit (int, optional): amount of ranked results. Defaults to all.
+            rows (iterable, optional): only match the labels of these rows. Defaults to all.
+            usage (dict, optional): row -> usage score, breaks ties between equally good matches. Defaults to None.
+
+        Returns:
+            tuple: list of all matching rows in label order, list of the best rows in ranked order
+        """
+
+        score = self.score
+        scored = []
+
+        for row in range(len(labels)) if rows is None else rows:
+            value = score(labels[row])
+            if value is not None:
+                scored.append((value, -row))
+
+        if usage:
+            scored = [(value, usage.get(-row, 0.0), row) for value, row in scored]
+
+        matched = sorted(-entry[-1] for entry in scored)
+
+        if limit is None or limit >= len(scored):
+            ranked = sorted(scored, reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, scored)
+
+        return matched, [-entry[-1] for entry in ranked]
+
+
+class IncrementalSearch:
+    """
+    Runs FuzzyMatcher over the labels of one ConnectorIndex while a query gets typed.
+    A query only ever matches a subset of what its prefixes matched, so as long as characters get appended
+    only the matches of the previous query get searched again. The matches of the previous queries are kept
+    on a stack, which makes backspace a lookup. Edits in the middle fall back to the longest kept prefix.
+    """
+
+    DEPTH = 32  # queries kept on the stack, typing beyond that drops the shortest ones
+
+    def __init__(self):
+        self.labels = None
+        self.usage = None
+        self.stack = []  # (normalized query, matched rows, ranked rows), each query extends the one below
+
+    def search(self, query, labels, limit=None, usage=None):
+        """
+        Like FuzzyMatcher.rank, reusing the matches of previous queries where possible.
+
+        Args:
+            query (str): search query
+            labels (list): normalized labels, starts over when they are not the same list as last time
+            limit (int, optional): amount of ranked results. Defaults to all.
+            usage (dict, optional): row -> usage score, starts over when it isn't the same dict as last time. Defaults to None.
+
+        Returns:
+            tuple: list of all matching rows in label order, list of the best rows in ranked order
+        """
+
+        if labels is not self.labels or usage is not self.usage:
+            self.labels = labels
+            self.usage = usage
+            self.stack = []
+
+        matcher = FuzzyMatcher(query)
+        stack = self.stack
+
+        while stack and not matcher.query.startswith(stack[-1][0]):
+            stack.pop()
+
+        if stack and stack[-1][0] == matcher.query:
+            return stack[-1][1], stack[-1][2]
+
+        matched, ranked = matcher.rank(labels, limit, rows=stack[-1][1] if stack else None, usage=usage)
+
+        stack.append((matcher.query, matched, ranked))
+        if len(stack) > self.DEPTH:
+            del stack[0]
+
+        return matched, ranked
+
+
+def indexForConnectors(connectors):
+    """
+    Returns a ConnectorIndex for the given Connectors, reusing the cached one if it holds exactly this list.
+
+    Args:
+        connectors (list): Connector nodes
+
+    Returns:
+        ConnectorIndex: index of the given Connectors
+    """
+
+    if _connectorIndex is not None and connectors is _connectorIndex.connectors:
+        return _connectorIndex
+
+    return ConnectorIndex([(connector, connector["label"].value()) for connector in connectors])
+
+
+def _groupFingerprint(nodes):
+    """
+    Cheap fingerprint of a node graph context, reads no knobs and only two names.
+    Nuke appends created and pasted nodes to the end of the list, so deleting one node and pasting
+    another keeps the count but changes the name at the end.
+
+    Args:
+        nodes (list): all nodes of the context
+
+    Returns:
+        tuple: node count and the names of the first and the last node
+    """
+
+    if not nodes:
+        return (0, None, None)
+
+    return (len(nodes), nodes[0].name(), nodes[-1].name())
+
+
+def _buildConnectorIndex(nodes, fingerprint=None):
+    """
+    Scans the given nodes once and builds a ConnectorIndex out of them.
+
+    Args:
+        nodes (list): nodes to scan
+        fingerprint (tuple, optional): script state the index gets built for. Defaults to None.
+
+    Returns:
+        ConnectorIndex: new index
+    """
+
+    dots = []
+    noops = []
+    groups = []
+
+    for node in nodes:
+        if isinstance(node, nuke.Group):  # includes Gizmos
+            groups.append(node)
+            continue
+
+        if not isConnector(node):
+            continue
+
+        nodeClass = node.Class()
+        if nodeClass not in CONNECTOR_CLASSES:
+            continue
+
+        entry = (node, node["label"].value())
+        if nodeClass == "Dot":
+            dots.append(entry)
+        else:
+            noops.append(entry)
+
+    return ConnectorIndex(dots + noops, fingerprint, groups)
+
+
+def _getGroupIndex(group):
+    """
+    Returns the cached ConnectorIndex of the nodes directly inside the group, rebuilds it only if the group changed.
+
+    Args:
+        group (node): Root, Group or Gizmo
+
+    Returns:
+        ConnectorIndex: index of the group
+    """
+
+    nodes = group.nodes()
+    fingerprint = _groupFingerprint(nodes)
+
+    key = group.fullName()
+    index = _groupIndexes.get(key)
+
+    # a matching fingerprint is trusted, the entries only get checked once they are used
+    if index is None or index.stale or index.fingerprint != fingerprint:
+        # once an entry turned out outdated, the manifest has nothing more to offer until the next scan
+        stale = index is not None and index.stale
+        manifest = getManifest() if key == "root" else None
+        index = manifest.connectorIndex(fingerprint) if manifest and not stale else None
+
+        if index is None:
+            index = _buildConnectorIndex(nodes, fingerprint)
+            if manifest:
+                manifest.setIndex(index, fingerprint)
+
+        _groupIndexes[key] = index
+
+    return index
+
+
+def _getScopedConnectorIndex():
+    """
+    Walks all Groups starting from the root and merges their indexes into one.
+    Unchanged Groups reuse their index, the merged index only gets rebuilt if one of them changed.
+
+    Returns:
+        ConnectorIndex: index of all Connectors in the script
+    """
+
+    global _scopedIndex
+
+    if _scopedIndex is not None and _scopedIndex.stale:  # it can't tell which Group is outdated
+        _scopedIndex = None
+        for index in _groupIndexes.values():
+            index.stale = True
+
+    groupIndexes = []
+    visited = set()
+    groups = [nuke.root()]
+
+    while groups:
+        group = groups.pop()
+
+        try:
+            key = group.fullName()
+            index = _getGroupIndex(group)
+        except ValueError:  # group has been deleted in the meantime
+            continue
+
+        visited.add(key)
+        groupIndexes.append(index)
+        groups.extend(reversed(index.groups))
+
+    # forget about Groups that were deleted or renamed
+    for key in list(_groupIndexes):
+        if key not in visited:
+            del _groupIndexes[key]
+
+    fingerprint = tuple(groupIndexes)
+
+    if _scopedIndex is None or _scopedIndex.fingerprint != fingerprint:
+        entries = [entry for index in groupIndexes for entry in index._entries]
+        _scopedIndex = ConnectorIndex(entries, fingerprint)
+
+    return _scopedIndex
+
+
+def getConnectorIndex(scoped=None, resolved=False):
+    """
+    Returns the cached ConnectorIndex, it only gets rebuilt if the script has changed.
+
+    Args:
+        scoped (bool, optional): search all Groups recursively starting from the root, instead of
+            the current context only. Defaults to SCOPED_DISCOVERY.
+        resolved (bool, optional): look up all Connectors the index only knows by name, for callers that go
+            through all of them anyway. Defaults to False.
+
+    Returns:
+        ConnectorIndex: index of all Connectors
+    """
+
+    global _connectorIndex
+
+    if scoped is None:
+        scoped = SCOPED_DISCOVERY
+
+    if scoped:
+        _connectorIndex = _getScopedConnectorIndex()
+    else:
+        _connectorIndex = _getGroupIndex(nuke.thisGroup())
+
+    if resolved and not _connectorIndex.connectors.resolve():
+        # an entry of the manifest doesn't exist anymore, the index is stale now and gets rebuilt from a scan
+        return getConnectorIndex(scoped, resolved)
+
+    return _connectorIndex
+
+
+def invalidateConnectorIndex():
+    """Forces a rebuild of all ConnectorIndexes with the next lookup."""
+
+    global _connectorIndex, _scopedIndex
+
+    _connectorIndex = None
+    _scopedIndex = None
+    _groupIndexes.clear()
+
+
+def getAllConnectors():
+    """
+    get all Connectors with a valid label, sorted by label.
+
+    Returns:
+        list: list containing all connectors
+    """
+
+    return list(getConnectorIndex(resolved=True).connectors)
+
+
+def getAllConnectorLabels():
+    """returns a list with all currently used labels"""
+
+    return list(getConnectorIndex().labels)
+
+
+def getDuplicateConnectors(scoped=None):
+    """
+    Returns all labels that are used by more than one Connector of the same Group.
+    Connected nodes with such a label can't be reconnected reliably by label.
+
+    Args:
+        scoped (bool, optional): look inside all Groups as well. Defaults to SCOPED_DISCOVERY.
+
+    Returns:
+        dict: label -> list of Connectors sharing it, empty if all labels are unique
+    """
+
+    return dict(getConnectorIndex(scoped, resolved=True).duplicates)
+
+
+class ConnectorManifest:
+    """
+    Connectors, Groups and Connected nodes of the root level, stored as JSON in a hidden knob on the root node.
+
+    Right after opening a script, lookups start from the manifest instead of scanning every node. The manifest
+    is trusted while the root level has the fingerprint it was written for, the same check the ConnectorIndex
+    relies on. Only the entries that actually get used are looked up and verified, via ConnectorIndex.verified
+    for Connectors and childIndex for Connected nodes. Once one of them doesn't check out, the root level
+    gets scanned and the result refreshes the manifest.
+
+    The plugin's own actions update the manifest in memory only, it gets written when the script is saved,
+    so the undo events of those actions don't carry a copy of it.
+    """
+
+    VERSION = 3
+
+    def __init__(self, labels=None, groups=None, children=None, fingerprint=None, script=None):
+        """
+        Args:
+            labels (dict, optional): label -> Connector names, None if unknown. Defaults to None.
+            groups (list, optional): names of Groups and Gizmos, None if unknown. Defaults to None.
+            children (dict, optional): Connector name -> Connected node names, None if unknown. Defaults to None.
+            fingerprint (list, optional): fingerprint of the root level the manifest is valid for. Defaults to None.
+            script (str, optional): name of the script the manifest belongs to. Defaults to None.
+        """
+
+        self.labels = labels
+        self.groups = groups
+        self.children = children
+        self.fingerprint = fingerprint
+        self.script = script
+        self.dirty = False  # changed since it was last written, the knob only gets written by saveManifest
+
+    @classmethod
+    def fromRoot(cls):
+        """Reads the manifest of the current script, an empty one if there is none or it can't be read."""
+
+        root = nuke.root()
+        manifest = cls(script=root.name())
+
+        knob = root.knob(MANIFEST_KNOB)
+        if not knob or not knob.value():
+            return manifest
+
+        try:
+            data = json.loads(knob.value())
+        except ValueError:
+            _log.warning("Ignoring unreadable Connector manifest")
+            return manifest
+
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return manifest
+
+        manifest.labels = data.get("labels")
+        manifest.groups = data.get("groups")
+        manifest.children = data.get("children")
+        manifest.fingerprint = data.get("fingerprint")
+        return manifest
+
+    def toJson(self):
+        data = {"version": self.VERSION, "fingerprint": self.fingerprint, "labels": self.labels, "groups": self.groups, "children": self.children}
+        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+    def write(self):
+        """Stores the manifest in the hidden knob on the root node, the knob gets created if needed."""
+
+        root = nuke.root()
+        knob = root.knob(MANIFEST_KNOB)
+
+        if not knob:
+            knob = nuke.String_Knob(MANIFEST_KNOB, "Label Connector Manifest")
+            knob.setFlag(nuke.INVISIBLE)
+            root.addKnob(knob)
+
+        value = self.toJson()
+        if knob.value() != value:
+            knob.setValue(value)
+
+        self.dirty = False
+
+    def isCurrent(self, fingerprint):
+        return self.fingerprint is not None and tuple(self.fingerprint) == tuple(fingerprint)
+
+    def setIndex(self, index, fingerprint):
+        """
+        Refreshes Connectors and Groups from a scan of the root level.
+
+        Args:
+            index (ConnectorIndex): index of the root level
+            fingerprint (tuple): fingerprint of the nodes that were scanned
+        """
+
+        if not self.isCurrent(fingerprint):
+            self.children = None
+
+        self.labels = {}
+        for label, connectors in index.byLabel.items():
+            self.labels[label] = [connector.fullName() for connector in connectors]
+
+        self.groups = [group.fullName() for group in index.groups]
+        self.fingerprint = list(fingerprint)
+        self.dirty = True
+
+    def setChildren(self, childIndex, fingerprint):
+        """
+        Refreshes the Connected nodes from a sweep over the root level.
+
+        Args:
+            childIndex (dict): Connector name -> Connected nodes, as returned by buildChildIndex
+            fingerprint (tuple): fingerprint of the nodes that were swept
+        """
+
+        if not self.isCurrent(fingerprint):
+            self.labels = None
+            self.groups = None
+
+        self.children = {name: [child.fullName() for child in children] for name, children in childIndex.items()}
+        self.fingerprint = list(fingerprint)
+        self.dirty = True
+
+    def connectorIndex(self, fingerprint):
+        """
+        Builds the ConnectorIndex of the root level out of the manifest, without looking up a single node.
+        The index only knows the Connectors by name, each one gets looked up and verified once it's used.
+
+        Args:
+            fingerprint (tuple): fingerprint of the root level right now
+
+        Returns:
+            ConnectorIndex: index of the root level, None if the manifest can't be trusted
+        """
+
+        if self.labels is None or self.groups is None or not self.isCurrent(fingerprint):
+            return None
+
+        entries = [(name, label) for label, names in self.labels.items() for name in names]
+        return ConnectorIndex(entries, tuple(fingerprint), self.groups)
+
+    def childIndex(self, connectors, fingerprint):
+        """
+        Looks up the Connected nodes of the given root level Connectors, each of them gets resolved and verified.
+
+        Args:
+            connectors (list): Connectors on the root level
+            fingerprint (tuple): fingerprint of the root level right now
+
+        Returns:
+            dict: Connector name -> list of Connected nodes, None if the manifest can't be trusted
+        """
+
+        if self.children is None or not self.isCurrent(fingerprint):
+            return None
+
+        child_index = {}
+
+        for connector in connectors:
+            name = connector.fullName()
+
+            for child_name in self.children.get(name, []):
+                child = nuke.toNode("root." + child_name)
+                if child is None or not isConnectingNode(child):
+                    return None
+
+                parent = child.input(0)
+                if parent is not None and isConnector(parent):
+                    if parent.fullName() != name:
+                        return None
+                elif not child.knob("connectorName") or child.knob("connectorName").value() != name:
+                    return None
+
+                child_index.setdefault(name, []).append(child)
+
+        return child_index
+
+    # updates of the plugin's own edits, so the manifest stays current without another scan
+
+    def nodesCreated(self, nodes):
+        """
+        Moves the fingerprint along with nodes created by the plugin, so the manifest stays current.
+        New nodes get appended to the root level, the same as _groupFingerprint expects. Nodes inside Groups don't count.
+        """
+
+        if self.fingerprint is None:
+            return
+
+        count, first, last = self.fingerprint
+        for node in nodes:
+            if _isRootLevel(node):
+                count += 1
+                first = first or node.name()
+                last = node.name()
+
+        if [count, first, last] != self.fingerprint:
+            self.fingerprint = [count, first, last]
+            self.dirty = True
+
+    def setConnector(self, connector, label):
+        """Adds a root level Connector, or moves it to its new label."""
+
+        if self.labels is None or not _isRootLevel(connector):
+            return
+
+        name = connector.fullName()
+        for names in self.labels.values():
+            if name in names:
+                names.remove(name)
+
+        self.labels = {key: names for key, names in self.labels.items() if names}
+        self.labels.setdefault(label, []).append(name)
+        self.dirty = True
+
+    def addChild(self, connector, child):
+        """Records a Connected node under its root level Connector, it gets removed from any other Connector."""
+
+        if self.children is None or not _isRootLevel(connector):
+            return
+
+        name, child_name = connector.fullName(), child.fullName()
+        if child_name in self.children.get(name, []):
+            return
+
+        for children in self.children.values():
+            if child_name in children:
+                children.remove(child_name)
+
+        self.children.setdefault(name, []).append(child_name)
+        self.dirty = True
+
+
+def _isRootLevel(node):
+    return node.fullName() == node.name()
+
+
+def getManifest():
+    """
+    Returns the ConnectorManifest of the current script, read from the root node once per script.
+
+    Returns:
+        ConnectorManifest: manifest, None if USE_MANIFEST is off
+    """
+
+    global _manifest
+
+    if not USE_MANIFEST:
+        return None
+
+    if _manifest is None or _manifest.script != nuke.root().name():
+        _manifest = ConnectorManifest.fromRoot()
+
+    return _manifest
+
+
+def saveManifest():
+    """
+    Rebuilds the manifest from a scan of the root level and stores it on the root node, without an undo event.
+    Registered as onScriptSave callback by enableManifest, so saved scripts always carry a current manifest.
+    """
+
+    manifest = getManifest()
+    if manifest is None:
+        return
+
+    # always from a fresh scan, so nothing the manifest missed in this session gets saved along
+    root = nuke.root()
+    nodes = root.nodes()
+    fingerprint = _groupFingerprint(nodes)
+
+    index = _buildConnectorIndex(nodes, fingerprint)
+    _groupIndexes["root"] = index
+
+    manifest.setIndex(index, fingerprint)
+    manifest.setChildren(_sweepChildren(root), fingerprint)
+
+    UNDO.disable()
+    try:
+        manifest.write()
+    finally:
+        UNDO.enable()
+
+
+def enableManifest():
+    """Turns on USE_MANIFEST and keeps the manifest current whenever the script gets saved."""
+
+    global USE_MANIFEST
+
+    USE_MANIFEST = True
+    nuke.addOnScriptSave(saveManifest)
+
+
+class UsageStore:
+    """
+    Per user record of how often Connectors get used, keyed by script and label and stored as JSON in USAGE_FILE.
+
+    Each use adds 1 to the score of a label, scores halve every USAGE_HALF_LIFE_DAYS, so frequent as well as
+    recent uses rank high. The file gets read once per session and written after each recorded use.
+    """
+
+    def __init__(self, path, entries=None):
+        """
+        Args:
+            path (str): JSON file the store lives in
+            entries (dict, optional): script -> {label: [score, time of the last use]}. Defaults to None.
+        """
+
+        self.path = path
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path):
+        """Reads the store from the given file, an empty store if it doesn't exist or can't be read."""
+
+        try:
+            with open(path) as usageFile:
+                entries = json.load(usageFile)
+        except (OSError, ValueError):
+            entries = {}
+
+        if not isinstance(entries, dict):
+            entries = {}
+
+        return cls(path, entries)
+
+    @staticmethod
+    def decay(score, timestamp, now):
+        return score * 0.5 ** ((now - timestamp) / (USAGE_HALF_LIFE_DAYS * 86400.0))
+
+    def scores(self, script, now=None):
+        """
+        Args:
+            script (str): script name
+            now (float, optional): time to decay the scores to. Defaults to now.
+
+        Returns:
+            dict: label -> decayed score of all labels used in the script
+        """
+
+        now = time.time() if now is None else now
+        return {label: self.decay(score, timestamp, now) for label, (score, timestamp) in self.entries.get(script, {}).items()}
+
+    def record(self, script, labels, now=None):
+        """
+        Counts one use of each label and saves the store.
+
+        Args:
+            script (str): script name
+            labels (list): labels that got used
+            now (float, optional): time of the use. Defaults to now.
+        """
+
+        now = time.time() if now is None else now
+        entries = self.entries.setdefault(script, {})
+
+        for label in labels:
+            score, timestamp = entries.get(label, (0.0, now))
+            entries[label] = [self.decay(score, timestamp, now) + 1.0, now]
+
+        self.evict(now)
+        self.save()
+
+    def evict(self, now):
+        """Drops the least used labels over all scripts, once there are more than USAGE_MAX_ENTRIES."""
+
+        count = sum(len(labels) for labels in self.entries.values())
+        if count <= USAGE_MAX_ENTRIES:
+            return
+
+        ranked = [
+            (self.decay(score, timestamp, now), script, label)
+            for script, labels in self.entries.items()
+            for label, (score, timestamp) in labels.items()
+        ]
+
+        entries = {}
+        for _, script, label in heapq.nlargest(USAGE_MAX_ENTRIES, ranked):
+            entries.setdefault(script, {})[label] = self.entries[script][label]
+
+        self.entries = entries
+
+    def save(self):
+        """Writes the store, via a temporary file so a crash never leaves a broken file behind."""
+
+        temp_path = self.path + ".tmp"
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            with open(temp_path, "w") as usageFile:
+                json.dump(self.entries, usageFile, separators=(",", ":"))
+            os.replace(temp_path, self.path)
+
+        except OSError:
+            _log.warning("Could not write Connector usage to %s", self.path, exc_info=True)
+
+
+def getUsageStore():
+    """Returns the UsageStore, it only gets read from USAGE_FILE the first time."""
+
+    global _usageStore
+
+    if _usageStore is None or _usageStore.path != USAGE_FILE:
+        _usageStore = UsageStore.load(USAGE_FILE)
+
+    return _usageStore
+
+
+def recordUsage(connectors):
+    """
+    Counts a connect to or a jump to the given Connectors, if USAGE_RANKING is on.
+
+    Args:
+        connectors (list): Connectors that got used
+    """
+
+    if not USAGE_RANKING or not connectors:
+        return
+
+    getUsageStore().record(nuke.root().name(), [connector["label"].value() for connector in connectors])
+
+
+def usageScores():
+    """
+    Returns:
+        dict: label -> decayed usage score of the Connectors used in the current script, empty if USAGE_RANKING is off
+    """
+
+    if not USAGE_RANKING:
+        return {}
+
+    return getUsageStore().scores(nuke.root().name())
+
+
+def isConnectingAndConnectedCorrectly(node):
+    """returns if the node is connected to the correct parent."""
+
+    if not node.input(0):
+        return False
+    return node.knob("label").getValue() == node.input(0).knob("label").getValue() and isConnectingNode(node)
+
+
+def isConnector(node):
+    return node.name().startswith(CONNECTOR_KEY)
+
+
+def isConnectingNode(node):
+    return node.name().startswith(CONNECTED_KEY)
+
+
+def hasPossibleInputs(node):
+    """
+    workaround to find out if a node can have connections. Because the "inputs" are still there
+    and could be forcefully connected to sth.
+    Also ignore IGNORECLASSES.
+    """
+    return "hide_input" in node.knobs() and not node.Class() in IGNORECLASSES
+
+
+def setConnectorSettings(connector, txt):
+    """
+    sets defaults for connectorDots like font size and sets label.
+
+    Args:
+        dot (node): ConnectorDot
+        txt (str): desired label text
+    """
+    connector.setName(CONNECTOR_KEY)
+    # connector.knob("note_font_size").setValue(22)
+    connector.knob("label").setValue(txt.upper())
+    # connector.knob("postage_stamp").setValue(False)
+
+    if BOLD_LABELS:
+        current_font = connector.knob("note_font").value()
+        connector.knob("note_font").setValue(f"{current_font} Bold")
+
+
+def addConnectorNodeButtons(node):
+    """Adds "Select all Children" button to a node."""
+
+    tab = nuke.Tab_Knob("connector", "Connector")
+    node.addKnob(tab)
+
+    select_button = nuke.PyScript_Knob("selectChildren", "Select all Children")
+    # falls back to the plain dependent() loop, so the button still works where the plugin isn't installed
+    select_button.setCommand(
+        "try:\n"
+        "    import labelConnectorCore\n"
+        "    labelConnectorCore.selectChildren([nuke.thisNode()])\n"
+        "except ImportError:\n"
+        "    n = nuke.thisNode()\n"
+        "    for i in nuke.selectedNodes():\n"
+        "        i.setSelected(False)\n"
+        "\n"
+        "    for x in n.dependent(nuke.INPUTS | nuke.HIDDEN_INPUTS, forceEvaluate=False):\n"
+        "        x.setSelected(True)\n"
+    )
+    node.addKnob(select_button)
+
+
+def _groupOf(node):
+    """Returns the Group or root the node lives in."""
+
+    prefix = node.fullName()[: -len(node.name())]
+    if not prefix:
+        return nuke.root()
+
+    return nuke.toNode("root." + prefix[:-1])
+
+
+def _groupPrefix(node=None):
+    """
+    Args:
+        node (node, optional): any node. Defaults to the current context, where new nodes get created.
+
+    Returns:
+        str: full name of the Group the node lives in including the trailing dot, empty on root level
+    """
+
+    if node is None:
+        name = nuke.thisGroup().fullName()
+        return "" if name == "root" else name + "."
+
+    return node.fullName()[: -len(node.name())]
+
+
+def sameGroupConnectors(connectors, node=None):
+    """
+    Filters the Connectors down to the ones the node can be connected to, Nuke doesn't connect across Groups.
+
+    Args:
+        connectors (list): Connectors
+        node (node, optional): node to connect. Defaults to a node that gets created in the current context.
+
+    Returns:
+        list: Connectors living in the same Group as the node
+    """
+
+    prefix = _groupPrefix(node)
+    return [connector for connector in connectors if _groupPrefix(connector) == prefix]
+
+
+def buildChildIndex(connectors):
+    """
+    Maps Connectors to their Connected nodes, in one sweep over the Groups the given Connectors live in.
+    A Connected node belongs to the Connector at its input, disconnected ones to the Connector named in their connectorName knob.
+
+    Args:
+        connectors (list): Connectors whose Groups get swept
+
+    Returns:
+        dict: Connector full name -> list of Connected nodes
+    """
+
+    groups = {}  # group full name -> (group, Connectors inside)
+    for connector in connectors:
+        group = _groupOf(connector)
+        if group is not None:
+            groups.setdefault(group.fullName(), (group, []))[1].append(connector)
+
+    manifest = getManifest()
+    child_index = {}
+
+    for key, (group, members) in groups.items():
+        if manifest and key == "root":
+            current = _groupFingerprint(group.nodes())
+            children = manifest.childIndex(members, current)
+            if children is None:
+                children = _sweepChildren(group)
+                manifest.setChildren(children, current)
+        else:
+            children = _sweepChildren(group)
+
+        child_index.update(children)
+
+    return child_index
+
+
+def _sweepChildren(group):
+    """
+    Maps all Connected nodes directly inside the group to their Connectors.
+
+    Args:
+        group (node): Root, Group or Gizmo
+
+    Returns:
+        dict: Connector full name -> list of Connected nodes
+    """
+
+    child_index = {}
+
+    for node in nuke.allNodes(group=group):
+        if not isConnectingNode(node):
+            continue
+
+        parent = node.input(0)
+
+        if parent is not None and isConnector(parent):
+            key = parent.fullName()
+
+        elif node.knob("connectorName") and node.knob("connectorName").value():
+            key = node.fullName()[: -len(node.name())] + node.knob("connectorName").value()
+
+        else:
+            continue
+
+        child_index.setdefault(key, []).append(node)
+
+    return child_index
+
+
+def getChildren(connectors):
+    """
+    Returns the Connected nodes of all given Connectors, including disconnected ones that still carry the Connector's name.
+
+    Args:
+        connectors (list): Connectors
+
+    Returns:
+        list: Connected nodes
+    """
+
+    child_index = buildChildIndex(connectors)
+    names = dict.fromkeys(connector.fullName() for connector in connectors)
+
+    return [child for name in names for child in child_index.get(name, [])]
+
+
+def selectChildren(connectors):
+    """
+    Selects all Connected nodes of the given Connectors, everything else gets deselected.
+
+    Args:
+        connectors (list): Connectors
+    """
+
+    children = getChildren(connectors)
+
+    for i in nuke.selectedNodes():
+        i.setSelected(False)
+
+    for x in children:
+        x.setSelected(True)
+
+
+def colorizeConnectors(connectors, color):
+    """
+    Sets the tile color of the given Connectors and, with COLORIZE_CONNECTED, of all their Connected nodes.
+
+    Args:
+        connectors (list): Connectors
+        color (int): interface color
+    """
+
+    with BatchEdit("Colorize Connector"):
+        for node in connectors:
+            setKnobValue(node, "tile_color", color)
+
+        if COLORIZE_CONNECTED:
+            child_index = buildChildIndex(connectors)
+            child_color = CONNECTOR_DEFAULT_COLOR if color in [BUTTON_REGULAR_COLOR, 0] else color
+
+            for node in connectors:
+                for x in child_index.get(node.fullName(), []):
+                    setKnobValue(x, "tile_color", child_color)
+
+
+def reconnectNodes(nodes, connectorIndex=None):
+    """
+    Connects all given nodes that carry a label but aren't connected to their Connector.
+    The connectorName knob is used first, the label as fallback.
+
+    Args:
+        nodes (list): nodes to reconnect, Connectors are skipped
+        connectorIndex (ConnectorIndex, optional): Connectors to look up labels in. Defaults to getConnectorIndex().
+
+    Returns:
+        list: nodes that got connected
+    """
+
+    if connectorIndex is None:
+        connectorIndex = getConnectorIndex()
+
+    connected = []
+    manifest = getManifest()
+
+    with BatchEdit():
+        for node in nodes:
+            if isConnector(node):
+                continue
+
+            label = node["label"].value()
+            if not label or isConnectingAndConnectedCorrectly(node):
+                continue
+
+            # Connectors can only be reached from within the same Group
+            prefix = _groupPrefix(node)
+
+            if node.knob("connectorName") and node.knob("connectorName").value():
+                connector = nuke.toNode("root." + prefix + node.knob("connectorName").value())
+                if connector:
+                    if _connectNodeToConnector(node, connector):
+                        connected.append(node)
+                        if manifest:
+                            manifest.addChild(connector, node)
+                    continue
+
+            connectors = sameGroupConnectors(connectorIndex.verified(connectorIndex.byLabel.get(label, [])), node)
+            if connectors:
+                if len(connectors) > 1:
+                    _log.warning("Label '%s' is used by multiple Connectors, connecting %s to %s", label, node.name(), connectors[0].name())
+
+                # Label Match has been found, try to connect the two Nodes
+                if _connectNodeToConnector(node, connectors[0]):
+                    connected.append(node)
+                    if manifest:
+                        manifest.addChild(connectors[0], node)
+
+    return connected
+
+
+def makeConnector(node, text, textOld=""):
+    """
+    Creates a new Connector, or renames an existing selected one alongside all dependent nodes.
+    """
+    text = text.strip(" ").upper()
+
+    if not text:
+        return
+
+    if not ALLOW_DUPLICATE_LABELS:
+        # the Connector being renamed may of course keep its own label
+        name = node.fullName() if node and isConnector(node) else None
+        index = getConnectorIndex(scoped=False)
+        if any(connector.fullName() != name for connector in index.verified(index.byLabel.get(text, []))):
+            nuke.message("Label already in use")
+            return
+
+    invalidateConnectorIndex()
+    manifest = getManifest()
+
+    with BatchEdit():
+        if node:
+            if node.Class() in CONNECTOR_CLASSES and isConnector(node):
+                # rename existing ConnectorDot alongside dependent Nodes
+                setKnobValue(node, "label", text)
+                for x in getChildren([node]):
+                    if x["label"].getValue() == textOld:
+                        setKnobValue(x, "label", text)
+
+            else:  # attach new ConnectorDot Node to any Node
+                node = nuke.createNode("NoOp", inpanel=False)
+                setConnectorSettings(node, text)
+                node.setYpos(node.ypos() + 50)
+                addConnectorNodeButtons(node)
+                if manifest:
+                    manifest.nodesCreated([node])
+
+        else:  # create new independent ConnectorDot
+            node = nuke.createNode("NoOp", inpanel=False)
+            setConnectorSettings(node, text)
+            addConnectorNodeButtons(node)
+            if manifest:
+                manifest.nodesCreated([node])
+
+        if manifest:
+            manifest.setConnector(node, text)
+
+
+def interface2rgb(hexValue):
+    """
+    Convert a color stored as a 32 bit value as used by nuke for interface colors to normalized rgb values.
+
+    Args:
+        hexValue ([type]): [description]
+        normalize (bool, optional): [description]. Defaults to True.
+
+    Returns:
+        [type]: [description]
+    """
+    return [(0xFF & hexValue >> i) / 255.0 for i in [24, 16, 8]]
+
+
+def rgb2interface(rgb):
+    """
+    Convert a color stored as rgb values to a 32 bit value as used by nuke for interface colors.
+
+    Args:
+        rgb ([type]): [description]
+
+    Returns:
+        [type]: [description]
+    """
+    if len(rgb) == 3:
+        rgb = rgb + (255,)
+
+    return int("%02x%02x%02x%02x" % rgb, 16)
+
+
+def getTileColor(node=None):
+    """
+    If a node has it's color set automatically, the 'tile_color' knob will return 0.
+    If so, this function will scan through the preferences to find the correct color value.
+
+    Args:
+        node ([type], optional): [description]. Defaults to None.
+
+    Returns:
+        [type]: [description]
+    """
+    node = node or nuke.selectedNode()
+    interfaceColor = node.knob("tile_color").value()
+
+    if interfaceColor == 0 or interfaceColor == defaultNodeColor(node.Class()) or interfaceColor == 3435973632:
+        interfaceColor = BUTTON_REGULAR_COLOR
+
+    return interfaceColor
+
+
+def rgb2hex(rgbaValues):
+    """
+    Convert a color stored as normalized rgb values to a hex.
+
+    Args:
+        rgbaValues ([type]): [description]
+
+    Returns:O
+        [type]: [description]
+    """
+    if len(rgbaValues) < 3:
+        return
+    return "#%02x%02x%02x" % (
+        int(rgbaValues[0] * 255),
+        int(rgbaValues[1] * 255),
+        int(rgbaValues[2] * 255),
+    )
+
+
+@functools.lru_cache(maxsize=COLOR_CACHE_SIZE)
+def interface2hex(interfaceColor):
+    """
+    Convert a 32 bit interface color to a hex, memoized as the same few colors get converted over and over.
+
+    Args:
+        interfaceColor (int): color as used by nuke for interface colors
+
+    Returns:
+        str: hex color like "#ff0000"
+    """
+
+    return rgb2hex(interface2rgb(interfaceColor))
+
+
+def defaultNodeColor(nodeClass):
+    """
+    Default tile color of a node class from the preferences, only asked once per session.
+
+    Args:
+        nodeClass (str): node class
+
+    Returns:
+        int: interface color
+    """
+
+    if nodeClass not in _defaultNodeColors:
+        _defaultNodeColors[nodeClass] = nuke.defaultNodeColor(nodeClass)
+
+    return _defaultNodeColors[nodeClass]
+
+
+def clearColorCache():
+    """Forget cached colors, e.g. after the node colors in the preferences have been changed."""
+
+    _defaultNodeColors.clear()
+    interface2hex.cache_clear()
+
+
+def hex2rgb(hexColor):
+    """
+    Convert a color stored as hex to rgb values.
+
+    Args:
+        hexColor ([type]): [description]
+
+    Returns:
+        [type]: [description]
+    """
+    hexColor = hexColor.lstrip("#")
+    return tuple(int(hexColor[i : i + 2], 16) for i in (0, 2, 4))
+
+
+def repairAllConnections(scoped=None):
+    """
+    Reconnects every Connected node that isn't connected to its Connector, all within one undo event.
+    Each node gets resolved via its connectorName knob first, the label is used as fallback.
+
+    Args:
+        scoped (bool, optional): repair inside all Groups as well. Defaults to SCOPED_DISCOVERY.
+
+    Returns:
+        dict: lists of Connected nodes, sorted into "fixed", "ambiguous" (label used by multiple Connectors),
+            "orphaned" (no matching Connector) and "failed" (Nuke refused the connection)
+    """
+
+    if scoped is None:
+        scoped = SCOPED_DISCOVERY
+
+    connector_index = getConnectorIndex(scoped)
+    summary = {"fixed": [], "ambiguous": [], "orphaned": [], "failed": []}
+
+    with BatchEdit("Repair Connections"):
+        for node in nuke.allNodes(recurseGroups=scoped):
+            if not isConnectingNode(node) or isConnectingAndConnectedCorrectly(node):
+                continue
+
+            # Connectors can only be reached from within the same Group
+            prefix = node.fullName()[: -len(node.name())]
+            connector = None
+
+            if node.knob("connectorName"):
+                connector = connector_index.byName.get(prefix + node.knob("connectorName").value())
+                if connector and not connector_index.verified([connector]):
+                    connector = None
+
+            if connector:
+                setKnobValue(node, "label", connector["label"].value())
+
+            else:
+                candidates = [
+                    candidate
+                    for candidate in connector_index.verified(connector_index.byLabel.get(node["label"].value(), []))
+                    if candidate.fullName() == prefix + candidate.name()
+                ]
+
+                if not candidates:
+                    summary["orphaned"].append(node)
+                    continue
+
+                if len(candidates) > 1:
+                    summary["ambiguous"].append(node)
+                    continue
+
+                connector = candidates[0]
+
+            if _connectNodeToConnector(node, connector):
+                addConnectingNodeButtons(node, connector)
+                summary["fixed"].append(node)
+            else:
+                summary["failed"].append(node)
+
+    return summary
+
+
+def repairAllConnectionsCommand():
+    """
+    Menu entry for repairAllConnections, reports the result to the user.
+    """
+
+    summary = repairAllConnections()
+
+    message = "Repaired {} Connection(s).".format(len(summary["fixed"]))
+
+    for key, text in [
+        ("ambiguous", "Label used by multiple Connectors"),
+        ("orphaned", "No matching Connector found"),
+        ("failed", "Could not be connected"),
+    ]:
+        if summary[key]:
+            names = [node.fullName() for node in summary[key]]
+            if len(names) > 20:
+                names = names[:20] + ["..."]
+            message += "\n\n{} ({}):\n{}".format(text, len(summary[key]), ", ".join(names))
+
+    _log.info(message)
+    nuke.message(message)
+
+
+class AuditIssue:
+    """One problem found by auditConnections."""
+
+    LABEL_MISMATCH = "label mismatch"
+    NO_INPUT = "no input"
+    CONNECTOR_NAME_NOT_FOUND = "connectorName not found"
+    CONNECTOR_NAME_MISMATCH = "connectorName differs from input"
+    NO_CHILDREN = "no children"
+    MISSING_CONNECTOR_TAB = "missing Connector tab"
+    DUPLICATE_LABEL = "duplicate label"
+
+    __slots__ = ("kind", "node", "label", "detail")
+
+    def __init__(self, kind, node, label, detail=""):
+        self.kind = kind
+        self.node = node  # full name, so reports can be kept around after the script changed
+        self.label = label
+        self.detail = detail
+
+    def toDict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self):
+        return "<AuditIssue {}: {} {}>".format(self.kind, self.node, self.detail)
+
+
+class AuditReport:
+    """Result of auditConnections, all problems of a script plus some numbers."""
+
+    def __init__(self):
+        self.issues = []
+        self.connectors = 0
+        self.connected = 0
+
+    def add(self, kind, node, detail=""):
+        self.issues.append(AuditIssue(kind, node.fullName(), node["label"].value(), detail))
+
+    @property
+    def ok(self):
+        return not self.issues
+
+    def byKind(self):
+        """
+        Returns:
+            dict: issue kind -> list of AuditIssues
+        """
+
+        kinds = {}
+        for issue in self.issues:
+            kinds.setdefault(issue.kind, []).append(issue)
+        return kinds
+
+    def toDict(self):
+        return {
+            "connectors": self.connectors,
+            "connected": self.connected,
+            "issues": [issue.toDict() for issue in self.issues],
+        }
+
+    def __len__(self):
+        return len(self.issues)
+
+    def __iter__(self):
+        return iter(self.issues)
+
+
+def auditConnections(scoped=None):
+    """
+    Checks all Connectors and Connected nodes of the script in one pass, e.g. as a pre-publish check.
+    All lookups go through dicts, so this stays linear for very large scripts.
+
+    Args:
+        scoped (bool, optional): audit inside all Groups as well. Defaults to SCOPED_DISCOVERY.
+
+    Returns:
+        AuditReport: every problem found, empty if the script is fine
+    """
+
+    if scoped is None:
+        scoped = SCOPED_DISCOVERY
+
+    timer = startTimer("auditConnections")
+    report = AuditReport()
+
+    connectors = {}  # full name -> Connector
+    connected = []
+
+    for node in nuke.allNodes(recurseGroups=scoped):
+        if isConnector(node):
+            if node.Class() in CONNECTOR_CLASSES:
+                connectors[node.fullName()] = node
+        elif isConnectingNode(node):
+            connected.append(node)
+
+    if timer:
+        timer.lap("scan", connectors=len(connectors), connected=len(connected))
+
+    children = dict.fromkeys(connectors, 0)
+    labels = {}  # (Group, label) -> Connector names
+
+    for node in connected:
+        parent = node.input(0)
+        parent_name = parent.fullName() if parent is not None else None
+
+        if parent is None:
+            report.add(AuditIssue.NO_INPUT, node)
+        else:
+            if parent_name in children:
+                children[parent_name] += 1
+
+            parent_label = parent["label"].value()
+            if parent_label != node["label"].value():
+                report.add(AuditIssue.LABEL_MISMATCH, node, "input {} is labelled '{}'".format(parent_name, parent_label))
+
+        connector_name = node.knob("connectorName")
+        if not connector_name or not connector_name.value():
+            continue
+
+        # connectorName only holds the name, Connectors can only be reached from within the same Group
+        target = node.fullName()[: -len(node.name())] + connector_name.value()
+
+        if target not in connectors:
+            report.add(AuditIssue.CONNECTOR_NAME_NOT_FOUND, node, target)
+        elif parent is not None and parent_name != target:
+            report.add(AuditIssue.CONNECTOR_NAME_MISMATCH, node, "points to {}, connected to {}".format(target, parent_name))
+
+    for name, connector in connectors.items():
+        label = connector["label"].value()
+        if label:
+            labels.setdefault((name.rpartition(".")[0], label), []).append(name)
+
+        if not children[name]:
+            report.add(AuditIssue.NO_CHILDREN, connector)
+        if not connector.knob("selectChildren"):
+            report.add(AuditIssue.MISSING_CONNECTOR_TAB, connector)
+
+    for names in labels.values():
+        if len(names) > 1:
+            for name in names:
+                report.add(AuditIssue.DUPLICATE_LABEL, connectors[name], "shared with " + ", ".join(other for other in names if other != name))
+
+    report.connectors = len(connectors)
+    report.connected = len(connected)
+
+    if timer:
+        timer.finish("check", issues=len(report))
+
+    return report
@@ -0,0 +1,378 @@
+"""
+labelConnectorParser - reads the Connector/Connected graph straight from .nk files, no Nuke needed.
+
+Meant for farm and asset tooling, where launching Nuke just to look at the Connectors is too expensive.
+The script gets streamed line by line, so memory stays bounded even for very large scripts.
+
+USAGE
+
+python labelConnectorParser.py /path/to/script.nk
+
+or from Python
+
+import labelConnectorParser
+graph = labelConnectorParser.parseNkFile("/path/to/script.nk")
+graph.children["Connector1"]
+
+"""
+
+import json
+import re
+import sys
+
+
+# keep these in sync with labelConnectorCore
+CONNECTOR_KEY = "Connector"
+CONNECTED_KEY = "Connected"
+CONNECTOR_CLASSES = ["Dot", "NoOp"]
+
+# classes that are followed by their contents and an "end_group"
+GROUP_CLASSES = ["Group", "LiveGroup"]
+
+# top level commands that are no nodes, even if their line ends with an opening brace
+TOPLEVEL_COMMANDS = [b"define_window_layout_xml", b"add_layer", b"version", b"set", b"push"]
+
+READ_BUFFER_SIZE = 1 << 20
+
+_TRACKED_KNOBS = (b"name ", b"label ", b"tile_color ", b"connectorName ", b"inputs ")
+_HEADER = re.compile(rb"^(?:clone\s+\S+\s+)?([^\s{}\[\]$]+)\s\{$")
+_CLONE_HEADER = re.compile(rb"^clone\s+\S+\s\{$")
+_INPUTS = re.compile(rb"^(\d+)(?:\+(\d+))?$")
+_ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+_BACKSLASH = ord("\\")
+_QUOTE = ord('"')
+_OPEN = ord("{")
+_CLOSE = ord("}")
+
+
+class NkNode:
+    """A Connector or Connected node as found in the .nk file."""
+
+    __slots__ = ("nodeClass", "name", "fullName", "label", "connectorName", "tileColor", "input", "connector")
+
+    def __init__(self, nodeClass, name, fullName, label="", connectorName="", tileColor=0, input=None):
+        self.nodeClass = nodeClass
+        self.name = name
+        self.fullName = fullName
+        self.label = label
+        self.connectorName = connectorName
+        self.tileColor = tileColor
+        self.input = input  # full name of the node connected to input 0
+        self.connector = None  # full name of the resolved Connector, Connected nodes only
+
+    @property
+    def groupPrefix(self):
+        """Full name of the surrounding Group including the trailing dot, empty on root level."""
+
+        return self.fullName[: -len(self.name)]
+
+    def toDict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self):
+        return "<NkNode {} '{}'>".format(self.fullName, self.label)
+
+
+class NkConnectorGraph:
+    """Connectors, Connected nodes and their relationships of one .nk file."""
+
+    def __init__(self):
+        self.connectors = {}  # full name -> NkNode
+        self.connected = []
+        self.byLabel = {}  # label -> [NkNode], Connectors only
+        self.children = {}  # Connector full name -> [NkNode]
+        self.orphaned = []  # Connected nodes without any matching Connector
+
+    def _resolve(self):
+        """
+        Resolves each Connected node like the plugin does: via the actual input first,
+        then via the connectorName knob and finally via the label.
+        """
+
+        for connector in sorted(self.connectors.values(), key=lambda connector: connector.label):
+            self.byLabel.setdefault(connector.label, []).append(connector)
+
+        for node in self.connected:
+            prefix = node.groupPrefix
+            connector = self.connectors.get(node.input)
+
+            if connector is None and node.connectorName:
+                connector = self.connectors.get(prefix + node.connectorName)
+
+            if connector is None:
+                for candidate in self.byLabel.get(node.label, []):
+                    if candidate.groupPrefix == prefix:
+                        connector = candidate
+                        break
+
+            if connector is None:
+                self.orphaned.append(node)
+                continue
+
+            node.connector = connector.fullName
+            self.children.setdefault(connector.fullName, []).append(node)
+
+    def isConnectedCorrectly(self, node):
+        """Mirrors labelConnector.isConnectingAndConnectedCorrectly for parsed nodes."""
+
+        connector = self.connectors.get(node.input)
+        return connector is not None and connector.label == node.label
+
+    def toDict(self):
+        return {
+            "connectors": [
+                dict(connector.toDict(), children=[child.fullName for child in self.children.get(name, [])])
+                for name, connector in sorted(self.connectors.items())
+            ],
+            "connected": [node.toDict() for node in self.connected],
+            "orphaned": [node.fullName for node in self.orphaned],
+        }
+
+
+def _scanBraces(line, depth, quoted, quoteDepth):
+    """
+    Follows Tcl braces and quotes over one line.
+
+    Args:
+        line (bytes): line of the .nk file
+        depth (int): brace depth before the line
+        quoted (bool): inside a quoted string before the line
+        quoteDepth (int): brace depth at which quotes start strings, None if quotes are literal
+
+    Returns:
+        tuple: brace depth and quote state after the line
+    """
+
+    if not quoted and b'"' not in line and b"\\" not in line:
+        return depth + line.count(b"{") - line.count(b"}"), False
+
+    escaped = False
+    for char in line:
+        if escaped:
+            escaped = False
+        elif char == _BACKSLASH:
+            escaped = True
+        elif quoted:
+            if char == _QUOTE:
+                quoted = False
+        elif char == _QUOTE and depth == quoteDepth:
+            quoted = True
+        elif char == _OPEN:
+            depth += 1
+        elif char == _CLOSE:
+            depth -= 1
+
+    return depth, quoted
+
+
+def _decodeValue(raw):
+    """
+    Turns a Tcl knob value into a string.
+
+    Args:
+        raw (bytes): value as written in the .nk file
+
+    Returns:
+        str: decoded value
+    """
+
+    value = raw.strip().decode("utf-8", "replace")
+
+    if len(value) > 1 and value[0] == "{" and value[-1] == "}":
+        return value[1:-1]
+
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        value = value[1:-1]
+
+    return _ESCAPE.sub(lambda match: _ESCAPES.get(match.group(1), match.group(1)), value)
+
+
+def _inputCount(raw):
+    """Number of stack entries a node takes, "2+1" means two inputs plus a mask input."""
+
+    match = _INPUTS.match(raw.strip())
+    if not match:
+        return 1
+
+    return int(match.group(1)) + int(match.group(2) or 0)
+
+
+def parseNkLines(lines):
+    """
+    Extracts the Connector graph out of the lines of a .nk file.
+
+    Args:
+        lines (iterable): lines of the .nk file as bytes
+
+    Returns:
+        NkConnectorGraph: Connectors, Connected nodes and their relationships
+    """
+
+    graph = NkConnectorGraph()
+
+    stack = []  # full names of the nodes on the Tcl stack, None for "push 0"
+    variables = {}
+    frames = []  # (stack, prefix, group full name) of all Groups we are in
+    prefix = ""
+
+    depth = 0
+    quoted = False
+    nodeClass = None  # class of the node whose body we are in
+    knobs = {}
+    pending = None  # (knob, parts) of a tracked knob value spanning multiple lines
+    unnamed = 0
+
+    for line in lines:
+        if depth == 0:
+            stripped = line.strip()
+            if not stripped:
+                continue
+
+            header = _HEADER.match(stripped)
+            if header and header.group(1) not in TOPLEVEL_COMMANDS:
+                nodeClass = header.group(1).decode("utf-8", "replace")
+                knobs = {}
+                depth = 1
+                continue
+
+            if _CLONE_HEADER.match(stripped):
+                nodeClass = "clone"
+                knobs = {}
+                depth = 1
+                continue
+
+            if stripped.startswith(b"push "):
+                value = stripped[5:].strip()
+                stack.append(variables.get(value[1:]) if value.startswith(b"$") else None)
+
+            elif stripped.startswith(b"set ") and b"[stack " in stripped:
+                name, _, position = stripped[4:].partition(b" ")
+                position = int(position.strip(b"[]").split()[1])
+                variables[name] = stack[-1 - position] if position < len(stack) else None
+
+            elif stripped == b"end_group" and frames:
+                stack, prefix, group = frames.pop()
+                stack.append(group)
+
+            else:  # any other top level command, might open a brace that spans multiple lines
+                depth, quoted = _scanBraces(stripped, 0, False, None)
+
+            continue
+
+        if depth > 1 or nodeClass is None:
+            # inside a braced value, quotes don't start strings here
+            if b"\\" in line:
+                depth = _scanBraces(line, depth, False, None)[0]
+            else:
+                depth += line.count(b"{") - line.count(b"}")
+
+        elif quoted or pending is not None:
+            depth, quoted = _scanBraces(line, depth, quoted, 1)
+
+        else:
+            stripped = line.strip()
+
+            if stripped.startswith(_TRACKED_KNOBS):
+                knob, _, raw = stripped.partition(b" ")
+                depth, quoted = _scanBraces(raw, 1, False, 1)
+                if depth == 1 and not quoted:
+                    knobs[knob] = raw
+                else:
+                    pending = (knob, [raw])
+                continue
+
+            depth, quoted = _scanBraces(stripped, 1, False, 1)
+
+        if pending is not None:
+            pending[1].append(line.rstrip(b"\r\n"))
+            if depth <= 1 and not quoted:
+                knobs[pending[0]] = b"\n".join(pending[1])
+                pending = None
+
+        if depth > 0:
+            continue
+
+        if nodeClass is None:
+            depth = 0
+            continue
+
+        # the node body has been closed, apply it to the stack
+        depth = 0
+        quoted = False
+
+        if nodeClass != "Root":
+            count = _inputCount(knobs[b"inputs"]) if b"inputs" in knobs else 1
+            inputs = stack[len(stack) - count :] if count else []
+            del stack[len(stack) - len(inputs) :]
+            inputs = [None] * (count - len(inputs)) + inputs
+
+            if b"name" in knobs:
+                name = _decodeValue(knobs[b"name"])
+            else:
+                unnamed += 1
+                name = "{}_unnamed{}".format(nodeClass, unnamed)
+
+            fullName = prefix + name
+
+            isConnector = name.startswith(CONNECTOR_KEY) and nodeClass in CONNECTOR_CLASSES
+            if isConnector or name.startswith(CONNECTED_KEY):
+                tileColor = _decodeValue(knobs.get(b"tile_color", b"0"))
+                try:
+                    tileColor = int(tileColor, 0)
+                except ValueError:
+                    tileColor = 0
+
+                node = NkNode(
+                    nodeClass,
+                    name,
+                    fullName,
+                    label=_decodeValue(knobs.get(b"label", b"")),
+                    connectorName=_decodeValue(knobs.get(b"connectorName", b"")),
+                    tileColor=tileColor,
+                    input=inputs[0] if inputs else None,
+                )
+
+                if isConnector:
+                    if node.label:
+                        graph.connectors[fullName] = node
+                else:
+                    graph.connected.append(node)
+
+            if nodeClass in GROUP_CLASSES:
+                frames.append((stack, prefix, fullName))
+                stack = []
+                prefix = fullName + "."
+            else:
+                stack.append(fullName)
+
+        nodeClass = None
+        knobs = {}
+
+    graph._resolve()
+    return graph
+
+
+def parseNkFile(path):
+    """
+    Extracts the Connector graph out of a .nk file, streaming it in chunks.
+
+    Args:
+        path (str): path to the .nk file
+
+    Returns:
+        NkConnectorGraph: Connectors, Connected nodes and their relationships
+    """
+
+    with open(path, "rb", buffering=READ_BUFFER_SIZE) as nkFile:
+        return parseNkLines(nkFile)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.stderr.write("usage: python labelConnectorParser.py /path/to/script.nk\n")
+        sys.exit(1)
+
+    json.dump(parseNkFile(sys.argv[1]).toDict(), sys.stdout, indent=2)
+    sys.stdout.write("\n")
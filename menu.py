@@ -1,13 +1,40 @@
 import nuke
-import labelConnector
 
 
 editMenu = nuke.menu("Nuke").findItem("Edit")
 
+# the UI and with it Qt only gets imported once the shortcut is pressed the first time
+
 """
 change your shortcut here, default is 'A'. 
 """
-editMenu.addCommand("Label Connector", "labelConnector.labelConnector()", "A", shortcutContext=2)
+editMenu.addCommand("Label Connector", "import labelConnector; labelConnector.labelConnector()", "A", shortcutContext=2)
+editMenu.addCommand(
+    "Label Connector - Repair all Connections", "import labelConnectorCore; labelConnectorCore.repairAllConnectionsCommand()"
+)
+editMenu.addCommand("Label Connector - Audit Connections", "import labelConnector; labelConnector.showAuditPanel()")
+
+"""
+set to True to build the Connector index and the UI in the background whenever Nuke is idle after loading a script,
+so the first shortcut press is as fast as later ones. This imports the UI at startup.
+"""
+LABELCONNECTOR_PREWARM = False
+
+if LABELCONNECTOR_PREWARM:
+    import labelConnector
+
+    labelConnector.enablePrewarm()
+
+"""
+set to True to store a manifest of all Connectors and their Children in a hidden knob on the root node.
+After opening a script, the first lookups start from the manifest instead of scanning every node.
+"""
+LABELCONNECTOR_MANIFEST = False
+
+if LABELCONNECTOR_MANIFEST:
+    import labelConnectorCore
+
+    labelConnectorCore.enableManifest()
 
 """
 UI SHORTCUTS
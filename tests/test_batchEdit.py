@@ -0,0 +1,84 @@
+"""
+Tests of BatchEdit, running on fakeNuke from the benchmarks.
+
+USAGE
+
+python -m pytest tests
+
+"""
+
+import os
+import sys
+import unittest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "benchmarks"))
+sys.path.insert(1, ROOT_DIR)
+
+import fakeNuke  # noqa: E402
+
+sys.modules["nuke"] = fakeNuke
+
+import labelConnectorCore  # noqa: E402
+
+
+class BatchEditFailureTest(unittest.TestCase):
+    def setUp(self):
+        fakeNuke.reset()
+        labelConnectorCore.invalidateConnectorIndex()
+
+        self.connector = fakeNuke.nodes.NoOp(name="Connector1", label="PLATE", tile_color=labelConnectorCore.COLOR_LIST["Red"])
+
+    def testNodesOfAFailedActionAreFullySetUp(self):
+        with self.assertRaises(RuntimeError):
+            with labelConnectorCore.BatchEdit():
+                node = labelConnectorCore.createConnectingNodeAndConnect(self.connector)
+                raise RuntimeError("action failed halfway")
+
+        self.assertIs(node.input(0), self.connector)
+        self.assertEqual(node["label"].value(), "PLATE")
+        self.assertTrue(node["hide_input"].value())
+        self.assertEqual(node["tile_color"].value(), labelConnectorCore.COLOR_LIST["Red"])
+
+    def testFailedActionIsOneUndoEvent(self):
+        with self.assertRaises(RuntimeError):
+            with labelConnectorCore.BatchEdit():
+                with labelConnectorCore.BatchEdit():
+                    labelConnectorCore.createConnectingNodeAndConnect(self.connector)
+                raise RuntimeError("action failed halfway")
+
+        self.assertEqual(fakeNuke.Undo.events, 1)
+        self.assertEqual(fakeNuke.Undo._depth, 0)
+        self.assertIsNone(labelConnectorCore._batchEdit)
+
+
+class BatchEditManifestTest(unittest.TestCase):
+    def setUp(self):
+        fakeNuke.reset()
+        labelConnectorCore.invalidateConnectorIndex()
+        labelConnectorCore._manifest = None
+        labelConnectorCore.USE_MANIFEST = True
+
+        self.connector = fakeNuke.nodes.NoOp(name="Connector1", label="PLATE")
+        labelConnectorCore.saveManifest()
+        self.written = fakeNuke.root()[labelConnectorCore.MANIFEST_KNOB].value()
+
+    def tearDown(self):
+        labelConnectorCore.USE_MANIFEST = False
+        labelConnectorCore._manifest = None
+
+    def testManifestIsOnlyWrittenOnSave(self):
+        with labelConnectorCore.BatchEdit():
+            labelConnectorCore.createConnectingNodeAndConnect(self.connector)
+
+        manifest = labelConnectorCore.getManifest()
+        self.assertTrue(manifest.dirty)
+        self.assertEqual(fakeNuke.root()[labelConnectorCore.MANIFEST_KNOB].value(), self.written)
+
+        labelConnectorCore.saveManifest()
+        self.assertFalse(manifest.dirty)
+        self.assertNotEqual(fakeNuke.root()[labelConnectorCore.MANIFEST_KNOB].value(), self.written)
+
+
+if __name__ == "__main__":
+    unittest.main()